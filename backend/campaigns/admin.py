@@ -7,7 +7,7 @@
  */
 """
 
-from django.contrib import admin
+from django.contrib import admin, messages
 
 from .models import (
     Campaign,
@@ -15,8 +15,10 @@ from .models import (
     CampaignShift,
     CampaignStage,
     ShiftAssignment,
+    ShiftWaitlistEntry,
     VolunteerApplication,
 )
+from .services import reconcile_campaign_counters
 
 
 @admin.register(CampaignCategory)
@@ -43,9 +45,23 @@ class CampaignAdmin(admin.ModelAdmin):
     list_display = ("title", "status", "category", "coordinator", "region", "published_at")
     list_filter = ("status", "category", "region")
     search_fields = ("title", "short_description", "coordinator__email")
-    readonly_fields = ("created_at", "updated_at", "published_at", "slug")
+    readonly_fields = (
+        "created_at",
+        "updated_at",
+        "published_at",
+        "slug",
+        "stages_count",
+        "shifts_count",
+        "applications_pending",
+    )
     prepopulated_fields = {"slug": ("title",)}
     inlines = (CampaignStageInline, CampaignShiftInline)
+    actions = ("reconcile_counters",)
+
+    @admin.action(description="Перерахувати лічильники етапів, змін і заявок")
+    def reconcile_counters(self, request, queryset):
+        repaired = reconcile_campaign_counters(campaign_ids=queryset.values_list("pk", flat=True))
+        self.message_user(request, f"Виправлено кампаній: {repaired}", messages.SUCCESS)
 
 
 @admin.register(CampaignStage)
@@ -57,7 +73,7 @@ class CampaignStageAdmin(admin.ModelAdmin):
 
 @admin.register(CampaignShift)
 class CampaignShiftAdmin(admin.ModelAdmin):
-    list_display = ("campaign", "title", "start_at", "end_at", "capacity", "status")
+    list_display = ("campaign", "title", "start_at", "end_at", "capacity", "seats_taken", "status")
     list_filter = ("status", "campaign")
     search_fields = ("campaign__title", "title")
 
@@ -74,3 +90,11 @@ class ShiftAssignmentAdmin(admin.ModelAdmin):
     list_display = ("shift", "volunteer", "status", "created_at")
     list_filter = ("status", "shift__campaign")
     search_fields = ("volunteer__email", "shift__campaign__title")
+
+
+@admin.register(ShiftWaitlistEntry)
+class ShiftWaitlistEntryAdmin(admin.ModelAdmin):
+    list_display = ("shift", "volunteer", "created_at")
+    list_filter = ("shift__campaign",)
+    search_fields = ("volunteer__email", "shift__campaign__title")
+    ordering = ("shift", "id")
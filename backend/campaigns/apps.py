@@ -14,3 +14,6 @@ class CampaignsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'campaigns'
     verbose_name = "Кампанії та залучення волонтерів"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,144 @@
+"""
+/**
+ * @file: autocomplete.py
+ * @description: Автодоповнення назв кампаній: префіксний індекс нормалізованої назви та триграмний індекс для стійкості до описок.
+ * @dependencies: campaigns.models.Campaign, campaigns.models.CampaignTitleTrigram, campaigns.cache, django.core.cache
+ * @created: 2026-10-17
+ */
+"""
+
+import hashlib
+import math
+
+from django.core.cache import cache
+from django.db.models import Count, F
+
+from .cache import list_generation
+from .models import Campaign, CampaignStatus, CampaignTitleTrigram
+from .search import normalize_title
+
+AUTOCOMPLETE_LIMIT = 8
+AUTOCOMPLETE_CACHE_TTL = 60
+MIN_QUERY_LENGTH = 2
+# Частка триграм запиту, яку має містити назва, щоб вважатися збігом з опискою.
+SIMILARITY_THRESHOLD = 0.45
+# Один спільний фрагмент — випадковий збіг, а не описка; коротші запити покриває префікс.
+MIN_TRIGRAM_HITS = 2
+# Триграма, що трапляється в більшій кількості назв, не розрізняє кампанії і не рахується:
+# групуються лише рідкісні триграми, тож вартість обмежена незалежно від віку й кількості кампаній.
+MAX_GRAM_POSTINGS = 500
+# Скільки кандидатів з триграмного індексу перевіряти за статусом кампанії.
+CANDIDATE_POOL = 50
+
+_PREFIX_UPPER_BOUND = "\U0010ffff"
+
+
+def title_trigrams(value: str, *, partial_last_word: bool = False) -> set[str]:
+    """
+    Триграми у стилі pg_trgm: кожне слово доповнюється пробілом на початку і в кінці.
+    Для запиту під час набору останнє слово не закривається пробілом, щоб працював префікс.
+    Триграма з двома ведучими пробілами (лише перша літера) надто неселективна і не індексується.
+    """
+    words = normalize_title(value).split()
+    grams: set[str] = set()
+    for index, word in enumerate(words):
+        is_partial = partial_last_word and index == len(words) - 1
+        padded = f" {word}" if is_partial else f" {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def rebuild_title_trigrams(campaigns) -> None:
+    """Триграми ведуться лише для публічних кампаній: чернетки не займають індекс і не підказуються."""
+    campaigns = list(campaigns)
+    if not campaigns:
+        return
+    CampaignTitleTrigram.objects.filter(campaign__in=[campaign.pk for campaign in campaigns]).delete()
+    CampaignTitleTrigram.objects.bulk_create(
+        [
+            CampaignTitleTrigram(campaign_id=campaign.pk, trigram=gram)
+            for campaign in campaigns
+            if campaign.status != CampaignStatus.DRAFT
+            for gram in title_trigrams(campaign.title)
+        ],
+        batch_size=2000,
+    )
+
+
+def _public_campaigns():
+    return Campaign.objects.exclude(status=CampaignStatus.DRAFT)
+
+
+def _serialize(qs, limit: int) -> list[dict]:
+    return list(
+        qs.values("id", "title", "slug", category_slug=F("category__slug"))[:limit]
+    )
+
+
+def _prefix_matches(normalized: str, limit: int) -> list[dict]:
+    # Діапазон по індексу title_normalized замість LIKE: працює з індексом і на SQLite, і на PostgreSQL.
+    qs = _public_campaigns().filter(
+        title_normalized__gte=normalized,
+        title_normalized__lt=normalized + _PREFIX_UPPER_BOUND,
+    ).order_by("title_normalized")
+    return _serialize(qs, limit)
+
+
+def _rare_grams(grams: set[str]) -> set[str]:
+    """
+    Залишає триграми, що трапляються не більше ніж у MAX_GRAM_POSTINGS назвах. Кожна перевірка —
+    обмежений діапазон індексу (trigram, campaign): OFFSET до порогу, а не підрахунок усіх рядків.
+    """
+    return {
+        gram
+        for gram in grams
+        if not CampaignTitleTrigram.objects.filter(trigram=gram).order_by()[MAX_GRAM_POSTINGS:].exists()
+    }
+
+
+def _trigram_matches(query: str, limit: int, exclude_ids: set[int]) -> list[dict]:
+    grams = _rare_grams(title_trigrams(query, partial_last_word=True))
+    if len(grams) < MIN_TRIGRAM_HITS:
+        return []
+    min_hits = max(MIN_TRIGRAM_HITS, math.ceil(len(grams) * SIMILARITY_THRESHOLD))
+    # GROUP BY лише по рядках рідкісних триграм — не більше len(grams) * MAX_GRAM_POSTINGS рядків.
+    candidates = list(
+        CampaignTitleTrigram.objects.filter(trigram__in=grams)
+        .values("campaign_id")
+        .annotate(hits=Count("id"))
+        .filter(hits__gte=min_hits)
+        .order_by("-hits", "-campaign_id")
+        .values_list("campaign_id", "hits")[:CANDIDATE_POOL]
+    )
+    ranked_ids = [pk for pk, _ in candidates if pk not in exclude_ids]
+    if not ranked_ids:
+        return []
+    rows = {row["id"]: row for row in _serialize(_public_campaigns().filter(id__in=ranked_ids), len(ranked_ids))}
+    return [rows[pk] for pk in ranked_ids if pk in rows][:limit]
+
+
+def find_suggestions(normalized: str, limit: int) -> list[dict]:
+    """Спершу дешевий префікс назви, потім добір нечітких збігів за триграмами (без кешу)."""
+    results = _prefix_matches(normalized, limit)
+    if len(results) < limit:
+        seen = {row["id"] for row in results}
+        results += _trigram_matches(normalized, limit - len(results), seen)
+    return [
+        {"id": row["id"], "title": row["title"], "slug": row["slug"], "category": row["category_slug"]}
+        for row in results
+    ]
+
+
+def autocomplete_campaigns(query: str, limit: int = AUTOCOMPLETE_LIMIT) -> list[dict]:
+    normalized = normalize_title(query)
+    if len(normalized) < MIN_QUERY_LENGTH:
+        return []
+    digest = hashlib.sha1(f"{normalized}:{limit}".encode("utf-8")).hexdigest()
+    # Покоління списків у ключі: перейменована чи знята з публікації кампанія не підказується ще хвилину.
+    cache_key = f"campaigns:autocomplete:{list_generation()}:{digest}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    payload = find_suggestions(normalized, limit)
+    cache.set(cache_key, payload, AUTOCOMPLETE_CACHE_TTL)
+    return payload
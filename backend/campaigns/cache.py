@@ -0,0 +1,140 @@
+"""
+/**
+ * @file: cache.py
+ * @description: Кеш публічних (анонімних) відповідей API кампаній і точкова інвалідація після змін.
+ * @dependencies: django.core.cache, campaigns.models, core.conditional
+ * @created: 2026-10-17
+ */
+"""
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.response import Response
+
+from core.conditional import not_modified
+
+from .models import Campaign
+
+PUBLIC_CACHE_TTL = 300
+CACHE_STATUS_HEADER = "X-Cache"
+# Валідатори умовного GET зберігаються разом із тілом, щоб попадання в кеш віддавало 304 без БД.
+VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+
+# Списки залежать від будь-якої кампанії (категорії), тож інвалідуються зсувом покоління
+# простору ключів, а не переліком ключів; деталі кампаній мають власні ключі за слагом.
+LIST_NAMESPACE = "campaigns:list"
+CATEGORIES_NAMESPACE = "campaigns:categories"
+# Статистика координатора: ключ містить версії кампанії, її змін і заявок (найсвіжіший `updated_at`, кількість),
+# тож застарілий запис просто перестає читатися; TTL лише обмежує сміття в кеші.
+STATS_CACHE_TTL = 60
+# Параметри, які не змінюють відповідь і не повинні дробити кеш.
+IGNORED_PARAMS = frozenset({"format"})
+
+
+def _generation(namespace: str) -> int:
+    key = f"{namespace}:generation"
+    generation = cache.get(key)
+    if generation is None:
+        # Стартове значення з часу: після витіснення лічильника старі сторінки не оживуть.
+        cache.add(key, time.time_ns(), None)
+        generation = cache.get(key)
+    return generation
+
+
+def list_generation() -> int:
+    """Поточне покоління списків: змінюється після будь-якого запису кампанії чи категорії."""
+    return _generation(LIST_NAMESPACE)
+
+
+def normalized_params(request) -> str:
+    params = request.query_params
+    pairs = sorted(
+        (name, value)
+        for name in params
+        if name not in IGNORED_PARAMS
+        for value in params.getlist(name)
+        if value != ""
+    )
+    return "&".join(f"{name}={value}" for name, value in pairs)
+
+
+def collection_cache_key(namespace: str, request) -> str:
+    # Хост входить у ключ, бо посилання next/previous абсолютні.
+    raw = f"{request.get_host()}{request.path}?{normalized_params(request)}"
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    return f"{namespace}:{_generation(namespace)}:{digest}"
+
+
+def detail_cache_key(slug: str) -> str:
+    digest = hashlib.sha1(slug.encode("utf-8")).hexdigest()
+    return f"campaigns:detail:{digest}"
+
+
+def stats_cache_key(campaign_id: int, *versions) -> str:
+    parts = ":".join(
+        version.isoformat() if hasattr(version, "isoformat") else str(version or "") for version in versions
+    )
+    return f"campaigns:stats:{campaign_id}:{parts}"
+
+
+def cached_public_response(request, key: str, build) -> Response:
+    """
+    Віддає збережену відповідь анонімному відвідувачу або будує її та кешує (лише 200 OK).
+    Автентифіковані запити не кешуються: у деталях є поля, залежні від користувача.
+    """
+    if not request.user.is_anonymous:
+        return build()
+    entry = cache.get(key)
+    if entry is not None:
+        data, headers = entry
+        if headers:
+            response = not_modified(request, headers)
+            if response is not None:
+                return response
+        return Response(data, headers={**headers, CACHE_STATUS_HEADER: "HIT"})
+    response = build()
+    if response.status_code == 200:
+        headers = {name: response[name] for name in VALIDATOR_HEADERS if name in response}
+        cache.set(key, (response.data, headers), PUBLIC_CACHE_TTL)
+        response[CACHE_STATUS_HEADER] = "MISS"
+    return response
+
+
+def _on_commit_too(func, *args) -> None:
+    # Одразу — щоб зміни були видні в межах транзакції; після коміту — щоб паралельний
+    # читач не закешував старі дані між першою інвалідацією та фіксацією транзакції.
+    func(*args)
+    transaction.on_commit(lambda: func(*args))
+
+
+def _bump_generation(namespace: str) -> None:
+    try:
+        cache.incr(f"{namespace}:generation")
+    except ValueError:
+        _generation(namespace)
+
+
+def _delete_details(slugs) -> None:
+    cache.delete_many([detail_cache_key(slug) for slug in slugs])
+
+
+def invalidate_campaign_lists() -> None:
+    _on_commit_too(_bump_generation, LIST_NAMESPACE)
+
+
+def invalidate_campaign_details(*slugs: str) -> None:
+    slugs = tuple({slug for slug in slugs if slug})
+    if slugs:
+        _on_commit_too(_delete_details, slugs)
+
+
+def invalidate_campaign_details_by_id(*campaign_ids: int) -> None:
+    slugs = Campaign.objects.filter(pk__in=campaign_ids).values_list("slug", flat=True)
+    invalidate_campaign_details(*slugs)
+
+
+def invalidate_categories() -> None:
+    _on_commit_too(_bump_generation, CATEGORIES_NAMESPACE)
@@ -0,0 +1,135 @@
+"""
+/**
+ * @file: facets.py
+ * @description: Лічильники фасетів (статус, категорія, регіон) для бічної панелі фільтрів: інкрементна таблиця та кешований запасний запит.
+ * @dependencies: campaigns.models.Campaign, campaigns.models.CampaignFacetCount, django.core.cache
+ * @created: 2026-10-17
+ */
+"""
+
+from collections import Counter
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from .models import Campaign, CampaignCategory, CampaignFacetCount, CampaignStatus
+from .regions import canonical_region
+
+FACET_PARAMS = ("status", "category", "region")
+# Поля моделі, з яких складається ключ фасету (update_fields може містити і назву, і attname).
+FACET_FIELDS = frozenset({"status", "category", "category_id", "region"})
+FACET_CACHE_TTL = 60
+
+
+def shift_facet(key: tuple[str, int, str], delta: int) -> None:
+    """Зсуває лічильник рядка (статус, категорія, регіон) одним UPDATE; відсутній рядок створюється."""
+    status, category_id, region = key
+    lookup = {"status": status, "category_id": category_id, "region": region}
+    if CampaignFacetCount.objects.filter(**lookup).update(total=F("total") + delta) or delta <= 0:
+        return
+    try:
+        with transaction.atomic():
+            CampaignFacetCount.objects.create(total=delta, **lookup)
+    except IntegrityError:
+        # Паралельний запит створив рядок першим.
+        CampaignFacetCount.objects.filter(**lookup).update(total=F("total") + delta)
+
+
+def rebuild_campaign_facets() -> int:
+    """Перебудовує таблицю фасетів одним групованим запитом (після bulk-операцій або розбіжностей)."""
+    rows = [
+        CampaignFacetCount(status=status, category_id=category_id, region=region, total=total)
+        for status, category_id, region, total in grouped_facet_rows(Campaign.objects.all())
+    ]
+    with transaction.atomic():
+        CampaignFacetCount.objects.all().delete()
+        CampaignFacetCount.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def grouped_facet_rows(queryset) -> list[tuple[str, int, str, int]]:
+    return list(
+        queryset.order_by()
+        .values("status", "category_id", "region")
+        .annotate(total=Count("id"))
+        .values_list("status", "category_id", "region", "total")
+    )
+
+
+def table_rows() -> list[tuple[str, int, str, int]]:
+    return list(
+        CampaignFacetCount.objects.filter(total__gt=0).values_list("status", "category_id", "region", "total")
+    )
+
+
+def cached_queryset_rows(cache_key: str, queryset) -> list[tuple[str, int, str, int]]:
+    """Для фільтрів поза таблицею (пошук, координатор, радіус) — групований запит із коротким кешем."""
+    rows = cache.get(cache_key)
+    if rows is None:
+        rows = grouped_facet_rows(queryset)
+        cache.set(cache_key, rows, FACET_CACHE_TTL)
+    return rows
+
+
+def build_facets(rows, params) -> dict:
+    """
+    Диз'юнктивні фасети: кожен вимір рахується з фільтрами інших вимірів,
+    тож вибір категорії не обнуляє лічильники сусідніх категорій.
+    """
+    categories = {category.pk: category for category in CampaignCategory.objects.all()}
+    status_param = params.get("status") or None
+    category_param = params.get("category") or None
+    region_param = params.get("region") or None
+    if region_param is not None:
+        region_param = canonical_region(region_param) or region_param.strip()
+
+    def matches(status, category_id, region, skip) -> bool:
+        if skip != "status":
+            if status_param is None and status == CampaignStatus.DRAFT:
+                return False
+            if status_param is not None and status != status_param:
+                return False
+        if skip != "category" and category_param is not None:
+            category = categories.get(category_id)
+            if category is None or category.slug != category_param:
+                return False
+        if skip != "region" and region_param is not None and region != region_param:
+            return False
+        return True
+
+    counts = {name: Counter() for name in FACET_PARAMS}
+    total = 0
+    for status, category_id, region, count in rows:
+        if matches(status, category_id, region, skip=None):
+            total += count
+        if matches(status, category_id, region, skip="status") and (
+            status != CampaignStatus.DRAFT or status_param == CampaignStatus.DRAFT
+        ):
+            counts["status"][status] += count
+        if matches(status, category_id, region, skip="category"):
+            counts["category"][category_id] += count
+        if region and matches(status, category_id, region, skip="region"):
+            counts["region"][region] += count
+
+    labels = dict(CampaignStatus.choices)
+    return {
+        "total": total,
+        "status": _ordered(
+            {"value": value, "label": str(labels.get(value, value)), "count": count}
+            for value, count in counts["status"].items()
+        ),
+        "category": _ordered(
+            {"value": categories[pk].slug, "label": categories[pk].name, "count": count}
+            for pk, count in counts["category"].items()
+            if pk in categories
+        ),
+        "region": _ordered(
+            {"value": value, "label": value, "count": count}
+            for value, count in counts["region"].items()
+        ),
+    }
+
+
+def _ordered(items) -> list[dict]:
+    return sorted((item for item in items if item["count"] > 0), key=lambda item: (-item["count"], item["label"]))
@@ -0,0 +1,83 @@
+"""
+/**
+ * @file: geo.py
+ * @description: Пошук кампаній поблизу: префільтр за bounding box по індексу координат і точна відстань haversine в SQL.
+ * @dependencies: django.db.models.functions (математичні функції працюють і на PostgreSQL, і на SQLite)
+ * @created: 2026-10-17
+ */
+"""
+
+import math
+
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import ASin, Cast, Cos, Power, Radians, Sin, Sqrt
+from rest_framework.exceptions import ValidationError
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+DEFAULT_RADIUS_KM = 25.0
+MAX_RADIUS_KM = 500.0
+
+
+def parse_near(near: str, radius_km: str | None) -> tuple[float, float, float]:
+    """Розбирає `?near=lat,lng&radius_km=`; некоректні значення — 400 з поясненням."""
+    try:
+        lat_raw, lng_raw = near.split(",")
+        lat, lng = float(lat_raw), float(lng_raw)
+    except ValueError:
+        raise ValidationError({"near": "Очікується формат near=широта,довгота."})
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180) or math.isnan(lat) or math.isnan(lng):
+        raise ValidationError({"near": "Координати поза допустимим діапазоном."})
+    try:
+        radius = float(radius_km) if radius_km else DEFAULT_RADIUS_KM
+    except ValueError:
+        raise ValidationError({"radius_km": "Радіус має бути числом у кілометрах."})
+    if not 0 < radius <= MAX_RADIUS_KM:
+        raise ValidationError({"radius_km": f"Радіус має бути від 0 до {MAX_RADIUS_KM:g} км."})
+    return lat, lng, radius
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> Q:
+    """
+    Прямокутник, що гарантовано містить коло радіуса `radius_km`.
+    Діапазон по широті йде по індексу (location_lat, location_lng), довгота — залишковий фільтр.
+    """
+    delta_lat = radius_km / KM_PER_DEGREE_LAT
+    lat_min, lat_max = max(lat - delta_lat, -90.0), min(lat + delta_lat, 90.0)
+    condition = Q(location_lat__gte=lat_min, location_lat__lte=lat_max)
+
+    cos_lat = math.cos(math.radians(max(abs(lat_min), abs(lat_max))))
+    if cos_lat <= 1e-9:
+        # Коло зачіпає полюс — обмежуємо лише широтою.
+        return condition
+    delta_lng = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    if delta_lng >= 180:
+        return condition
+    lng_min, lng_max = lng - delta_lng, lng + delta_lng
+    if lng_min < -180:
+        return condition & (Q(location_lng__gte=lng_min + 360) | Q(location_lng__lte=lng_max))
+    if lng_max > 180:
+        return condition & (Q(location_lng__gte=lng_min) | Q(location_lng__lte=lng_max - 360))
+    return condition & Q(location_lng__gte=lng_min, location_lng__lte=lng_max)
+
+
+def haversine_km(lat: float, lng: float):
+    """Вираз відстані великого кола від точки до координат кампанії, км."""
+    row_lat = Radians(Cast(F("location_lat"), FloatField()))
+    row_lng = Radians(Cast(F("location_lng"), FloatField()))
+    origin_lat = Value(math.radians(lat), output_field=FloatField())
+    origin_lng = Value(math.radians(lng), output_field=FloatField())
+    half_chord = (
+        Power(Sin((row_lat - origin_lat) / 2), 2)
+        + Cos(origin_lat) * Cos(row_lat) * Power(Sin((row_lng - origin_lng) / 2), 2)
+    )
+    return Value(2 * EARTH_RADIUS_KM, output_field=FloatField()) * ASin(Sqrt(half_chord))
+
+
+def nearby_campaigns(qs, lat: float, lng: float, radius_km: float):
+    """Кампанії в радіусі, з анотацією `distance_km`; точну відстань рахує БД лише для рядків з прямокутника."""
+    return (
+        qs.filter(bounding_box(lat, lng, radius_km))
+        .annotate(distance_km=haversine_km(lat, lng))
+        .filter(distance_km__lte=radius_km)
+    )
@@ -0,0 +1,163 @@
+"""
+/**
+ * @file: benchmark_campaigns.py
+ * @description: Django management-команда для вимірювання затримок запитів до кампаній на синтетичних даних.
+ * @dependencies: campaigns.models, campaigns.search, campaigns.geo, campaigns.facets
+ * @created: 2026-10-17
+ */
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from accounts.models import User, UserRole
+from campaigns.autocomplete import find_suggestions, rebuild_title_trigrams
+from campaigns.facets import build_facets, grouped_facet_rows, rebuild_campaign_facets, table_rows
+from campaigns.geo import nearby_campaigns
+from campaigns.models import Campaign, CampaignCategory, CampaignStatus
+from campaigns.search import normalize_title, rebuild_search_index, search_campaigns
+
+WORDS = (
+    "допомога", "дрони", "евакуація", "медикаменти", "генератори", "укриття", "пам'ять",
+    "волонтери", "склад", "логістика", "кухня", "діти", "школа", "лікарня", "транспорт",
+    "одяг", "зима", "ремонт", "вода", "їжа", "турнікети", "автівка", "бригада", "громада",
+)
+SYLLABLES = ("ба", "ве", "гри", "до", "жу", "зо", "ки", "ла", "мо", "ні", "по", "ру", "сі", "та", "ух", "фе", "ця", "ше")
+SEARCH_QUERIES = ("дрони", "евакуація медикаменти", "памʼять", "генерат", "турнікети для бригади")
+AUTOCOMPLETE_QUERIES = ("др", "пам'ят", "евакуцаія", "генератори шко")
+# Точки та радіуси (км) для режиму «поблизу»; координати кампаній — рівномірно в межах України.
+NEAR_QUERIES = (("Київ", 50.4501, 30.5234, 10), ("Львів", 49.8397, 24.0297, 50), ("Харків", 49.9935, 36.2304, 150))
+UKRAINE_BOUNDS = ((44.4, 52.3), (22.2, 40.2))
+
+
+class RollbackBenchmark(Exception):
+    """Відкочує синтетичні дані після вимірювань."""
+
+
+class Command(BaseCommand):
+    help = "Генерує синтетичні кампанії (у транзакції з відкотом) та вимірює затримки запитів"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--campaigns", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.repeat = options["repeat"]
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"▶ Бенчмарк кампаній: {options['campaigns']} записів, {connection.vendor}"
+        ))
+        try:
+            with transaction.atomic():
+                self._generate(options["campaigns"])
+                for name, run in self._scenarios():
+                    self._measure(name, run)
+                raise RollbackBenchmark
+        except RollbackBenchmark:
+            pass
+        self.stdout.write(self.style.SUCCESS("✅ Синтетичні дані відкочено"))
+
+    def _scenarios(self) -> list[tuple[str, Callable[[], object]]]:
+        base = Campaign.objects.exclude(status=CampaignStatus.DRAFT)
+        scenarios: list[tuple[str, Callable[[], object]]] = []
+        for query in SEARCH_QUERIES:
+            scenarios.append((
+                f"search icontains «{query}»",
+                lambda query=query: list(
+                    base.filter(
+                        Q(title__icontains=query)
+                        | Q(short_description__icontains=query)
+                        | Q(description__icontains=query)
+                    ).values_list("id", flat=True)[:20]
+                ),
+            ))
+            scenarios.append((
+                f"search full-text «{query}»",
+                lambda query=query: list(
+                    search_campaigns(base, query)
+                    .order_by("-search_rank", "-published_at")
+                    .values_list("id", flat=True)[:20]
+                ),
+            ))
+        for name, lat, lng, radius in NEAR_QUERIES:
+            scenarios.append((
+                f"near {name} {radius} км (bbox + haversine)",
+                lambda lat=lat, lng=lng, radius=radius: list(
+                    nearby_campaigns(base, lat, lng, radius)
+                    .order_by("distance_km", "id")
+                    .values_list("id", flat=True)[:20]
+                ),
+            ))
+        scenarios.append(("facets з таблиці агрегатів", lambda: build_facets(table_rows(), {})))
+        scenarios.append((
+            "facets груповим запитом (без кешу)",
+            lambda: build_facets(grouped_facet_rows(Campaign.objects.all()), {}),
+        ))
+        for query in AUTOCOMPLETE_QUERIES:
+            scenarios.append((
+                f"autocomplete без кешу «{query}»",
+                lambda query=query: find_suggestions(normalize_title(query), 8),
+            ))
+        return scenarios
+
+    def _generate(self, total: int) -> None:
+        started = time.perf_counter()
+        category = CampaignCategory.objects.create(name=f"Бенчмарк {self.rng.random()}")
+        coordinator = User.objects.create_user(
+            email=f"benchmark-{self.rng.random()}@help.test",
+            password=None,
+            role=UserRole.COORDINATOR,
+        )
+        # Наповнювач із кількох тисяч псевдослів, щоб тематичні слова були рідкісними, як у реальних описах.
+        filler = ["".join(self.rng.choices(SYLLABLES, k=self.rng.randint(2, 4))) for _ in range(5000)]
+        statuses = [value for value in CampaignStatus.values]
+        now = timezone.now()
+        batch: list[Campaign] = []
+        for index in range(total):
+            title = " ".join(self.rng.sample(WORDS, 3)).capitalize()
+            batch.append(Campaign(
+                title=title,
+                title_normalized=normalize_title(title),
+                slug=f"benchmark-{index}",
+                short_description=" ".join(self.rng.choices(filler, k=5) + self.rng.sample(WORDS, 1)),
+                description=" ".join(self.rng.choices(filler, k=120) + self.rng.sample(WORDS, 2)),
+                status=self.rng.choice(statuses),
+                category=category,
+                coordinator=coordinator,
+                location_name="Київ",
+                location_lat=round(self.rng.uniform(*UKRAINE_BOUNDS[0]), 6),
+                location_lng=round(self.rng.uniform(*UKRAINE_BOUNDS[1]), 6),
+                region="Київська область",
+                published_at=now,
+            ))
+            if len(batch) >= 5000:
+                rebuild_title_trigrams(Campaign.objects.bulk_create(batch))
+                batch = []
+        if batch:
+            rebuild_title_trigrams(Campaign.objects.bulk_create(batch))
+        rebuild_search_index()
+        rebuild_campaign_facets()
+        self.stdout.write(f"  • дані згенеровано за {time.perf_counter() - started:.1f} с")
+
+    def _measure(self, name: str, run: Callable[[], object]) -> None:
+        run()  # прогрів кешу сторінок БД
+        timings = []
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            run()
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(
+            f"  • {name:<45} p50={statistics.median(timings):8.2f} мс  p95={p95:8.2f} мс"
+        )
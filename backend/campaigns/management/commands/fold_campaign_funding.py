@@ -0,0 +1,24 @@
+"""
+/**
+ * @file: fold_campaign_funding.py
+ * @description: Django management-команда для періодичного згортання шардів лічильника внесків у current_amount.
+ * @dependencies: campaigns.services.fold_campaign_funding
+ * @created: 2026-10-17
+ */
+"""
+
+from django.core.management.base import BaseCommand
+
+from campaigns.services import fold_campaign_funding
+
+
+class Command(BaseCommand):
+    help = "Переносить незгорнуті суми шардів лічильника внесків у current_amount кампаній"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--campaign", type=int, action="append", dest="campaign_ids")
+
+    def handle(self, *args, **options):
+        folded = fold_campaign_funding(campaign_ids=options["campaign_ids"], batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"✅ Згорнуто внески у {folded} кампаніях"))
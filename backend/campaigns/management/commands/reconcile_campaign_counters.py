@@ -0,0 +1,45 @@
+"""
+/**
+ * @file: reconcile_campaign_counters.py
+ * @description: Django management-команда для виправлення розбіжностей денормалізованих лічильників кампаній, зайнятих місць на змінах і фасетів.
+ * @dependencies: campaigns.services.reconcile_campaign_counters, campaigns.services.recount_shift_seats, campaigns.facets.rebuild_campaign_facets
+ * @created: 2026-10-17
+ */
+"""
+
+from django.core.management.base import BaseCommand
+
+from campaigns.facets import rebuild_campaign_facets
+from campaigns.models import CampaignShift
+from campaigns.services import reconcile_campaign_counters, recount_shift_seats
+
+
+class Command(BaseCommand):
+    help = (
+        "Перераховує stages_count, shifts_count та applications_pending для кампаній пачками, "
+        "seats_taken для змін і перебудовує таблицю фасетів"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--campaign", type=int, action="append", dest="campaign_ids")
+        parser.add_argument("--skip-facets", action="store_true")
+
+    def handle(self, *args, **options):
+        repaired = reconcile_campaign_counters(
+            campaign_ids=options["campaign_ids"],
+            batch_size=options["batch_size"],
+        )
+        if repaired:
+            self.stdout.write(self.style.WARNING(f"⚠ Виправлено лічильники у {repaired} кампаніях"))
+        else:
+            self.stdout.write(self.style.SUCCESS("✅ Розбіжностей не знайдено"))
+        shifts = CampaignShift.objects.all()
+        if options["campaign_ids"]:
+            shifts = shifts.filter(campaign_id__in=options["campaign_ids"])
+        seats = recount_shift_seats(shifts.values("pk"))
+        if seats:
+            self.stdout.write(self.style.WARNING(f"⚠ Виправлено зайняті місця у {seats} змінах"))
+        if not options["skip_facets"]:
+            rows = rebuild_campaign_facets()
+            self.stdout.write(f"  • таблицю фасетів перебудовано: {rows} рядків")
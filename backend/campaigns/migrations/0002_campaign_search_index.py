@@ -0,0 +1,80 @@
+# Generated by Django 5.1.2 on 2026-10-17 10:00
+
+from django.db import migrations
+
+# Знімок SQL із campaigns.search на момент міграції: подальші зміни модуля не повинні змінювати історію.
+APOSTROPHES = "'’ʼ‘`´"
+CAMPAIGN_TABLE = "campaigns_campaign"
+SQLITE_FTS_TABLE = "campaigns_campaign_fts"
+POSTGRES_INDEX_NAME = "campaigns_campaign_search_idx"
+POSTGRES_VECTOR_COLUMN = "search_vector"
+SEARCH_COLUMNS = (("title", "A"), ("short_description", "B"), ("description", "C"))
+
+
+def _postgres_strip_apostrophes(column):
+    chars = APOSTROPHES.replace("'", "''")
+    return f"translate(coalesce({column}, ''), '{chars}', '')"
+
+
+def _sqlite_normalized_column(column):
+    expression = column
+    for char in APOSTROPHES:
+        escaped = char.replace("'", "''")
+        expression = f"replace({expression}, '{escaped}', '')"
+    return f"lower({expression})"
+
+
+def postgres_create_index_sql():
+    document = " || ".join(
+        f"setweight(to_tsvector('simple'::regconfig, {_postgres_strip_apostrophes(column)}), '{weight}')"
+        for column, weight in SEARCH_COLUMNS
+    )
+    return [
+        f"ALTER TABLE {CAMPAIGN_TABLE} ADD COLUMN IF NOT EXISTS {POSTGRES_VECTOR_COLUMN} tsvector "
+        f"GENERATED ALWAYS AS ({document}) STORED",
+        f"CREATE INDEX IF NOT EXISTS {POSTGRES_INDEX_NAME} ON {CAMPAIGN_TABLE} "
+        f"USING GIN ({POSTGRES_VECTOR_COLUMN})",
+    ]
+
+
+def sqlite_create_index_sql():
+    columns = ", ".join(column for column, _ in SEARCH_COLUMNS)
+    normalized = ", ".join(_sqlite_normalized_column(column) for column, _ in SEARCH_COLUMNS)
+    # remove_diacritics 0: інакше unicode61 зводить «й» до «и» та «ї» до «і».
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+        f"{columns}, tokenize = 'unicode61 remove_diacritics 0')",
+        f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, {columns}) SELECT id, {normalized} FROM {CAMPAIGN_TABLE}",
+    ]
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        statements = postgres_create_index_sql()
+    elif vendor == "sqlite":
+        statements = sqlite_create_index_sql()
+    else:
+        return
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {POSTGRES_INDEX_NAME}")
+        schema_editor.execute(f"ALTER TABLE {CAMPAIGN_TABLE} DROP COLUMN IF EXISTS {POSTGRES_VECTOR_COLUMN}")
+    elif vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 5.1.2 on 2026-10-17 21:52
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Знімок нормалізації з campaigns.search і триграм з campaigns.autocomplete на момент міграції.
+APOSTROPHES = "'’ʼ‘`´"
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_title(value):
+    value = (value or "").lower()
+    for char in APOSTROPHES:
+        value = value.replace(char, "")
+    return " ".join(TOKEN_RE.findall(value))
+
+
+def title_trigrams(value):
+    grams = set()
+    for word in normalize_title(value).split():
+        padded = f" {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def backfill_autocomplete_index(apps, schema_editor):
+    Campaign = apps.get_model("campaigns", "Campaign")
+    CampaignTitleTrigram = apps.get_model("campaigns", "CampaignTitleTrigram")
+    trigrams = []
+    for campaign in Campaign.objects.only("id", "title").iterator(chunk_size=2000):
+        Campaign.objects.filter(pk=campaign.pk).update(
+            title_normalized=normalize_title(campaign.title)[:255]
+        )
+        trigrams.extend(
+            CampaignTitleTrigram(campaign_id=campaign.pk, trigram=gram)
+            for gram in title_trigrams(campaign.title)
+        )
+    CampaignTitleTrigram.objects.bulk_create(trigrams, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0002_campaign_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campaign",
+            name="title_normalized",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="Для префіксного автодоповнення: нижній регістр, без апострофів і пунктуації.",
+                max_length=255,
+                verbose_name="Нормалізована назва",
+            ),
+        ),
+        migrations.CreateModel(
+            name="CampaignTitleTrigram",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("trigram", models.CharField(max_length=3, verbose_name="Триграма")),
+                (
+                    "campaign",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="title_trigrams",
+                        to="campaigns.campaign",
+                        verbose_name="Кампанія",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Триграма назви кампанії",
+                "verbose_name_plural": "Триграми назв кампаній",
+                "indexes": [
+                    models.Index(
+                        fields=["trigram", "campaign"],
+                        name="campaigns_c_trigram_9bc714_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_autocomplete_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.2 on 2026-10-17 21:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0003_campaign_autocomplete_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="campaign",
+            index=models.Index(
+                fields=["-published_at", "-created_at", "-id"],
+                name="campaign_feed_keyset_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="volunteerapplication",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="application_keyset_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.1.2 on 2026-10-17 21:59
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Campaign = apps.get_model("campaigns", "Campaign")
+    CampaignStage = apps.get_model("campaigns", "CampaignStage")
+    CampaignShift = apps.get_model("campaigns", "CampaignShift")
+    VolunteerApplication = apps.get_model("campaigns", "VolunteerApplication")
+
+    def counted(queryset):
+        subquery = (
+            queryset.filter(campaign=OuterRef("pk"))
+            .order_by()
+            .values("campaign")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        return Coalesce(Subquery(subquery, output_field=IntegerField()), 0)
+
+    Campaign.objects.update(
+        stages_count=counted(CampaignStage.objects.all()),
+        shifts_count=counted(CampaignShift.objects.all()),
+        applications_pending=counted(VolunteerApplication.objects.filter(status="pending")),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0004_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campaign",
+            name="applications_pending",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Заявки, що очікують"
+            ),
+        ),
+        migrations.AddField(
+            model_name="campaign",
+            name="shifts_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Кількість змін"
+            ),
+        ),
+        migrations.AddField(
+            model_name="campaign",
+            name="stages_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Кількість етапів"
+            ),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
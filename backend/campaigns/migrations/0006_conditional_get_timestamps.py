@@ -0,0 +1,27 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0005_campaign_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campaigncategory",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, verbose_name="Оновлено"),
+        ),
+        migrations.AddField(
+            model_name="campaignshift",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                help_text="Оновлюється й при зміні зайнятості місць — валідатор для умовних GET.",
+                verbose_name="Оновлено",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0006_conditional_get_timestamps"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="campaign",
+            index=models.Index(
+                fields=["location_lat", "location_lng"], name="campaign_location_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_facet_counts(apps, schema_editor):
+    Campaign = apps.get_model("campaigns", "Campaign")
+    CampaignFacetCount = apps.get_model("campaigns", "CampaignFacetCount")
+    rows = (
+        Campaign.objects.order_by()
+        .values("status", "category_id", "region")
+        .annotate(total=models.Count("id"))
+    )
+    CampaignFacetCount.objects.bulk_create(
+        [CampaignFacetCount(**row) for row in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0007_campaign_location_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CampaignFacetCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("draft", "Чернетка"),
+                            ("published", "Опубліковано"),
+                            ("in_progress", "У процесі"),
+                            ("completed", "Завершено"),
+                            ("cancelled", "Скасовано"),
+                        ],
+                        max_length=20,
+                        verbose_name="Статус",
+                    ),
+                ),
+                (
+                    "region",
+                    models.CharField(
+                        blank=True, max_length=120, verbose_name="Область/регіон"
+                    ),
+                ),
+                (
+                    "total",
+                    models.IntegerField(default=0, verbose_name="Кількість кампаній"),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="campaigns.campaigncategory",
+                        verbose_name="Категорія",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Лічильник фасету кампаній",
+                "verbose_name_plural": "Лічильники фасетів кампаній",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("status", "category", "region"),
+                        name="campaign_facet_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_facet_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,162 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:18
+
+import re
+
+from django.db import migrations, models
+
+# Знімок довідника й зведення регіонів з campaigns.regions на момент міграції:
+# подальші правки синонімів не повинні змінювати результат уже застосованої історії.
+APOSTROPHES = "'’ʼ‘`´"
+KYIV_CITY = "м. Київ"
+SEVASTOPOL_CITY = "м. Севастополь"
+CRIMEA = "Автономна Республіка Крим"
+
+_OBLASTS = {
+    "Вінницька область": ("vinnytsia", "vinnytska", "vinnitsa", "вінниччина", "вінниця"),
+    "Волинська область": ("volyn", "volynska", "volhynia", "волинь", "луцьк", "lutsk"),
+    "Дніпропетровська область": (
+        "dnipropetrovsk", "dnipropetrovska", "dnipro", "дніпропетровщина", "дніпро", "дніпровська",
+    ),
+    "Донецька область": ("donetsk", "donetska", "донеччина", "донбас", "донецьк"),
+    "Житомирська область": ("zhytomyr", "zhytomyrska", "zhitomir", "житомирщина", "житомир"),
+    "Закарпатська область": ("zakarpattia", "zakarpatska", "transcarpathia", "закарпаття", "ужгород", "uzhhorod"),
+    "Запорізька область": ("zaporizhzhia", "zaporizka", "zaporizhia", "zaporozhye", "запоріжжя"),
+    "Івано-Франківська область": (
+        "ivano frankivsk", "ivano frankivska", "прикарпаття", "франківщина", "івано франківськ",
+    ),
+    "Київська область": ("kyivska", "kievska", "київщина"),
+    "Кіровоградська область": (
+        "kirovohrad", "kirovohradska", "kropyvnytskyi", "кіровоградщина", "кропивницький",
+    ),
+    "Луганська область": ("luhansk", "luhanska", "lugansk", "луганщина", "луганськ"),
+    "Львівська область": ("lviv", "lvivska", "lvov", "львівщина", "львів"),
+    "Миколаївська область": ("mykolaiv", "mykolaivska", "nikolaev", "миколаївщина", "миколаїв"),
+    "Одеська область": ("odesa", "odeska", "odessa", "одещина", "одеса"),
+    "Полтавська область": ("poltava", "poltavska", "полтавщина", "полтава"),
+    "Рівненська область": ("rivne", "rivnenska", "рівненщина", "рівне"),
+    "Сумська область": ("sumy", "sumska", "сумщина", "суми"),
+    "Тернопільська область": ("ternopil", "ternopilska", "тернопільщина", "тернопіль"),
+    "Харківська область": ("kharkiv", "kharkivska", "kharkov", "харківщина", "харків"),
+    "Херсонська область": ("kherson", "khersonska", "херсонщина", "херсон"),
+    "Хмельницька область": ("khmelnytskyi", "khmelnytska", "хмельниччина", "поділля", "хмельницький"),
+    "Черкаська область": ("cherkasy", "cherkaska", "черкащина", "черкаси"),
+    "Чернівецька область": ("chernivtsi", "chernivetska", "буковина", "чернівці"),
+    "Чернігівська область": ("chernihiv", "chernihivska", "чернігівщина", "чернігів"),
+    CRIMEA: ("арк", "ар крим", "крим", "crimea", "ar crimea", "autonomous republic of crimea", "республіка крим"),
+    KYIV_CITY: ("київ", "kyiv", "kiev", "kyiv city", "місто київ"),
+    SEVASTOPOL_CITY: ("севастополь", "sevastopol", "місто севастополь"),
+}
+
+# Службові слова, що не розрізняють регіони: «обл.», «oblast», «region», «м.» тощо.
+_MARKERS = frozenset({"область", "обл", "oblast", "obl", "region", "регіон", "м", "місто", "city"})
+_OBLAST_MARKERS = frozenset({"область", "обл", "oblast", "obl", "region", "регіон"})
+_CITIES = frozenset({KYIV_CITY, SEVASTOPOL_CITY})
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def _tokens(value):
+    value = (value or "").lower()
+    for char in APOSTROPHES:
+        value = value.replace(char, "")
+    return _TOKEN_RE.findall(value)
+
+
+def _key(tokens):
+    return " ".join(token for token in tokens if token not in _MARKERS)
+
+
+def _build_aliases():
+    aliases = {}
+    for name, extra in _OBLASTS.items():
+        for alias in (name, *extra):
+            key = _key(_tokens(alias))
+            if key:
+                aliases.setdefault(key, name)
+    return aliases
+
+
+_ALIASES = _build_aliases()
+# «Київ»/«Kyiv» разом зі словом «область» означає Київську область, а не місто.
+_CITY_TO_OBLAST = {KYIV_CITY: "Київська область", SEVASTOPOL_CITY: CRIMEA}
+
+
+def normalize_region(value):
+    value = (value or "").strip()
+    if not value:
+        return ""
+    tokens = _tokens(value)
+    name = _ALIASES.get(_key(tokens))
+    if name in _CITIES and _OBLAST_MARKERS.intersection(tokens):
+        name = _CITY_TO_OBLAST[name]
+    return name or value
+
+
+def normalize_existing_regions(apps, schema_editor):
+    Campaign = apps.get_model("campaigns", "Campaign")
+    CampaignFacetCount = apps.get_model("campaigns", "CampaignFacetCount")
+    # Різних написань значно менше, ніж рядків: оновлюємо групами за вихідним значенням.
+    for raw in list(Campaign.objects.order_by().values_list("region", flat=True).distinct()):
+        canonical = normalize_region(raw)
+        if canonical != raw:
+            Campaign.objects.filter(region=raw).update(region=canonical)
+
+    CampaignFacetCount.objects.all().delete()
+    rows = (
+        Campaign.objects.order_by()
+        .values("status", "category_id", "region")
+        .annotate(total=models.Count("id"))
+    )
+    CampaignFacetCount.objects.bulk_create(
+        [CampaignFacetCount(**row) for row in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0008_campaign_facet_counts"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="campaign",
+            name="region",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("Вінницька область", "Вінницька область"),
+                    ("Волинська область", "Волинська область"),
+                    ("Дніпропетровська область", "Дніпропетровська область"),
+                    ("Донецька область", "Донецька область"),
+                    ("Житомирська область", "Житомирська область"),
+                    ("Закарпатська область", "Закарпатська область"),
+                    ("Запорізька область", "Запорізька область"),
+                    ("Івано-Франківська область", "Івано-Франківська область"),
+                    ("Київська область", "Київська область"),
+                    ("Кіровоградська область", "Кіровоградська область"),
+                    ("Луганська область", "Луганська область"),
+                    ("Львівська область", "Львівська область"),
+                    ("Миколаївська область", "Миколаївська область"),
+                    ("Одеська область", "Одеська область"),
+                    ("Полтавська область", "Полтавська область"),
+                    ("Рівненська область", "Рівненська область"),
+                    ("Сумська область", "Сумська область"),
+                    ("Тернопільська область", "Тернопільська область"),
+                    ("Харківська область", "Харківська область"),
+                    ("Херсонська область", "Херсонська область"),
+                    ("Хмельницька область", "Хмельницька область"),
+                    ("Черкаська область", "Черкаська область"),
+                    ("Чернівецька область", "Чернівецька область"),
+                    ("Чернігівська область", "Чернігівська область"),
+                    ("Автономна Республіка Крим", "Автономна Республіка Крим"),
+                    ("м. Київ", "м. Київ"),
+                    ("м. Севастополь", "м. Севастополь"),
+                ],
+                help_text="Канонічна назва області; синоніми зводяться до неї під час збереження.",
+                max_length=120,
+                verbose_name="Область/регіон",
+            ),
+        ),
+        migrations.RunPython(normalize_existing_regions, migrations.RunPython.noop),
+    ]
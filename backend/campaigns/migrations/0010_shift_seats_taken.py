@@ -0,0 +1,41 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:21
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_seats_taken(apps, schema_editor):
+    CampaignShift = apps.get_model("campaigns", "CampaignShift")
+    ShiftAssignment = apps.get_model("campaigns", "ShiftAssignment")
+    approved = (
+        ShiftAssignment.objects.filter(shift=OuterRef("pk"), status="approved")
+        .order_by()
+        .values("shift")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    CampaignShift.objects.update(
+        seats_taken=Coalesce(Subquery(approved, output_field=IntegerField()), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0009_normalize_campaign_regions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campaignshift",
+            name="seats_taken",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Підтверджені записи; змінюється лише захищеним UPDATE під час запису та виходу.",
+                verbose_name="Зайнято місць",
+            ),
+        ),
+        migrations.RunPython(backfill_seats_taken, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0010_shift_seats_taken"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShiftWaitlistEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Створено"),
+                ),
+                (
+                    "shift",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="waitlist",
+                        to="campaigns.campaignshift",
+                        verbose_name="Зміна",
+                    ),
+                ),
+                (
+                    "volunteer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="shift_waitlist",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Волонтер",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Місце в черзі на зміну",
+                "verbose_name_plural": "Черга очікування на зміни",
+                "ordering": ("id",),
+                "indexes": [
+                    models.Index(fields=["shift", "id"], name="shift_waitlist_fifo_idx")
+                ],
+                "unique_together": {("shift", "volunteer")},
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:48
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_shift_interval(apps, schema_editor):
+    CampaignShift = apps.get_model("campaigns", "CampaignShift")
+    ShiftAssignment = apps.get_model("campaigns", "ShiftAssignment")
+    shift = CampaignShift.objects.filter(pk=OuterRef("shift_id"))
+    ShiftAssignment.objects.update(
+        shift_start_at=Subquery(shift.values("start_at")[:1]),
+        shift_end_at=Subquery(shift.values("end_at")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0011_shift_waitlist"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="shiftassignment",
+            name="shift_start_at",
+            field=models.DateTimeField(null=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="shiftassignment",
+            name="shift_end_at",
+            field=models.DateTimeField(null=True, editable=False),
+        ),
+        migrations.RunPython(backfill_shift_interval, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="shiftassignment",
+            name="shift_start_at",
+            field=models.DateTimeField(
+                editable=False,
+                help_text="Копія часу зміни: перевірка перетинів — один запит по індексу волонтера.",
+                verbose_name="Початок зміни",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="shiftassignment",
+            name="shift_end_at",
+            field=models.DateTimeField(editable=False, verbose_name="Завершення зміни"),
+        ),
+        migrations.AddIndex(
+            model_name="shiftassignment",
+            index=models.Index(
+                fields=["volunteer", "shift_start_at", "shift_end_at"],
+                name="assignment_volunteer_time_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0012_assignment_shift_interval"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="volunteerapplication",
+            index=models.Index(
+                fields=["campaign", "-created_at", "-id"],
+                name="application_campaign_idx",
+            ),
+        ),
+    ]
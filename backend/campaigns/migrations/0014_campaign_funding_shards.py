@@ -0,0 +1,61 @@
+# Generated by Django 5.1.2 on 2026-10-17 23:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0013_application_campaign_keyset_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CampaignFundingShard",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("slot", models.PositiveSmallIntegerField(verbose_name="Слот")),
+                (
+                    "amount",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="Незгорнута сума",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Оновлено"),
+                ),
+                (
+                    "campaign",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="funding_shards",
+                        to="campaigns.campaign",
+                        verbose_name="Кампанія",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Шард лічильника внесків",
+                "verbose_name_plural": "Шарди лічильника внесків",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("campaign", "slot"),
+                        name="campaign_funding_shard_unique",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0014_campaign_funding_shards"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campaignstage",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now, verbose_name="Оновлено"
+            ),
+            preserve_default=False,
+        ),
+    ]
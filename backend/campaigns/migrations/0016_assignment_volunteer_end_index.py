@@ -0,0 +1,24 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0015_stage_updated_at"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="shiftassignment",
+            name="assignment_volunteer_time_idx",
+        ),
+        migrations.AddIndex(
+            model_name="shiftassignment",
+            index=models.Index(
+                fields=["volunteer", "shift_end_at", "shift_start_at"],
+                name="assignment_volunteer_end_idx",
+            ),
+        ),
+    ]
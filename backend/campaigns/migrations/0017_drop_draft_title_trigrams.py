@@ -0,0 +1,20 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:05
+
+from django.db import migrations
+
+
+def drop_draft_trigrams(apps, schema_editor):
+    CampaignTitleTrigram = apps.get_model("campaigns", "CampaignTitleTrigram")
+    # Автодоповнення показує лише публічні кампанії — триграми чернеток лише займали індекс.
+    CampaignTitleTrigram.objects.filter(campaign__status="draft").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0016_assignment_volunteer_end_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_draft_trigrams, migrations.RunPython.noop),
+    ]
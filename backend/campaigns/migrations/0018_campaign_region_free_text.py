@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0017_drop_draft_title_trigrams"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="campaign",
+            name="region",
+            field=models.CharField(
+                blank=True,
+                help_text="Синоніми області зводяться до канонічної назви під час збереження; нерозпізнане значення зберігається як є.",
+                max_length=120,
+                verbose_name="Область/регіон",
+            ),
+        ),
+    ]
@@ -10,11 +10,14 @@
 import uuid
 
 from django.conf import settings
-from django.db import models
+from django.db import models, router, transaction
 from django.utils import timezone
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
+from .regions import normalize_region
+from .search import normalize_title
+
 User = settings.AUTH_USER_MODEL
 
 
@@ -40,10 +43,23 @@ class ShiftStatus(models.TextChoices):
     CANCELLED = "cancelled", _("Скасовано")
 
 
+class AtomicSaveModel(models.Model):
+    """Зберігає запис разом з обробниками post_save (лічильники кампанії) в одній транзакції."""
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+
+
 class CampaignCategory(models.Model):
     name = models.CharField(_("Назва"), max_length=120, unique=True)
     slug = models.SlugField(_("Слаг"), max_length=140, unique=True, blank=True)
     description = models.TextField(_("Опис"), blank=True)
+    updated_at = models.DateTimeField(_("Оновлено"), auto_now=True)
 
     class Meta:
         verbose_name = _("Категорія кампанії")
@@ -61,6 +77,14 @@ class CampaignCategory(models.Model):
 
 class Campaign(models.Model):
     title = models.CharField(_("Назва"), max_length=255)
+    title_normalized = models.CharField(
+        _("Нормалізована назва"),
+        max_length=255,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text=_("Для префіксного автодоповнення: нижній регістр, без апострофів і пунктуації."),
+    )
     slug = models.SlugField(_("Слаг"), max_length=255, unique=True, blank=True)
     short_description = models.CharField(_("Короткий опис"), max_length=280)
     description = models.TextField(_("Повний опис"))
@@ -98,7 +122,14 @@ class Campaign(models.Model):
         null=True,
         blank=True,
     )
-    region = models.CharField(_("Область/регіон"), max_length=120, blank=True)
+    region = models.CharField(
+        _("Область/регіон"),
+        max_length=120,
+        blank=True,
+        help_text=_(
+            "Синоніми області зводяться до канонічної назви під час збереження; нерозпізнане значення зберігається як є."
+        ),
+    )
     target_amount = models.DecimalField(
         _("Цільова сума"),
         max_digits=12,
@@ -117,6 +148,13 @@ class Campaign(models.Model):
         _("Необхідна кількість волонтерів"),
         default=0,
     )
+    stages_count = models.PositiveIntegerField(_("Кількість етапів"), default=0, editable=False)
+    shifts_count = models.PositiveIntegerField(_("Кількість змін"), default=0, editable=False)
+    applications_pending = models.PositiveIntegerField(
+        _("Заявки, що очікують"),
+        default=0,
+        editable=False,
+    )
     start_date = models.DateField(_("Дата початку"), null=True, blank=True)
     end_date = models.DateField(_("Дата завершення"), null=True, blank=True)
     contact_email = models.EmailField(_("Контактний email"), blank=True)
@@ -132,12 +170,19 @@ class Campaign(models.Model):
         indexes = [
             models.Index(fields=("status", "category", "region")),
             models.Index(fields=("slug",)),
+            models.Index(fields=("-published_at", "-created_at", "-id"), name="campaign_feed_keyset_idx"),
+            models.Index(fields=("location_lat", "location_lng"), name="campaign_location_idx"),
         ]
 
     def __str__(self) -> str:
         return self.title
 
     def save(self, *args, **kwargs):
+        self.title_normalized = normalize_title(self.title)[:255]
+        self.region = normalize_region(self.region)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "title" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "title_normalized"}
         if not self.slug:
             base_slug = slugify(self.title, allow_unicode=True)[:240]
             if not base_slug:
@@ -152,8 +197,103 @@ class Campaign(models.Model):
             self.published_at = timezone.now()
         super().save(*args, **kwargs)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Слаг на момент завантаження — щоб після його зміни інвалідувати кеш за старою адресою.
+        if "slug" in instance.__dict__:
+            instance._loaded_slug = instance.slug
+        # Координати фасету на момент завантаження — щоб сигнал переносив лічильник між рядками.
+        if all(name in instance.__dict__ for name in ("status", "category_id", "region")):
+            instance._loaded_facet = instance.facet_key
+        return instance
+
+    @property
+    def facet_key(self) -> tuple[str, int, str]:
+        return self.status, self.category_id, self.region
+
+    @property
+    def funded_amount(self):
+        """Зібрана сума: згорнуте `current_amount` плюс ще не згорнуті шарди лічильника внесків."""
+        unfolded = getattr(self, "unfolded_funding", None)
+        if unfolded is None:
+            unfolded = self.funding_shards.aggregate(total=models.Sum("amount"))["total"]
+        return self.current_amount + (unfolded or 0)
+
+
+class CampaignFacetCount(models.Model):
+    """Інкрементний агрегат для бічної панелі фільтрів: кількість кампаній на (статус, категорія, регіон)."""
+
+    status = models.CharField(_("Статус"), max_length=20, choices=CampaignStatus.choices)
+    category = models.ForeignKey(
+        CampaignCategory,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("Категорія"),
+    )
+    region = models.CharField(_("Область/регіон"), max_length=120, blank=True)
+    total = models.IntegerField(_("Кількість кампаній"), default=0)
+
+    class Meta:
+        verbose_name = _("Лічильник фасету кампаній")
+        verbose_name_plural = _("Лічильники фасетів кампаній")
+        constraints = [
+            models.UniqueConstraint(fields=("status", "category", "region"), name="campaign_facet_unique"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.status} / {self.category_id} / {self.region}: {self.total}"
+
+
+class CampaignFundingShard(models.Model):
+    """
+    Слот шардованого лічильника внесків: успішна пожертва інкрементує випадковий слот,
+    а не рядок кампанії, тож паралельні підтвердження не блокують одне одного й редагування кампанії.
+    Періодичне згортання переносить суми слотів у `Campaign.current_amount`.
+    """
 
-class CampaignStage(models.Model):
+    campaign = models.ForeignKey(
+        Campaign,
+        on_delete=models.CASCADE,
+        related_name="funding_shards",
+        verbose_name=_("Кампанія"),
+    )
+    slot = models.PositiveSmallIntegerField(_("Слот"))
+    amount = models.DecimalField(_("Незгорнута сума"), max_digits=14, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(_("Оновлено"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("Шард лічильника внесків")
+        verbose_name_plural = _("Шарди лічильника внесків")
+        constraints = [
+            models.UniqueConstraint(fields=("campaign", "slot"), name="campaign_funding_shard_unique"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.campaign_id} / {self.slot}: {self.amount}"
+
+
+class CampaignTitleTrigram(models.Model):
+    campaign = models.ForeignKey(
+        Campaign,
+        on_delete=models.CASCADE,
+        related_name="title_trigrams",
+        verbose_name=_("Кампанія"),
+    )
+    trigram = models.CharField(_("Триграма"), max_length=3)
+
+    class Meta:
+        verbose_name = _("Триграма назви кампанії")
+        verbose_name_plural = _("Триграми назв кампаній")
+        indexes = [
+            models.Index(fields=("trigram", "campaign")),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.campaign_id} · {self.trigram!r}"
+
+
+class CampaignStage(AtomicSaveModel):
     campaign = models.ForeignKey(
         Campaign,
         on_delete=models.CASCADE,
@@ -165,6 +305,7 @@ class CampaignStage(models.Model):
     order = models.PositiveIntegerField(_("Порядок"), default=1)
     is_completed = models.BooleanField(_("Етап виконано"), default=False)
     due_date = models.DateField(_("Очікувана дата завершення"), null=True, blank=True)
+    updated_at = models.DateTimeField(_("Оновлено"), auto_now=True)
 
     class Meta:
         verbose_name = _("Етап кампанії")
@@ -175,7 +316,7 @@ class CampaignStage(models.Model):
         return f"{self.campaign.title} · {self.title}"
 
 
-class CampaignShift(models.Model):
+class CampaignShift(AtomicSaveModel):
     campaign = models.ForeignKey(
         Campaign,
         on_delete=models.CASCADE,
@@ -187,6 +328,12 @@ class CampaignShift(models.Model):
     start_at = models.DateTimeField(_("Початок зміни"))
     end_at = models.DateTimeField(_("Завершення зміни"))
     capacity = models.PositiveIntegerField(_("Кількість місць"), default=1)
+    seats_taken = models.PositiveIntegerField(
+        _("Зайнято місць"),
+        default=0,
+        editable=False,
+        help_text=_("Підтверджені записи; змінюється лише захищеним UPDATE під час запису та виходу."),
+    )
     status = models.CharField(
         _("Статус"),
         max_length=20,
@@ -196,6 +343,11 @@ class CampaignShift(models.Model):
     location_details = models.CharField(_("Деталі локації"), max_length=255, blank=True)
     instructions = models.TextField(_("Інструкції для волонтерів"), blank=True)
     created_at = models.DateTimeField(_("Створено"), auto_now_add=True)
+    updated_at = models.DateTimeField(
+        _("Оновлено"),
+        auto_now=True,
+        help_text=_("Оновлюється й при зміні зайнятості місць — валідатор для умовних GET."),
+    )
 
     class Meta:
         verbose_name = _("Зміна")
@@ -208,12 +360,48 @@ class CampaignShift(models.Model):
     def __str__(self) -> str:
         return f"{self.campaign.title} · {self.start_at:%Y-%m-%d %H:%M}"
 
-    @property
-    def occupied_spots(self) -> int:
-        return self.assignments.filter(status=ApplicationStatus.APPROVED).count()
+    def save(self, *args, **kwargs):
+        # Місця змінюють лише захищені UPDATE: повне збереження не перезаписує лічильник застарілим значенням.
+        if not self._state.adding and kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "seats_taken"
+            ]
+        super().save(*args, **kwargs)
+
 
+class ShiftWaitlistEntry(models.Model):
+    """Черга очікування на заповнену зміну; порядок FIFO задає автоінкрементний id."""
 
-class VolunteerApplication(models.Model):
+    shift = models.ForeignKey(
+        CampaignShift,
+        on_delete=models.CASCADE,
+        related_name="waitlist",
+        verbose_name=_("Зміна"),
+    )
+    volunteer = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="shift_waitlist",
+        verbose_name=_("Волонтер"),
+    )
+    created_at = models.DateTimeField(_("Створено"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Місце в черзі на зміну")
+        verbose_name_plural = _("Черга очікування на зміни")
+        unique_together = ("shift", "volunteer")
+        ordering = ("id",)
+        indexes = [
+            models.Index(fields=("shift", "id"), name="shift_waitlist_fifo_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.volunteer} ⏳ {self.shift}"
+
+
+class VolunteerApplication(AtomicSaveModel):
     campaign = models.ForeignKey(
         Campaign,
         on_delete=models.CASCADE,
@@ -242,12 +430,24 @@ class VolunteerApplication(models.Model):
         verbose_name_plural = _("Заявки волонтерів")
         unique_together = ("campaign", "volunteer")
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=("-created_at", "-id"), name="application_keyset_idx"),
+            models.Index(fields=("campaign", "-created_at", "-id"), name="application_campaign_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.volunteer} → {self.campaign}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Статус на момент завантаження — щоб сигнали бачили перехід і коригували лічильники кампанії.
+        if "status" in instance.__dict__:
+            instance._loaded_status = instance.status
+        return instance
+
 
-class ShiftAssignment(models.Model):
+class ShiftAssignment(AtomicSaveModel):
     shift = models.ForeignKey(
         CampaignShift,
         on_delete=models.CASCADE,
@@ -267,6 +467,12 @@ class ShiftAssignment(models.Model):
         default=ApplicationStatus.APPROVED,
     )
     notes = models.TextField(_("Нотатки"), blank=True)
+    shift_start_at = models.DateTimeField(
+        _("Початок зміни"),
+        editable=False,
+        help_text=_("Копія часу зміни: перевірка перетинів — один запит по індексу волонтера."),
+    )
+    shift_end_at = models.DateTimeField(_("Завершення зміни"), editable=False)
     created_at = models.DateTimeField(_("Створено"), auto_now_add=True)
 
     class Meta:
@@ -274,6 +480,33 @@ class ShiftAssignment(models.Model):
         verbose_name_plural = _("Призначення волонтерів на зміни")
         unique_together = ("shift", "volunteer")
         ordering = ("shift__start_at",)
+        indexes = [
+            # Кінець зміни — перше діапазонне поле: перевірка перетину проходить лише записи,
+            # що ще не завершилися на момент початку нової зміни, а не всю історію волонтера.
+            models.Index(
+                fields=("volunteer", "shift_end_at", "shift_start_at"),
+                name="assignment_volunteer_end_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.volunteer} @ {self.shift}"
+
+    def save(self, *args, **kwargs):
+        if self.shift_start_at is None or self.shift_end_at is None:
+            shift = self._state.fields_cache.get("shift")
+            if shift is not None:
+                self.shift_start_at, self.shift_end_at = shift.start_at, shift.end_at
+            else:
+                self.shift_start_at, self.shift_end_at = CampaignShift.objects.values_list(
+                    "start_at", "end_at"
+                ).get(pk=self.shift_id)
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Підтверджений запис займає місце на зміні: сигнали порівнюють статус із завантаженим.
+        if "status" in instance.__dict__:
+            instance._loaded_status = instance.status
+        return instance
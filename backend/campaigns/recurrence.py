@@ -0,0 +1,48 @@
+"""
+/**
+ * @file: recurrence.py
+ * @description: Розгортання правила повторення змін (дні тижня, часове вікно, діапазон дат) у конкретні інтервали.
+ * @dependencies: django.utils.timezone
+ * @created: 2026-10-17
+ */
+"""
+
+from datetime import date, datetime, time, timedelta, tzinfo
+
+from django.utils import timezone
+
+# Коди днів тижня як у BYDAY з RRULE (RFC 5545); індекс відповідає date.weekday().
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+MAX_OCCURRENCES = 500
+MAX_RANGE_DAYS = 366
+
+
+def expand_occurrences(
+    start_date: date,
+    end_date: date,
+    weekdays,
+    start_time: time,
+    end_time: time,
+    tz: tzinfo | None = None,
+) -> list[tuple[datetime, datetime]]:
+    """
+    Інтервали (початок, завершення) для кожного обраного дня з діапазону включно.
+    `end_time <= start_time` означає нічну зміну, що завершується наступного дня.
+    Час локальний для `tz` (типово — часовий пояс проєкту), тож перехід на літній час не зсуває зміни.
+    """
+    tz = tz or timezone.get_current_timezone()
+    days = {WEEKDAYS.index(code) for code in weekdays}
+    overnight = end_time <= start_time
+    occurrences = []
+    day = start_date
+    while day <= end_date:
+        if day.weekday() in days:
+            end_day = day + timedelta(days=1) if overnight else day
+            occurrences.append(
+                (
+                    timezone.make_aware(datetime.combine(day, start_time), tz),
+                    timezone.make_aware(datetime.combine(end_day, end_time), tz),
+                )
+            )
+        day += timedelta(days=1)
+    return occurrences
@@ -0,0 +1,105 @@
+"""
+/**
+ * @file: regions.py
+ * @description: Довідник областей України та зведення довільного введення («Київська обл.», «Kyiv oblast», «Київщина») до канонічної назви.
+ * @dependencies: campaigns.search.APOSTROPHES
+ * @created: 2026-10-17
+ */
+"""
+
+import re
+
+from .search import APOSTROPHES
+
+KYIV_CITY = "м. Київ"
+SEVASTOPOL_CITY = "м. Севастополь"
+CRIMEA = "Автономна Республіка Крим"
+
+# Канонічна назва → додаткові синоніми (українською, латиницею, історичні назви).
+# Прикметникова основа («київська») та назва без слова «область» додаються автоматично.
+_OBLASTS: dict[str, tuple[str, ...]] = {
+    "Вінницька область": ("vinnytsia", "vinnytska", "vinnitsa", "вінниччина", "вінниця"),
+    "Волинська область": ("volyn", "volynska", "volhynia", "волинь", "луцьк", "lutsk"),
+    "Дніпропетровська область": (
+        "dnipropetrovsk", "dnipropetrovska", "dnipro", "дніпропетровщина", "дніпро", "дніпровська",
+    ),
+    "Донецька область": ("donetsk", "donetska", "донеччина", "донбас", "донецьк"),
+    "Житомирська область": ("zhytomyr", "zhytomyrska", "zhitomir", "житомирщина", "житомир"),
+    "Закарпатська область": ("zakarpattia", "zakarpatska", "transcarpathia", "закарпаття", "ужгород", "uzhhorod"),
+    "Запорізька область": ("zaporizhzhia", "zaporizka", "zaporizhia", "zaporozhye", "запоріжжя"),
+    "Івано-Франківська область": (
+        "ivano frankivsk", "ivano frankivska", "прикарпаття", "франківщина", "івано франківськ",
+    ),
+    "Київська область": ("kyivska", "kievska", "київщина"),
+    "Кіровоградська область": (
+        "kirovohrad", "kirovohradska", "kropyvnytskyi", "кіровоградщина", "кропивницький",
+    ),
+    "Луганська область": ("luhansk", "luhanska", "lugansk", "луганщина", "луганськ"),
+    "Львівська область": ("lviv", "lvivska", "lvov", "львівщина", "львів"),
+    "Миколаївська область": ("mykolaiv", "mykolaivska", "nikolaev", "миколаївщина", "миколаїв"),
+    "Одеська область": ("odesa", "odeska", "odessa", "одещина", "одеса"),
+    "Полтавська область": ("poltava", "poltavska", "полтавщина", "полтава"),
+    "Рівненська область": ("rivne", "rivnenska", "рівненщина", "рівне"),
+    "Сумська область": ("sumy", "sumska", "сумщина", "суми"),
+    "Тернопільська область": ("ternopil", "ternopilska", "тернопільщина", "тернопіль"),
+    "Харківська область": ("kharkiv", "kharkivska", "kharkov", "харківщина", "харків"),
+    "Херсонська область": ("kherson", "khersonska", "херсонщина", "херсон"),
+    "Хмельницька область": ("khmelnytskyi", "khmelnytska", "хмельниччина", "поділля", "хмельницький"),
+    "Черкаська область": ("cherkasy", "cherkaska", "черкащина", "черкаси"),
+    "Чернівецька область": ("chernivtsi", "chernivetska", "буковина", "чернівці"),
+    "Чернігівська область": ("chernihiv", "chernihivska", "чернігівщина", "чернігів"),
+    CRIMEA: ("арк", "ар крим", "крим", "crimea", "ar crimea", "autonomous republic of crimea", "республіка крим"),
+    KYIV_CITY: ("київ", "kyiv", "kiev", "kyiv city", "місто київ"),
+    SEVASTOPOL_CITY: ("севастополь", "sevastopol", "місто севастополь"),
+}
+
+REGION_NAMES: tuple[str, ...] = tuple(_OBLASTS)
+
+# Службові слова, що не розрізняють регіони: «обл.», «oblast», «region», «м.» тощо.
+_MARKERS = frozenset({"область", "обл", "oblast", "obl", "region", "регіон", "м", "місто", "city"})
+_OBLAST_MARKERS = frozenset({"область", "обл", "oblast", "obl", "region", "регіон"})
+_CITIES = frozenset({KYIV_CITY, SEVASTOPOL_CITY})
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def _tokens(value: str) -> list[str]:
+    value = (value or "").lower()
+    for char in APOSTROPHES:
+        value = value.replace(char, "")
+    return _TOKEN_RE.findall(value)
+
+
+def _key(tokens) -> str:
+    return " ".join(token for token in tokens if token not in _MARKERS)
+
+
+def _build_aliases() -> dict[str, str]:
+    aliases: dict[str, str] = {}
+    for name, extra in _OBLASTS.items():
+        for alias in (name, *extra):
+            key = _key(_tokens(alias))
+            if key:
+                aliases.setdefault(key, name)
+    return aliases
+
+
+_ALIASES = _build_aliases()
+# «Київ»/«Kyiv» разом зі словом «область» означає Київську область, а не місто.
+_CITY_TO_OBLAST = {KYIV_CITY: "Київська область", SEVASTOPOL_CITY: CRIMEA}
+
+
+def canonical_region(value: str) -> str | None:
+    """Канонічна назва регіону для довільного введення або None, якщо регіон не розпізнано."""
+    tokens = _tokens(value)
+    name = _ALIASES.get(_key(tokens))
+    if name in _CITIES and _OBLAST_MARKERS.intersection(tokens):
+        return _CITY_TO_OBLAST[name]
+    return name
+
+
+def normalize_region(value: str) -> str:
+    """Для збереження: канонічна назва, а нерозпізнане значення — як є (без зайвих пробілів)."""
+    value = (value or "").strip()
+    if not value:
+        return ""
+    return canonical_region(value) or value
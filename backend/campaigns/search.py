@@ -0,0 +1,178 @@
+"""
+/**
+ * @file: search.py
+ * @description: Повнотекстовий пошук кампаній: GIN/tsvector на PostgreSQL та FTS5 на SQLite з нормалізацією українського тексту.
+ * @dependencies: django.db.connections, django.db.models.expressions.RawSQL
+ * @created: 2026-10-17
+ */
+"""
+
+import re
+
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+# Варіанти апострофа в українських назвах ("пам'ять", "пам’ять", "памʼять") —
+# прибираємо їх і в документі, і в запиті, щоб токени збігалися.
+APOSTROPHES = "'’ʼ‘`´"
+MAX_QUERY_TERMS = 8
+
+CAMPAIGN_TABLE = "campaigns_campaign"
+SQLITE_FTS_TABLE = "campaigns_campaign_fts"
+POSTGRES_INDEX_NAME = "campaigns_campaign_search_idx"
+POSTGRES_VECTOR_COLUMN = "search_vector"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_SEARCH_COLUMNS = (("title", "A"), ("short_description", "B"), ("description", "C"))
+SEARCH_FIELDS = frozenset(column for column, _ in _SEARCH_COLUMNS)
+# Ваги колонок для bm25() у тому ж порядку, що й _SEARCH_COLUMNS.
+_SQLITE_BM25_WEIGHTS = "10.0, 4.0, 1.0"
+
+
+def normalize_search_text(value: str) -> str:
+    value = (value or "").lower()
+    for char in APOSTROPHES:
+        value = value.replace(char, "")
+    return value
+
+
+def normalize_title(value: str) -> str:
+    """Нормалізована назва для префіксного індексу автодоповнення: слова через один пробіл."""
+    return " ".join(tokenize_search_query(value, limit=None))
+
+
+def tokenize_search_query(value: str, limit: int | None = MAX_QUERY_TERMS) -> list[str]:
+    return _TOKEN_RE.findall(normalize_search_text(value))[:limit]
+
+
+def _postgres_strip_apostrophes(column: str) -> str:
+    chars = APOSTROPHES.replace("'", "''")
+    return f"translate(coalesce({column}, ''), '{chars}', '')"
+
+
+def postgres_document_sql() -> str:
+    """Вираз tsvector для згенерованої колонки `search_vector` на PostgreSQL."""
+    parts = [
+        f"setweight(to_tsvector('simple'::regconfig, {_postgres_strip_apostrophes(column)}), '{weight}')"
+        for column, weight in _SEARCH_COLUMNS
+    ]
+    return " || ".join(parts)
+
+
+def _sqlite_normalized_column(column: str) -> str:
+    expression = column
+    for char in APOSTROPHES:
+        escaped = char.replace("'", "''")
+        expression = f"replace({expression}, '{escaped}', '')"
+    return f"lower({expression})"
+
+
+def sqlite_create_index_sql() -> list[str]:
+    # remove_diacritics 0: інакше unicode61 зводить «й» до «и» та «ї» до «і».
+    columns = ", ".join(column for column, _ in _SEARCH_COLUMNS)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+        f"{columns}, tokenize = 'unicode61 remove_diacritics 0')",
+    ]
+
+
+def postgres_create_index_sql() -> list[str]:
+    # Згенерована колонка не є полем моделі: ORM її не читає і не пише,
+    # а ts_rank не перераховує tsvector з повного опису для кожного рядка.
+    return [
+        f"ALTER TABLE {CAMPAIGN_TABLE} ADD COLUMN IF NOT EXISTS {POSTGRES_VECTOR_COLUMN} tsvector "
+        f"GENERATED ALWAYS AS ({postgres_document_sql()}) STORED",
+        f"CREATE INDEX IF NOT EXISTS {POSTGRES_INDEX_NAME} ON {CAMPAIGN_TABLE} "
+        f"USING GIN ({POSTGRES_VECTOR_COLUMN})",
+    ]
+
+
+def rebuild_search_index(using: str = "default", campaign_ids=None) -> None:
+    """
+    Перебудовує FTS5-індекс SQLite (повністю або для вказаних кампаній).
+    На PostgreSQL індекс функціональний і підтримується самою БД.
+    """
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return
+    columns = ", ".join(column for column, _ in _SEARCH_COLUMNS)
+    normalized = ", ".join(_sqlite_normalized_column(column) for column, _ in _SEARCH_COLUMNS)
+    with connection.cursor() as cursor:
+        if campaign_ids is None:
+            cursor.execute(f"DELETE FROM {SQLITE_FTS_TABLE}")
+            cursor.execute(
+                f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, {columns}) "
+                f"SELECT id, {normalized} FROM {CAMPAIGN_TABLE}"
+            )
+            return
+        ids = [int(pk) for pk in campaign_ids]
+        if not ids:
+            return
+        placeholders = ", ".join(["%s"] * len(ids))
+        cursor.execute(f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid IN ({placeholders})", ids)
+        cursor.execute(
+            f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, {columns}) "
+            f"SELECT id, {normalized} FROM {CAMPAIGN_TABLE} WHERE id IN ({placeholders})",
+            ids,
+        )
+
+
+def remove_from_search_index(campaign_id: int, using: str = "default") -> None:
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = %s", [campaign_id])
+
+
+def _legacy_search(qs, query: str):
+    return qs.filter(
+        Q(title__icontains=query)
+        | Q(short_description__icontains=query)
+        | Q(description__icontains=query)
+    ).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+def search_campaigns(qs, query: str):
+    """
+    Фільтрує queryset кампаній за повнотекстовим запитом і додає анотацію `search_rank`.
+    Останній токен трактується як префікс, щоб пошук працював під час набору.
+    """
+    terms = tokenize_search_query(query)
+    if not terms:
+        return qs.none()
+
+    vendor = connections[qs.db].vendor
+    if vendor == "postgresql":
+        vector = f'"{CAMPAIGN_TABLE}"."{POSTGRES_VECTOR_COLUMN}"'
+        tsquery = " & ".join(f"{term}:*" for term in terms)
+        return qs.filter(
+            RawSQL(
+                f"{vector} @@ to_tsquery('simple'::regconfig, %s)",
+                (tsquery,),
+                output_field=BooleanField(),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f"ts_rank({vector}, to_tsquery('simple'::regconfig, %s))",
+                (tsquery,),
+                output_field=FloatField(),
+            )
+        )
+
+    if vendor == "sqlite":
+        # Віртуальну таблицю FTS5 ORM не вміє приєднати, тому join через extra():
+        # MATCH і bm25() обчислюються в одному проході повнотекстового індексу.
+        match = " ".join(f'"{term}"*' for term in terms)
+        return qs.extra(
+            select={"search_rank": f"-bm25({SQLITE_FTS_TABLE}, {_SQLITE_BM25_WEIGHTS})"},
+            tables=[SQLITE_FTS_TABLE],
+            where=[
+                f'{SQLITE_FTS_TABLE}.rowid = "{CAMPAIGN_TABLE}"."id"',
+                f"{SQLITE_FTS_TABLE} MATCH %s",
+            ],
+            params=[match],
+        )
+
+    return _legacy_search(qs, query)
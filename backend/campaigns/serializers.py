@@ -8,6 +8,7 @@
 """
 
 from django.contrib.auth import get_user_model
+from django.db import models
 from django.utils import timezone
 from rest_framework import serializers
 
@@ -21,6 +22,8 @@ from .models import (
     VolunteerApplication,
     CampaignStatus,
 )
+from .recurrence import MAX_OCCURRENCES, MAX_RANGE_DAYS, WEEKDAYS, expand_occurrences
+from .regions import normalize_region
 
 User = get_user_model()
 
@@ -64,6 +67,25 @@ class CampaignStageSerializer(serializers.ModelSerializer):
         return value
 
 
+def _user_assignment_ids(request, shift_ids) -> dict[int, int | None]:
+    """Записи поточного користувача на вказані зміни одним запитом: {id зміни: id запису або None}."""
+    found = dict(
+        ShiftAssignment.objects.filter(volunteer=request.user, shift_id__in=shift_ids).values_list("shift_id", "id")
+    )
+    return {shift_id: found.get(shift_id) for shift_id in shift_ids}
+
+
+class CampaignShiftListSerializer(serializers.ListSerializer):
+    """Перед серіалізацією списку змін завантажує записи користувача на всі зміни одним запитом."""
+
+    def to_representation(self, data):
+        shifts = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        request = self.context.get("request")
+        if request and not request.user.is_anonymous:
+            self.child.user_assignments = _user_assignment_ids(request, [shift.pk for shift in shifts])
+        return super().to_representation(shifts)
+
+
 class CampaignShiftSerializer(serializers.ModelSerializer):
     campaign_id = serializers.PrimaryKeyRelatedField(
         queryset=Campaign.objects.all(),
@@ -71,7 +93,7 @@ class CampaignShiftSerializer(serializers.ModelSerializer):
         write_only=True,
         required=True,
     )
-    occupied_spots = serializers.IntegerField(read_only=True)
+    occupied_spots = serializers.IntegerField(source="seats_taken", read_only=True)
     is_user_enrolled = serializers.SerializerMethodField()
     user_assignment_id = serializers.SerializerMethodField()
 
@@ -95,6 +117,7 @@ class CampaignShiftSerializer(serializers.ModelSerializer):
             "user_assignment_id",
         )
         read_only_fields = ("campaign", "occupied_spots", "status")
+        list_serializer_class = CampaignShiftListSerializer
 
     def validate(self, attrs):
         start_at = attrs.get("start_at", getattr(self.instance, "start_at", None))
@@ -108,18 +131,22 @@ class CampaignShiftSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Кількість місць має бути позитивною.")
         return value
 
-    def get_is_user_enrolled(self, obj):
+    def _user_assignment_id(self, obj):
         request = self.context.get("request")
         if not request or request.user.is_anonymous:
-            return False
-        return obj.assignments.filter(volunteer=request.user).exists()
+            return None
+        # Для списку мапу заповнює CampaignShiftListSerializer; окрема зміна — один запит на обидва поля.
+        if not hasattr(self, "user_assignments"):
+            self.user_assignments = {}
+        if obj.pk not in self.user_assignments:
+            self.user_assignments.update(_user_assignment_ids(request, [obj.pk]))
+        return self.user_assignments[obj.pk]
+
+    def get_is_user_enrolled(self, obj):
+        return self._user_assignment_id(obj) is not None
 
     def get_user_assignment_id(self, obj):
-        request = self.context.get("request")
-        if not request or request.user.is_anonymous:
-            return None
-        assignment = obj.assignments.filter(volunteer=request.user).first()
-        return assignment.id if assignment else None
+        return self._user_assignment_id(obj)
 
 
 class VolunteerApplicationSerializer(serializers.ModelSerializer):
@@ -156,12 +183,36 @@ class VolunteerApplicationUpdateSerializer(serializers.ModelSerializer):
         return value
 
 
+class VolunteerApplicationBulkStatusSerializer(serializers.Serializer):
+    """Масова зміна статусу: явний список id або фільтр за кампанією (і поточним статусом)."""
+
+    LIMIT = 1000
+
+    status = serializers.ChoiceField(choices=(ApplicationStatus.APPROVED, ApplicationStatus.DECLINED))
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=LIMIT,
+    )
+    campaign = serializers.SlugField(required=False, allow_unicode=True)
+    current_status = serializers.ChoiceField(choices=ApplicationStatus.choices, required=False)
+
+    def validate(self, attrs):
+        if ("ids" in attrs) == ("campaign" in attrs):
+            raise serializers.ValidationError("Вкажіть або список ids, або кампанію для фільтра.")
+        if "ids" in attrs and "current_status" in attrs:
+            raise serializers.ValidationError({"current_status": "Фільтр за статусом діє лише разом із кампанією."})
+        return attrs
+
+
 class CampaignListSerializer(serializers.ModelSerializer):
     category = CampaignCategorySerializer(read_only=True)
     coordinator = CoordinatorMiniSerializer(read_only=True)
-    stages_count = serializers.IntegerField(read_only=True)
-    shifts_count = serializers.IntegerField(read_only=True)
-    applications_pending = serializers.IntegerField(read_only=True)
+    current_amount = serializers.DecimalField(
+        source="funded_amount", max_digits=14, decimal_places=2, read_only=True
+    )
+    distance_km = serializers.SerializerMethodField()
 
     class Meta:
         model = Campaign
@@ -183,14 +234,23 @@ class CampaignListSerializer(serializers.ModelSerializer):
             "stages_count",
             "shifts_count",
             "applications_pending",
+            "distance_km",
             "published_at",
             "created_at",
         )
 
+    def get_distance_km(self, obj) -> float | None:
+        # Анотація режиму `?near=`; в інших режимах відстань не визначена.
+        distance = getattr(obj, "distance_km", None)
+        return None if distance is None else round(distance, 2)
+
 
 class CampaignDetailSerializer(serializers.ModelSerializer):
     category = CampaignCategorySerializer(read_only=True)
     coordinator = CoordinatorMiniSerializer(read_only=True)
+    current_amount = serializers.DecimalField(
+        source="funded_amount", max_digits=14, decimal_places=2, read_only=True
+    )
     stages = CampaignStageSerializer(many=True, read_only=True)
     shifts = CampaignShiftSerializer(many=True, read_only=True)
 
@@ -227,6 +287,8 @@ class CampaignDetailSerializer(serializers.ModelSerializer):
 
 class CampaignCreateUpdateSerializer(serializers.ModelSerializer):
     status = serializers.ChoiceField(choices=CampaignStatus.choices, default=CampaignStatus.DRAFT)
+    # Приймаємо синоніми («Київська обл.», «Kyiv oblast») і зберігаємо канонічну назву.
+    region = serializers.CharField(max_length=120, required=False, allow_blank=True)
 
     class Meta:
         model = Campaign
@@ -261,6 +323,11 @@ class CampaignCreateUpdateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Неприпустимий статус кампанії.")
         return value
 
+    def validate_region(self, value):
+        # Довільний текст приймається, як і раніше: відомі синоніми зводяться до канонічної назви,
+        # решта (населені пункти за кордоном, старі написання) зберігається без змін.
+        return normalize_region(value)
+
     def update(self, instance, validated_data):
         status = validated_data.get("status")
         if status == CampaignStatus.PUBLISHED and instance.published_at is None:
@@ -306,6 +373,11 @@ class VolunteerShiftAssignmentSerializer(serializers.ModelSerializer):
             "campaign",
         )
 
+    def to_representation(self, instance):
+        # Запис і є записом користувача на цю зміну — вкладеному серіалізатору зміни не потрібен окремий запит.
+        self.fields["shift"].user_assignments = {instance.shift_id: instance.pk}
+        return super().to_representation(instance)
+
     def get_campaign(self, obj: ShiftAssignment):
         campaign = obj.shift.campaign
         return {
@@ -316,6 +388,46 @@ class VolunteerShiftAssignmentSerializer(serializers.ModelSerializer):
         }
 
 
+class CampaignShiftRecurrenceSerializer(serializers.Serializer):
+    """Правило повторення для пакетного створення змін; всі дати перевіряються одним проходом."""
+
+    campaign_id = serializers.PrimaryKeyRelatedField(queryset=Campaign.objects.all(), source="campaign")
+    title = serializers.CharField(max_length=200)
+    description = serializers.CharField(required=False, allow_blank=True, default="")
+    location_details = serializers.CharField(required=False, allow_blank=True, max_length=255, default="")
+    instructions = serializers.CharField(required=False, allow_blank=True, default="")
+    capacity = serializers.IntegerField(min_value=1)
+    weekdays = serializers.ListField(
+        child=serializers.ChoiceField(choices=WEEKDAYS),
+        allow_empty=False,
+        help_text="Дні тижня у форматі BYDAY: MO, TU, WE, TH, FR, SA, SU.",
+    )
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+    start_time = serializers.TimeField()
+    end_time = serializers.TimeField(help_text="Не пізніше за початок — зміна завершується наступного дня.")
+
+    def validate(self, attrs):
+        start_date, end_date = attrs["start_date"], attrs["end_date"]
+        if end_date < start_date:
+            raise serializers.ValidationError({"end_date": "Кінцева дата має бути не раніше за початкову."})
+        if (end_date - start_date).days >= MAX_RANGE_DAYS:
+            raise serializers.ValidationError({"end_date": f"Діапазон не може перевищувати {MAX_RANGE_DAYS} днів."})
+        if attrs["start_time"] == attrs["end_time"]:
+            raise serializers.ValidationError({"end_time": "Зміна не може тривати нуль годин."})
+        occurrences = expand_occurrences(
+            start_date, end_date, attrs["weekdays"], attrs["start_time"], attrs["end_time"]
+        )
+        if not occurrences:
+            raise serializers.ValidationError("У вказаному діапазоні немає жодного обраного дня тижня.")
+        if len(occurrences) > MAX_OCCURRENCES:
+            raise serializers.ValidationError(f"Правило дає понад {MAX_OCCURRENCES} змін — зменште діапазон.")
+        if occurrences[0][0] <= timezone.now():
+            raise serializers.ValidationError({"start_date": "Перша зміна вже в минулому."})
+        attrs["occurrences"] = occurrences
+        return attrs
+
+
 class VolunteerApplySerializer(serializers.Serializer):
     motivation = serializers.CharField(required=False, allow_blank=True, max_length=2000)
     experience = serializers.CharField(required=False, allow_blank=True, max_length=2000)
@@ -0,0 +1,438 @@
+"""
+/**
+ * @file: services.py
+ * @description: Сервіси денормалізованих лічильників кампаній і внесків, місць на змінах і черги очікування.
+ * @dependencies: campaigns.models, campaigns.cache
+ * @created: 2026-10-17
+ */
+"""
+
+import random
+from collections import Counter
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    Case,
+    Count,
+    DecimalField,
+    F,
+    IntegerField,
+    Max,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .cache import invalidate_campaign_details_by_id, invalidate_campaign_lists
+from .models import (
+    ApplicationStatus,
+    Campaign,
+    CampaignFundingShard,
+    CampaignShift,
+    CampaignStage,
+    ShiftAssignment,
+    ShiftStatus,
+    ShiftWaitlistEntry,
+    VolunteerApplication,
+)
+
+COUNTER_FIELDS = ("stages_count", "shifts_count", "applications_pending")
+
+
+def adjust_campaign_counters(campaign_id: int, **deltas: int) -> None:
+    """
+    Атомарно зсуває лічильники кампанії одним UPDATE (без читання рядка).
+    Нульові дельти не чіпають рядок кампанії: зміни дочірніх об'єктів видно
+    валідаторам через їхні власні `updated_at` (див. `children_last_modified`).
+    """
+    changes = {field: F(field) + delta for field, delta in deltas.items() if delta}
+    if not changes:
+        return
+    Campaign.objects.filter(pk=campaign_id).update(updated_at=timezone.now(), **changes)
+    invalidate_campaign_lists()
+
+
+def _latest_child(queryset, aggregate=None):
+    rows = queryset.filter(campaign=OuterRef("pk")).order_by().values("campaign")
+    return Subquery(rows.annotate(value=aggregate or Max("updated_at")).values("value"))
+
+
+def children_last_modified() -> dict:
+    """
+    Анотації найсвіжішого `updated_at` етапів і змін кампанії — корельовані підзапити по FK-індексу.
+    Разом з `Campaign.updated_at` (що зсувається лише лічильниками, тож і видаленнями) дають валідатор деталей.
+    """
+    return {
+        "stages_modified": _latest_child(CampaignStage.objects.all()),
+        "shifts_modified": _latest_child(CampaignShift.objects.all()),
+    }
+
+
+def applications_version() -> dict:
+    """Версія заявок кампанії для ключа кешу статистики: найсвіжіша зміна і кількість (ловить видалення)."""
+    applications = VolunteerApplication.objects.all()
+    return {
+        "applications_modified": _latest_child(applications),
+        "applications_total": _latest_child(applications, Count("id")),
+    }
+
+
+def unfolded_funding():
+    """Анотація незгорнутої суми внесків: підзапит по унікальному індексу (campaign, slot), ≤ N рядків."""
+    return Coalesce(
+        _latest_child(CampaignFundingShard.objects.all(), Sum("amount")),
+        Value(Decimal("0")),
+        output_field=DecimalField(max_digits=14, decimal_places=2),
+    )
+
+
+def funding_last_modified():
+    """Час останнього внеску в шарди — входить у валідатори умовних GET поряд з `updated_at`."""
+    return _latest_child(CampaignFundingShard.objects.all())
+
+
+def add_campaign_funding(campaign_id: int, amount) -> None:
+    """
+    Додає внесок у випадковий слот лічильника одним UPDATE: рядок кампанії не блокується,
+    а паралельні внески розходяться по `CAMPAIGN_FUNDING_SHARDS` рядках.
+    """
+    slot = random.randrange(settings.CAMPAIGN_FUNDING_SHARDS)
+    shard = CampaignFundingShard.objects.filter(campaign_id=campaign_id, slot=slot)
+    if not shard.update(amount=F("amount") + amount, updated_at=timezone.now()):
+        try:
+            with transaction.atomic():
+                CampaignFundingShard.objects.create(campaign_id=campaign_id, slot=slot, amount=amount)
+        except IntegrityError:
+            # Слот щойно створив паралельний внесок — тепер він точно існує.
+            shard.update(amount=F("amount") + amount, updated_at=timezone.now())
+    invalidate_campaign_lists()
+    invalidate_campaign_details_by_id(campaign_id)
+
+
+def fold_campaign_funding(campaign_ids=None, batch_size: int = 1000) -> int:
+    """
+    Переносить суми слотів у `Campaign.current_amount` і обнуляє їх — по одній короткій транзакції
+    на кампанію. Видима сума (`current_amount` + слоти) при цьому не змінюється.
+    Повертає кількість згорнутих кампаній.
+    """
+    pending = CampaignFundingShard.objects.exclude(amount=0)
+    if campaign_ids is not None:
+        pending = pending.filter(campaign_id__in=campaign_ids)
+    folded = 0
+    last_id = 0
+    while True:
+        batch = list(
+            pending.filter(campaign_id__gt=last_id)
+            .order_by("campaign_id")
+            .values_list("campaign_id", flat=True)
+            .distinct()[:batch_size]
+        )
+        if not batch:
+            return folded
+        last_id = batch[-1]
+        for campaign_id in batch:
+            with transaction.atomic():
+                shards = list(
+                    CampaignFundingShard.objects.select_for_update()
+                    .filter(campaign_id=campaign_id)
+                    .exclude(amount=0)
+                    .values_list("pk", "amount")
+                )
+                if not shards:
+                    continue
+                total = sum(amount for _, amount in shards)
+                CampaignFundingShard.objects.filter(pk__in=[pk for pk, _ in shards]).update(amount=0)
+                Campaign.objects.filter(pk=campaign_id).update(current_amount=F("current_amount") + total)
+            folded += 1
+
+
+def bulk_set_application_status(application_ids, status: str) -> list[int]:
+    """
+    Переводить заявки в `status` одним UPDATE в одній транзакції; повертає id змінених.
+    Рядки читаються з блокуванням, тож зсув `applications_pending` кожної кампанії точний,
+    хоча UPDATE минає сигнали моделі.
+    """
+    with transaction.atomic():
+        rows = list(
+            VolunteerApplication.objects.select_for_update()
+            .filter(pk__in=application_ids)
+            .exclude(status=status)
+            .values_list("pk", "campaign_id", "status")
+        )
+        if not rows:
+            return []
+        changed = [pk for pk, _, _ in rows]
+        VolunteerApplication.objects.filter(pk__in=changed).update(status=status, updated_at=timezone.now())
+        pending = Counter()
+        for _, campaign_id, previous in rows:
+            pending[campaign_id] += (status == ApplicationStatus.PENDING) - (previous == ApplicationStatus.PENDING)
+        for campaign_id, delta in pending.items():
+            adjust_campaign_counters(campaign_id, applications_pending=delta)
+    return changed
+
+
+def campaign_stats(campaign_id: int) -> dict[str, int]:
+    """
+    Кількості заявок за статусами та сумарна місткість змін одним запитом:
+    корельовані підзапити по індексах із префіксом кампанії.
+    """
+
+    def scalar(queryset, aggregate):
+        subquery = queryset.filter(campaign=OuterRef("pk")).order_by().values("campaign").annotate(value=aggregate)
+        return Coalesce(Subquery(subquery.values("value"), output_field=IntegerField()), 0)
+
+    applications = VolunteerApplication.objects.all()
+    return (
+        Campaign.objects.filter(pk=campaign_id)
+        .annotate(
+            **{
+                status: scalar(applications.filter(status=status), Count("id"))
+                for status in ApplicationStatus.values
+            },
+            shift_capacity=scalar(CampaignShift.objects.all(), Sum("capacity")),
+        )
+        .values(*ApplicationStatus.values, "shift_capacity")
+        .get()
+    )
+
+
+def _grouped_counts(queryset, campaign_ids) -> dict[int, int]:
+    return dict(
+        queryset.filter(campaign_id__in=campaign_ids)
+        .order_by()
+        .values("campaign_id")
+        .annotate(total=Count("id"))
+        .values_list("campaign_id", "total")
+    )
+
+
+def reconcile_campaign_counters(campaign_ids=None, batch_size: int = 1000) -> int:
+    """
+    Перераховує лічильники групованими COUNT-запитами пачками по `batch_size` кампаній
+    і виправляє розбіжності через bulk_update. Повертає кількість виправлених кампаній.
+    """
+    campaigns = Campaign.objects.order_by("pk")
+    if campaign_ids is not None:
+        campaigns = campaigns.filter(pk__in=campaign_ids)
+
+    repaired = 0
+    last_pk = 0
+    while True:
+        batch = list(campaigns.filter(pk__gt=last_pk).only("pk", *COUNTER_FIELDS)[:batch_size])
+        if not batch:
+            return repaired
+        last_pk = batch[-1].pk
+        ids = [campaign.pk for campaign in batch]
+        actual = {
+            "stages_count": _grouped_counts(CampaignStage.objects.all(), ids),
+            "shifts_count": _grouped_counts(CampaignShift.objects.all(), ids),
+            "applications_pending": _grouped_counts(
+                VolunteerApplication.objects.filter(status=ApplicationStatus.PENDING),
+                ids,
+            ),
+        }
+        drifted = []
+        now = timezone.now()
+        for campaign in batch:
+            changed = False
+            for field in COUNTER_FIELDS:
+                value = actual[field].get(campaign.pk, 0)
+                if getattr(campaign, field) != value:
+                    setattr(campaign, field, value)
+                    changed = True
+            if changed:
+                campaign.updated_at = now
+                drifted.append(campaign)
+        if drifted:
+            Campaign.objects.bulk_update(drifted, (*COUNTER_FIELDS, "updated_at"))
+            invalidate_campaign_lists()
+            repaired += len(drifted)
+
+
+class ShiftFullError(Exception):
+    """На зміні не лишилося вільних місць (або набір на неї закрито)."""
+
+
+def reserve_seat(shift_id: int) -> None:
+    """
+    Займає місце одним захищеним UPDATE: умова `seats_taken < capacity` перевіряється
+    в тому ж операторі, що й інкремент, тож паралельні записи не перевищать місткість
+    без SELECT ... FOR UPDATE. Останнє місце переводить зміну в статус FULL.
+    `capacity = 0` означає необмежену кількість місць.
+    """
+    updated = (
+        CampaignShift.objects.filter(pk=shift_id, status__in=(ShiftStatus.OPEN, ShiftStatus.FULL))
+        .filter(Q(capacity=0) | Q(seats_taken__lt=F("capacity")))
+        .update(
+            seats_taken=F("seats_taken") + 1,
+            status=Case(
+                When(Q(capacity__gt=0) & Q(seats_taken__gte=F("capacity") - 1), then=Value(ShiftStatus.FULL)),
+                default=F("status"),
+            ),
+            updated_at=timezone.now(),
+        )
+    )
+    if not updated:
+        raise ShiftFullError(shift_id)
+
+
+def release_seat(shift_id: int) -> None:
+    """Звільняє місце; заповнена зміна знову відкривається для запису."""
+    CampaignShift.objects.filter(pk=shift_id, seats_taken__gt=0).update(
+        seats_taken=F("seats_taken") - 1,
+        status=Case(When(status=ShiftStatus.FULL, then=Value(ShiftStatus.OPEN)), default=F("status")),
+        updated_at=timezone.now(),
+    )
+
+
+def recount_shift_seats(shift_ids) -> int:
+    """Перераховує `seats_taken` з підтверджених записів; повертає кількість змін з розбіжністю."""
+    approved = (
+        ShiftAssignment.objects.filter(shift=OuterRef("pk"), status=ApplicationStatus.APPROVED)
+        .order_by()
+        .values("shift")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    actual = Coalesce(Subquery(approved, output_field=IntegerField()), 0)
+    return (
+        CampaignShift.objects.filter(pk__in=shift_ids)
+        .annotate(actual_seats=actual)
+        .exclude(seats_taken=F("actual_seats"))
+        .update(seats_taken=actual, updated_at=timezone.now())
+    )
+
+
+# Статуси записів, що займають час волонтера.
+ACTIVE_ASSIGNMENT_STATUSES = (ApplicationStatus.PENDING, ApplicationStatus.APPROVED)
+
+
+class ShiftOverlapError(Exception):
+    """Волонтер уже записаний на зміну, що перетинається в часі."""
+
+    def __init__(self, assignment: ShiftAssignment):
+        super().__init__(assignment.pk)
+        self.assignment = assignment
+
+
+def lock_volunteer(volunteer_id: int, skip_locked: bool = False) -> bool:
+    """
+    Блокує рядок користувача до кінця поточної транзакції — записи одного волонтера на зміни
+    виконуються по черзі. З `skip_locked` повертає False, якщо рядок уже зайнятий іншою транзакцією.
+    """
+    locked = (
+        get_user_model()
+        .objects.select_for_update(skip_locked=skip_locked)
+        .filter(pk=volunteer_id)
+        .values_list("pk", flat=True)
+    )
+    return bool(list(locked))
+
+
+def check_shift_overlap(volunteer_id: int, shift: CampaignShift) -> None:
+    """
+    Один запит по індексу (volunteer, shift_end_at, shift_start_at): інтервали перетинаються,
+    якщо кожен починається раніше, ніж закінчується інший. Суміжні зміни (кінець = початок) дозволені.
+    Діапазон `shift_end_at > start` обмежує сканування записами, що ще не завершилися, а порядок
+    за тим самим полем не потребує JOIN зі змінами (Meta.ordering) і сортування.
+
+    Викликається всередині транзакції, що створює запис: рядок волонтера блокується до перевірки,
+    тож паралельний запис на іншу зміну чекає на COMMIT і вже бачить новий інтервал.
+    """
+    lock_volunteer(volunteer_id)
+    conflict = (
+        ShiftAssignment.objects.filter(
+            volunteer_id=volunteer_id,
+            shift_end_at__gt=shift.start_at,
+            shift_start_at__lt=shift.end_at,
+            status__in=ACTIVE_ASSIGNMENT_STATUSES,
+        )
+        .exclude(shift_id=shift.pk)
+        .order_by("shift_end_at")
+        .only("pk", "shift_id", "shift_start_at", "shift_end_at")
+        .first()
+    )
+    if conflict is not None:
+        raise ShiftOverlapError(conflict)
+
+
+def sync_assignment_intervals(shift: CampaignShift) -> None:
+    """Переносить змінений час зміни в копії на записах волонтерів."""
+    ShiftAssignment.objects.filter(shift_id=shift.pk).exclude(
+        shift_start_at=shift.start_at, shift_end_at=shift.end_at
+    ).update(shift_start_at=shift.start_at, shift_end_at=shift.end_at)
+
+
+def sync_shift_availability(shift_id: int) -> None:
+    """Після зміни місткості: FULL ↔ OPEN за фактичним лічильником і просування черги на нові місця."""
+    CampaignShift.objects.filter(pk=shift_id, status=ShiftStatus.FULL).filter(
+        Q(capacity=0) | Q(seats_taken__lt=F("capacity"))
+    ).update(status=ShiftStatus.OPEN)
+    CampaignShift.objects.filter(
+        pk=shift_id, status=ShiftStatus.OPEN, capacity__gt=0, seats_taken__gte=F("capacity")
+    ).update(status=ShiftStatus.FULL)
+    promote_waitlisted(shift_id)
+
+
+def promote_waitlisted(shift_id: int, limit: int | None = None) -> int:
+    """
+    Переводить перших із черги у підтверджені записи, доки є місця (не більше `limit`).
+    Кожне просування — вибірка голови черги по індексу (shift, id), тож вартість
+    на одне звільнене місце не залежить від довжини черги.
+    """
+    promoted = 0
+    shift = None
+    skipped = []
+    with transaction.atomic():
+        while limit is None or promoted < limit:
+            entry = (
+                ShiftWaitlistEntry.objects.filter(shift_id=shift_id)
+                .exclude(volunteer_id__in=skipped)
+                .order_by("id")
+                .select_for_update(skip_locked=True)
+                .first()
+            )
+            if entry is None:
+                break
+            if shift is None:
+                shift = CampaignShift.objects.only("pk", "start_at", "end_at").get(pk=shift_id)
+            if not lock_volunteer(entry.volunteer_id, skip_locked=True):
+                # Волонтер саме записується на іншу зміну: не чекаємо (зворотний порядок блокувань),
+                # а пропускаємо його — позиція в черзі зберігається до наступного звільнення.
+                skipped.append(entry.volunteer_id)
+                continue
+            try:
+                check_shift_overlap(entry.volunteer_id, shift)
+            except ShiftOverlapError:
+                # За час очікування волонтер записався на іншу зміну в той самий час.
+                entry.delete()
+                continue
+            try:
+                with transaction.atomic():
+                    ShiftAssignment.objects.create(
+                        shift=shift,
+                        volunteer_id=entry.volunteer_id,
+                        status=ApplicationStatus.APPROVED,
+                    )
+            except ShiftFullError:
+                break
+            except IntegrityError:
+                # Волонтер уже має запис на зміну — просто прибираємо його з черги.
+                entry.delete()
+                continue
+            entry.delete()
+            promoted += 1
+    return promoted
+
+
+def waitlist_position(entry: ShiftWaitlistEntry) -> int:
+    """Позиція в черзі (від 1): COUNT по діапазону індексу (shift, id)."""
+    return ShiftWaitlistEntry.objects.filter(shift_id=entry.shift_id, id__lte=entry.id).count()
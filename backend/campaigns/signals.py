@@ -0,0 +1,216 @@
+"""
+/**
+ * @file: signals.py
+ * @description: Сигнали підтримки похідних даних кампаній (пошуковий індекс, триграми автодоповнення, лічильники, фасети, кеш відповідей).
+ * @dependencies: campaigns.models, campaigns.search, campaigns.autocomplete, campaigns.services, campaigns.facets, campaigns.cache
+ * @created: 2026-10-17
+ */
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .autocomplete import rebuild_title_trigrams
+from .cache import (
+    invalidate_campaign_details,
+    invalidate_campaign_details_by_id,
+    invalidate_campaign_lists,
+    invalidate_categories,
+)
+from .facets import FACET_FIELDS, shift_facet
+from .models import (
+    ApplicationStatus,
+    Campaign,
+    CampaignCategory,
+    CampaignShift,
+    CampaignStage,
+    ShiftAssignment,
+    VolunteerApplication,
+)
+from .search import SEARCH_FIELDS, rebuild_search_index, remove_from_search_index
+from .services import (
+    adjust_campaign_counters,
+    promote_waitlisted,
+    reconcile_campaign_counters,
+    recount_shift_seats,
+    release_seat,
+    reserve_seat,
+    sync_assignment_intervals,
+    sync_shift_availability,
+)
+
+_UNKNOWN = object()
+
+
+@receiver(post_save, sender=Campaign, dispatch_uid="campaigns_sync_search_index")
+def sync_search_index(sender, instance: Campaign, update_fields=None, using="default", **kwargs):
+    if update_fields is not None and not SEARCH_FIELDS.intersection(update_fields):
+        return
+    rebuild_search_index(using=using, campaign_ids=[instance.pk])
+
+
+@receiver(post_save, sender=Campaign, dispatch_uid="campaigns_sync_title_trigrams")
+def sync_title_trigrams(sender, instance: Campaign, update_fields=None, **kwargs):
+    # Статус теж: публікація додає триграми, повернення в чернетку — прибирає.
+    if update_fields is not None and not {"title", "status"}.intersection(update_fields):
+        return
+    rebuild_title_trigrams([instance])
+
+
+@receiver(post_delete, sender=Campaign, dispatch_uid="campaigns_drop_search_index")
+def drop_search_index(sender, instance: Campaign, using="default", **kwargs):
+    remove_from_search_index(instance.pk, using=using)
+
+
+@receiver(pre_save, sender=Campaign, dispatch_uid="campaigns_capture_facet")
+@receiver(pre_delete, sender=Campaign, dispatch_uid="campaigns_capture_facet_before_delete")
+def capture_facet(sender, instance: Campaign, update_fields=None, **kwargs):
+    if instance.pk is None or hasattr(instance, "_loaded_facet"):
+        return
+    if update_fields is not None and not FACET_FIELDS.intersection(update_fields):
+        return
+    # Екземпляр створено вручну або з відкладеними полями — читаємо старий ключ лише цього рядка.
+    instance._loaded_facet = (
+        Campaign.objects.filter(pk=instance.pk).values_list("status", "category_id", "region").first()
+    )
+
+
+@receiver(post_save, sender=Campaign, dispatch_uid="campaigns_sync_facets")
+def sync_facets(sender, instance: Campaign, created: bool, update_fields=None, **kwargs):
+    if update_fields is not None and not FACET_FIELDS.intersection(update_fields):
+        return
+    previous = None if created else getattr(instance, "_loaded_facet", None)
+    current = instance.facet_key
+    instance._loaded_facet = current
+    if previous == current:
+        return
+    if previous is not None:
+        shift_facet(previous, -1)
+    shift_facet(current, 1)
+
+
+@receiver(post_delete, sender=Campaign, dispatch_uid="campaigns_drop_facets")
+def drop_facets(sender, instance: Campaign, **kwargs):
+    if instance._loaded_facet is not None:
+        shift_facet(instance._loaded_facet, -1)
+
+
+@receiver(post_save, sender=CampaignStage, dispatch_uid="campaigns_count_stage_created")
+def count_stage_created(sender, instance: CampaignStage, created: bool, **kwargs):
+    adjust_campaign_counters(instance.campaign_id, stages_count=1 if created else 0)
+
+
+@receiver(post_delete, sender=CampaignStage, dispatch_uid="campaigns_count_stage_deleted")
+def count_stage_deleted(sender, instance: CampaignStage, **kwargs):
+    adjust_campaign_counters(instance.campaign_id, stages_count=-1)
+
+
+@receiver(post_save, sender=CampaignShift, dispatch_uid="campaigns_count_shift_created")
+def count_shift_created(sender, instance: CampaignShift, created: bool, **kwargs):
+    adjust_campaign_counters(instance.campaign_id, shifts_count=1 if created else 0)
+
+
+@receiver(post_delete, sender=CampaignShift, dispatch_uid="campaigns_count_shift_deleted")
+def count_shift_deleted(sender, instance: CampaignShift, **kwargs):
+    adjust_campaign_counters(instance.campaign_id, shifts_count=-1)
+
+
+@receiver(post_save, sender=VolunteerApplication, dispatch_uid="campaigns_count_application_saved")
+def count_application_saved(sender, instance: VolunteerApplication, created: bool, **kwargs):
+    previous = None if created else getattr(instance, "_loaded_status", _UNKNOWN)
+    instance._loaded_status = instance.status
+    if previous is _UNKNOWN:
+        # Статус не завантажувався (deferred/створений вручну екземпляр) — перерахунок однієї кампанії.
+        reconcile_campaign_counters([instance.campaign_id])
+        return
+    was_pending = previous == ApplicationStatus.PENDING
+    is_pending = instance.status == ApplicationStatus.PENDING
+    adjust_campaign_counters(instance.campaign_id, applications_pending=is_pending - was_pending)
+
+
+@receiver(post_delete, sender=VolunteerApplication, dispatch_uid="campaigns_count_application_deleted")
+def count_application_deleted(sender, instance: VolunteerApplication, **kwargs):
+    adjust_campaign_counters(
+        instance.campaign_id,
+        applications_pending=-1 if instance.status == ApplicationStatus.PENDING else 0,
+    )
+
+
+@receiver(post_save, sender=ShiftAssignment, dispatch_uid="campaigns_seats_assignment_saved")
+def sync_shift_seats(sender, instance: ShiftAssignment, created: bool, **kwargs):
+    previous = None if created else getattr(instance, "_loaded_status", _UNKNOWN)
+    instance._loaded_status = instance.status
+    if previous is _UNKNOWN:
+        recount_shift_seats([instance.shift_id])
+        return
+    was_approved = previous == ApplicationStatus.APPROVED
+    is_approved = instance.status == ApplicationStatus.APPROVED
+    if is_approved and not was_approved:
+        # ShiftFullError відкочує збереження запису разом з транзакцією AtomicSaveModel.
+        reserve_seat(instance.shift_id)
+    elif was_approved and not is_approved:
+        release_seat(instance.shift_id)
+        promote_waitlisted(instance.shift_id, limit=1)
+
+
+@receiver(post_delete, sender=ShiftAssignment, dispatch_uid="campaigns_seats_assignment_deleted")
+def free_shift_seat(sender, instance: ShiftAssignment, origin=None, **kwargs):
+    if getattr(instance, "_loaded_status", instance.status) != ApplicationStatus.APPROVED:
+        return
+    release_seat(instance.shift_id)
+    # Каскадне видалення самої зміни чи кампанії — черга зникає разом з нею.
+    if getattr(origin, "model", type(origin)) not in (CampaignShift, Campaign):
+        promote_waitlisted(instance.shift_id, limit=1)
+
+
+@receiver(post_save, sender=CampaignShift, dispatch_uid="campaigns_seats_shift_saved")
+def sync_shift_capacity(sender, instance: CampaignShift, created: bool, **kwargs):
+    # Редагування могло змінити місткість або записати застарілий статус — узгоджуємо з лічильником.
+    if not created:
+        sync_assignment_intervals(instance)
+        sync_shift_availability(instance.pk)
+
+
+def _campaign_slug(instance) -> str | None:
+    campaign = instance._state.fields_cache.get("campaign")
+    return campaign.slug if campaign is not None else None
+
+
+@receiver(post_save, sender=Campaign, dispatch_uid="campaigns_cache_campaign_saved")
+@receiver(post_delete, sender=Campaign, dispatch_uid="campaigns_cache_campaign_deleted")
+def invalidate_campaign_cache(sender, instance: Campaign, **kwargs):
+    invalidate_campaign_lists()
+    invalidate_campaign_details(instance.slug, getattr(instance, "_loaded_slug", None))
+    instance._loaded_slug = instance.slug
+
+
+@receiver(post_save, sender=CampaignStage, dispatch_uid="campaigns_cache_stage_saved")
+@receiver(post_delete, sender=CampaignStage, dispatch_uid="campaigns_cache_stage_deleted")
+@receiver(post_save, sender=CampaignShift, dispatch_uid="campaigns_cache_shift_saved")
+@receiver(post_delete, sender=CampaignShift, dispatch_uid="campaigns_cache_shift_deleted")
+def invalidate_campaign_child_cache(sender, instance, **kwargs):
+    # Лічильники у списку інвалідуються сервісом лічильників; тут — лише деталі кампанії.
+    slug = _campaign_slug(instance)
+    if slug:
+        invalidate_campaign_details(slug)
+    else:
+        invalidate_campaign_details_by_id(instance.campaign_id)
+
+
+@receiver(post_save, sender=ShiftAssignment, dispatch_uid="campaigns_cache_assignment_saved")
+@receiver(post_delete, sender=ShiftAssignment, dispatch_uid="campaigns_cache_assignment_deleted")
+def sync_assignment_parents(sender, instance: ShiftAssignment, **kwargs):
+    # Запис видно лише в самій зміні (зайнятість, запис користувача): зсуваємо її `updated_at`,
+    # а валідатор деталей кампанії підхоплює його через найсвіжішу зміну. Рядок кампанії не блокується.
+    CampaignShift.objects.filter(pk=instance.shift_id).update(updated_at=timezone.now())
+    invalidate_campaign_details(*Campaign.objects.filter(shifts__pk=instance.shift_id).values_list("slug", flat=True))
+
+
+@receiver(post_save, sender=CampaignCategory, dispatch_uid="campaigns_cache_category_saved")
+@receiver(post_delete, sender=CampaignCategory, dispatch_uid="campaigns_cache_category_deleted")
+def invalidate_category_cache(sender, instance: CampaignCategory, **kwargs):
+    # Категорія вкладена в кожну кампанію списку і деталей.
+    invalidate_categories()
+    invalidate_campaign_lists()
+    invalidate_campaign_details(*instance.campaigns.values_list("slug", flat=True))
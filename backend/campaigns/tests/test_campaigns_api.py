@@ -7,23 +7,43 @@
  */
 """
 
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import OperationalError, connection, connections
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APIClient, APITestCase
 
 from accounts.models import User, UserRole
+from core.pagination import StandardPagination
 from campaigns.models import (
     ApplicationStatus,
     Campaign,
     CampaignCategory,
+    CampaignFacetCount,
+    CampaignShift,
+    CampaignTitleTrigram,
     VolunteerApplication,
     ShiftAssignment,
+    ShiftStatus,
     CampaignStatus as CampaignStatusEnum,
 )
+from payments.models import Donation
 
 
 class CampaignsApiTests(APITestCase):
     def setUp(self):
+        cache.clear()
         self.category = CampaignCategory.objects.create(name="Логістика")
         self.coordinator = User.objects.create_user(
             email="coord@example.com",
@@ -271,4 +291,1094 @@ class CampaignsApiTests(APITestCase):
         response = self.client.get(url, format="json")
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def test_search_ranks_title_matches_and_normalizes_apostrophes(self):
+        base = {
+            "status": CampaignStatusEnum.PUBLISHED,
+            "category": self.category,
+            "coordinator": self.coordinator,
+            "location_name": "Київ",
+            "region": "Київська область",
+        }
+        in_description = Campaign.objects.create(
+            title="Допомога громаді",
+            short_description="Збір речей.",
+            description="Облаштуємо кімнату пам’яті в школі.",
+            published_at="2025-01-09T09:00:00Z",
+            **base,
+        )
+        in_title = Campaign.objects.create(
+            title="Памʼять героїв",
+            short_description="Меморіал у громаді.",
+            description="Повний опис.",
+            published_at="2025-01-08T09:00:00Z",
+            **base,
+        )
+        Campaign.objects.create(
+            title="Пам'ять і пошук",
+            short_description="Чернетка.",
+            description="Повний опис.",
+            **{**base, "status": CampaignStatusEnum.DRAFT},
+        )
+        Campaign.objects.create(
+            title="Сортування одягу",
+            short_description="Склад.",
+            description="Повний опис.",
+            published_at="2025-01-10T09:00:00Z",
+            **base,
+        )
+
+        url = reverse("campaigns:campaigns-list")
+        response = self.client.get(url, {"search": "пам'ят"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        slugs = [item["slug"] for item in response.data["results"]]
+        self.assertEqual(slugs, [in_title.slug, in_description.slug])
+
+    def test_autocomplete_returns_light_payload_and_tolerates_typos(self):
+        base = {
+            "short_description": "Опис.",
+            "description": "Повний опис.",
+            "category": self.category,
+            "coordinator": self.coordinator,
+            "location_name": "Київ",
+        }
+        monument = Campaign.objects.create(
+            title="Памʼятник захисникам",
+            status=CampaignStatusEnum.PUBLISHED,
+            **base,
+        )
+        drones = Campaign.objects.create(
+            title="Збір на дрони для бригади",
+            status=CampaignStatusEnum.PUBLISHED,
+            **base,
+        )
+        Campaign.objects.create(title="Дрони: чернетка", status=CampaignStatusEnum.DRAFT, **base)
+
+        url = reverse("campaigns:campaigns-autocomplete")
+        response = self.client.get(url, {"q": "пам'ятн"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            [{"id": monument.id, "title": monument.title, "slug": monument.slug, "category": self.category.slug}],
+        )
+
+        by_word_prefix = self.client.get(url, {"q": "дро"})
+        self.assertEqual([item["id"] for item in by_word_prefix.data], [drones.id])
+
+        with_typo = self.client.get(url, {"q": "бригада"})
+        self.assertEqual([item["id"] for item in with_typo.data], [drones.id])
+
+        # Кеш підказок прив'язаний до покоління списків — перейменування видно одразу.
+        drones.title = "Збір на генератори"
+        drones.save()
+        self.assertEqual(self.client.get(url, {"q": "дро"}).data, [])
+
+    @mock.patch("campaigns.autocomplete.MAX_GRAM_POSTINGS", 3)
+    def test_autocomplete_typo_matches_old_campaign_past_common_trigrams(self):
+        base = {
+            "short_description": "Опис.",
+            "description": "Повний опис.",
+            "category": self.category,
+            "coordinator": self.coordinator,
+            "location_name": "Київ",
+        }
+        oldest = Campaign.objects.create(
+            title="Збір на дрони для бригади", status=CampaignStatusEnum.PUBLISHED, **base
+        )
+        for index in range(5):
+            Campaign.objects.create(title=f"Збір на авто {index}", status=CampaignStatusEnum.PUBLISHED, **base)
+        draft = Campaign.objects.create(title="Збір для бригади", status=CampaignStatusEnum.DRAFT, **base)
+        # Чернетки не займають триграмний індекс.
+        self.assertFalse(CampaignTitleTrigram.objects.filter(campaign=draft).exists())
+
+        # «збір» є в кожній назві й відкидається як частий фрагмент; збіг дають рідкісні триграми.
+        response = self.client.get(reverse("campaigns:campaigns-autocomplete"), {"q": "збір бригада"})
+        self.assertEqual([item["id"] for item in response.data], [oldest.id])
+
+        draft.status = CampaignStatusEnum.PUBLISHED
+        draft.save(update_fields=["status"])
+        self.assertTrue(CampaignTitleTrigram.objects.filter(campaign=draft).exists())
+
+    @mock.patch.object(StandardPagination, "page_size", 2)
+    def test_cursor_pagination_walks_campaigns_without_gaps(self):
+        base = {
+            "short_description": "Опис.",
+            "description": "Повний опис.",
+            "category": self.category,
+            "coordinator": self.coordinator,
+            "location_name": "Київ",
+        }
+        published = [
+            Campaign.objects.create(
+                title=f"Кампанія {index}",
+                status=CampaignStatusEnum.PUBLISHED,
+                published_at="2025-02-01T10:00:00Z",
+                **base,
+            )
+            for index in range(3)
+        ]
+        unpublished = [
+            Campaign.objects.create(title=f"У процесі {index}", status=CampaignStatusEnum.IN_PROGRESS, **base)
+            for index in range(2)
+        ]
+
+        url = reverse("campaigns:campaigns-list")
+        response = self.client.get(url, {"pagination": "cursor"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        seen = [item["id"] for item in response.data["results"]]
+        next_link = response.data["next"]
+        while next_link:
+            page = self.client.get(next_link)
+            self.assertEqual(page.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(page.data["results"]), 2)
+            seen.extend(item["id"] for item in page.data["results"])
+            next_link = page.data["next"]
+
+        self.assertEqual(len(seen), len(set(seen)))
+        # Рівні published_at розводяться за id; NULL-и йдуть так, як їх сортує БД.
+        published_ids = sorted((campaign.id for campaign in published), reverse=True)
+        self.assertEqual([pk for pk in seen if pk in published_ids], published_ids)
+        self.assertEqual(set(seen), set(published_ids) | {campaign.id for campaign in unpublished})
+
+        broken = self.client.get(url, {"cursor": "not-a-cursor"})
+        self.assertEqual(broken.status_code, status.HTTP_404_NOT_FOUND)
+
+        # Курсор ключується хронологією — з пошуком чи «поблизу» він зламав би порядок, тож 400.
+        searched = self.client.get(url, {"search": "Кампанія", "pagination": "cursor"})
+        self.assertEqual(searched.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("pagination", searched.data)
+        nearby = self.client.get(url, {"near": "50.45,30.52", "pagination": "cursor"})
+        self.assertEqual(nearby.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(url, {"search": "Кампанія"}).status_code, status.HTTP_200_OK)
+
+    def test_campaign_counters_follow_children_and_reconcile_drift(self):
+        campaign = Campaign.objects.create(
+            title="Лічильники",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            coordinator=self.coordinator,
+            location_name="Київ",
+        )
+        stage = campaign.stages.create(title="Етап 1")
+        campaign.stages.create(title="Етап 2")
+        campaign.shifts.create(
+            title="Зміна",
+            start_at="2099-01-01T09:00:00Z",
+            end_at="2099-01-01T12:00:00Z",
+        )
+        stage.delete()
+
+        self.client.force_authenticate(self.volunteer)
+        apply_url = reverse("campaigns:campaigns-apply", kwargs={"slug": campaign.slug})
+        self.client.post(apply_url, {"motivation": "Готовий."}, format="json")
+        campaign.refresh_from_db()
+        self.assertEqual(
+            (campaign.stages_count, campaign.shifts_count, campaign.applications_pending),
+            (1, 1, 1),
+        )
+
+        application = VolunteerApplication.objects.get(campaign=campaign, volunteer=self.volunteer)
+        self.client.force_authenticate(self.coordinator)
+        detail_url = reverse("campaigns:volunteer-applications-detail", args=[application.id])
+        self.client.patch(detail_url, {"status": ApplicationStatus.APPROVED}, format="json")
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.applications_pending, 0)
+
+        Campaign.objects.filter(pk=campaign.pk).update(stages_count=7, applications_pending=3)
+        call_command("reconcile_campaign_counters", stdout=StringIO())
+        campaign.refresh_from_db()
+        self.assertEqual(
+            (campaign.stages_count, campaign.shifts_count, campaign.applications_pending),
+            (1, 1, 0),
+        )
+
+        list_response = self.client.get(reverse("campaigns:campaigns-list"))
+        item = next(row for row in list_response.data["results"] if row["id"] == campaign.id)
+        self.assertEqual((item["stages_count"], item["shifts_count"]), (1, 1))
+
+    def test_campaign_actions_stay_within_query_budget(self):
+        campaigns = []
+        for index in range(3):
+            campaign = Campaign.objects.create(
+                title=f"Бюджет запитів {index}",
+                short_description="Опис.",
+                description="Повний опис.",
+                status=CampaignStatusEnum.PUBLISHED,
+                category=self.category,
+                coordinator=self.coordinator,
+                location_name="Київ",
+                published_at="2025-03-01T10:00:00Z",
+            )
+            for order in (1, 2):
+                campaign.stages.create(title=f"Етап {order}", order=order)
+                shift = campaign.shifts.create(
+                    title=f"Зміна {order}",
+                    start_at="2099-01-01T09:00:00Z",
+                    end_at="2099-01-01T12:00:00Z",
+                )
+                ShiftAssignment.objects.create(shift=shift, volunteer=self.volunteer)
+            campaigns.append(campaign)
+        campaign = campaigns[0]
+
+        # Кількість запитів не залежить від кількості кампаній, етапів, змін і записів на зміни.
+        # list: агрегат для ETag + COUNT + сторінка з категорією та координатором.
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("campaigns:campaigns-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("stages", response.data["results"][0])
+
+        # retrieve: `updated_at` для ETag + кампанія + етапи + зміни з кількістю підтверджених місць.
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("campaigns:campaigns-detail", kwargs={"slug": campaign.slug}))
+        self.assertEqual(len(response.data["stages"]), 2)
+        self.assertEqual(len(response.data["shifts"]), 2)
+
+        # stats: вузька вибірка кампанії + один запит з агрегатами; далі — лише кампанія, доки вона не зміниться.
+        self.client.force_authenticate(self.coordinator)
+        stats_url = reverse("campaigns:campaigns-stats", kwargs={"slug": campaign.slug})
+        with self.assertNumQueries(2):
+            response = self.client.get(stats_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["shift_capacity"], 2)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(stats_url).data, response.data)
+        VolunteerApplication.objects.create(campaign=campaign, volunteer=self.volunteer)
+        campaign.shifts.create(
+            title="Ще зміна", start_at="2099-01-02T09:00:00Z", end_at="2099-01-02T12:00:00Z", capacity=3
+        )
+        response = self.client.get(stats_url)
+        self.assertEqual((response.data["volunteers"]["pending"], response.data["shift_capacity"]), (1, 5))
+        application = VolunteerApplication.objects.get(campaign=campaign, volunteer=self.volunteer)
+        application.status = ApplicationStatus.APPROVED
+        application.save()
+        application.status = ApplicationStatus.DECLINED
+        application.save()
+        response = self.client.get(stats_url)
+        self.assertEqual(response.data["volunteers"]["declined"], 1)
+        application.delete()
+
+        # apply: кампанія, get_or_create заявки (пошук, вставка у savepoint-ах) та лічильник заявок.
+        self.client.force_authenticate(self.volunteer)
+        with self.assertNumQueries(8):
+            response = self.client.post(
+                reverse("campaigns:campaigns-apply", kwargs={"slug": campaign.slug}),
+                {"motivation": "Готовий."},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_anonymous_responses_are_cached_and_invalidated_by_writes(self):
+        campaign = Campaign.objects.create(
+            title="Кешована кампанія",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            coordinator=self.coordinator,
+            location_name="Київ",
+            target_amount=1000,
+        )
+        list_url = reverse("campaigns:campaigns-list")
+        detail_url = reverse("campaigns:campaigns-detail", kwargs={"slug": campaign.slug})
+
+        self.assertEqual(self.client.get(list_url)["X-Cache"], "MISS")
+        with self.assertNumQueries(0):
+            cached = self.client.get(list_url, {"format": "json"})
+        self.assertEqual(cached["X-Cache"], "HIT")
+        self.assertEqual(self.client.get(detail_url)["X-Cache"], "MISS")
+
+        shift = campaign.shifts.create(
+            title="Зміна",
+            start_at="2099-01-01T09:00:00Z",
+            end_at="2099-01-01T12:00:00Z",
+            capacity=2,
+        )
+        detail = self.client.get(detail_url)
+        self.assertEqual(detail["X-Cache"], "MISS")
+        self.assertEqual(len(detail.data["shifts"]), 1)
+        listed = self.client.get(list_url)
+        self.assertEqual(listed.data["results"][0]["shifts_count"], 1)
+
+        ShiftAssignment.objects.create(shift=shift, volunteer=self.volunteer)
+        self.assertEqual(self.client.get(detail_url).data["shifts"][0]["occupied_spots"], 1)
+
+        donation = Donation.objects.create(campaign=campaign, amount=250)
+        self.client.get(list_url)
+        donation.mark_succeeded()
+        listed = self.client.get(list_url)
+        self.assertEqual(listed["X-Cache"], "MISS")
+        self.assertEqual(float(listed.data["results"][0]["current_amount"]), 250)
+        self.assertEqual(float(self.client.get(detail_url).data["current_amount"]), 250)
+
+        self.client.force_authenticate(self.volunteer)
+        self.assertNotIn("X-Cache", self.client.get(list_url))
+
+    def test_conditional_get_returns_not_modified_until_data_changes(self):
+        campaign = Campaign.objects.create(
+            title="Умовні запити",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            coordinator=self.coordinator,
+            location_name="Київ",
+            target_amount=1000,
+        )
+        shift = campaign.shifts.create(
+            title="Зміна",
+            start_at="2099-01-01T09:00:00Z",
+            end_at="2099-01-01T12:00:00Z",
+            capacity=2,
+        )
+        detail_url = reverse("campaigns:campaigns-detail", kwargs={"slug": campaign.slug})
+        shifts_url = reverse("campaigns:campaign-shifts-list")
+        categories_url = reverse("campaigns:campaign-categories-list")
+        list_url = reverse("campaigns:campaigns-list")
+
+        def revalidate(url, params=None):
+            first = self.client.get(url, params)
+            self.assertEqual(first.status_code, status.HTTP_200_OK)
+            again = self.client.get(url, params, HTTP_IF_NONE_MATCH=first["ETag"])
+            self.assertEqual(again.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(again["ETag"], first["ETag"])
+            return first["ETag"]
+
+        detail_etag = revalidate(detail_url)
+        shifts_etag = revalidate(shifts_url, {"campaign": campaign.slug})
+        revalidate(categories_url)
+        revalidate(list_url, {"search": "умовні"})
+        # Анонімне попадання в кеш порівнює збережений ETag і відповідає 304 без запитів до БД.
+        with self.assertNumQueries(0):
+            cached = self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        campaign_version = Campaign.objects.values_list("updated_at", flat=True).get(pk=campaign.pk)
+        ShiftAssignment.objects.create(shift=shift, volunteer=self.volunteer)
+        # Запис на зміну не чіпає рядок кампанії — валідатор бачить його через `updated_at` зміни.
+        self.assertEqual(Campaign.objects.values_list("updated_at", flat=True).get(pk=campaign.pk), campaign_version)
+        changed = self.client.get(shifts_url, {"campaign": campaign.slug}, HTTP_IF_NONE_MATCH=shifts_etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data["results"][0]["occupied_spots"], 1)
+        changed = self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+
+        detail_etag = changed["ETag"]
+        stage = campaign.stages.create(title="Етап")
+        detail_etag = self.client.get(detail_url)["ETag"]
+        campaign_version = Campaign.objects.values_list("updated_at", flat=True).get(pk=campaign.pk)
+        stage.is_completed = True
+        stage.save()
+        self.assertEqual(Campaign.objects.values_list("updated_at", flat=True).get(pk=campaign.pk), campaign_version)
+        edited = self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(edited.status_code, status.HTTP_200_OK)
+        self.assertTrue(edited.data["stages"][0]["is_completed"])
+
+        detail_etag = edited["ETag"]
+        Donation.objects.create(campaign=campaign, amount=100).mark_succeeded()
+        funded = self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(funded.status_code, status.HTTP_200_OK)
+        self.assertEqual(float(funded.data["current_amount"]), 100)
+
+        # Перейменування категорії змінює валідатори списку й деталей, не переписуючи рядки кампаній.
+        list_etag = revalidate(list_url)
+        campaign_version = Campaign.objects.values_list("updated_at", flat=True).get(pk=campaign.pk)
+        self.category.name = "Інша назва"
+        self.category.save()
+        self.assertEqual(Campaign.objects.values_list("updated_at", flat=True).get(pk=campaign.pk), campaign_version)
+        renamed = self.client.get(detail_url, HTTP_IF_NONE_MATCH=funded["ETag"])
+        self.assertEqual(renamed.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(list_url, HTTP_IF_NONE_MATCH=list_etag).status_code, status.HTTP_200_OK)
+        funded = renamed
+
+        # Представлення залежить від користувача (запис на зміну) — ETag теж.
+        self.client.force_authenticate(self.volunteer)
+        self.assertNotEqual(self.client.get(detail_url)["ETag"], funded["ETag"])
+
+    def test_near_mode_returns_campaigns_within_radius_sorted_by_distance(self):
+        base = {
+            "short_description": "Опис.",
+            "description": "Повний опис.",
+            "status": CampaignStatusEnum.PUBLISHED,
+            "category": self.category,
+            "coordinator": self.coordinator,
+        }
+        # Від Майдану Незалежності: Поділ ~2 км, Бровари ~20 км, Житомир ~130 км.
+        podil = Campaign.objects.create(
+            title="Поділ", location_name="Київ", location_lat="50.465000", location_lng="30.515000", **base
+        )
+        brovary = Campaign.objects.create(
+            title="Бровари", location_name="Бровари", location_lat="50.511000", location_lng="30.790000", **base
+        )
+        Campaign.objects.create(
+            title="Житомир", location_name="Житомир", location_lat="50.254700", location_lng="28.658700", **base
+        )
+        Campaign.objects.create(title="Без координат", location_name="Київ", **base)
+
+        url = reverse("campaigns:campaigns-list")
+        response = self.client.get(url, {"near": "50.4501,30.5234", "radius_km": "30"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual([item["id"] for item in results], [podil.id, brovary.id])
+        self.assertAlmostEqual(results[0]["distance_km"], 1.8, delta=0.3)
+        self.assertAlmostEqual(results[1]["distance_km"], 20.1, delta=1.0)
+
+        narrow = self.client.get(url, {"near": "50.4501,30.5234", "radius_km": "5"})
+        self.assertEqual([item["id"] for item in narrow.data["results"]], [podil.id])
+        self.assertIsNone(self.client.get(url).data["results"][0]["distance_km"])
+
+        for params in ({"near": "north"}, {"near": "95,30"}, {"near": "50,30", "radius_km": "-1"}):
+            self.assertEqual(self.client.get(url, params).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_facets_follow_campaign_changes_and_other_filters(self):
+        medicine = CampaignCategory.objects.create(name="Медицина")
+        base = {
+            "short_description": "Опис.",
+            "description": "Повний опис.",
+            "coordinator": self.coordinator,
+            "location_name": "Київ",
+        }
+        kyiv = Campaign.objects.create(
+            title="Дрони для Києва",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            region="Київська область",
+            **base,
+        )
+        Campaign.objects.create(
+            title="Аптечки",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=medicine,
+            region="Львівська область",
+            **base,
+        )
+        Campaign.objects.create(
+            title="Чернетка", status=CampaignStatusEnum.DRAFT, category=medicine, region="Київська область", **base
+        )
+
+        url = reverse("campaigns:campaigns-facets")
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.data["total"], 2)
+        self.assertEqual(
+            {item["value"]: item["count"] for item in response.data["status"]},
+            {CampaignStatusEnum.PUBLISHED: 2},
+        )
+
+        # Вибрана категорія не обнуляє лічильники інших категорій.
+        response = self.client.get(url, {"category": medicine.slug})
+        self.assertEqual(response.data["total"], 1)
+        self.assertEqual(
+            {item["value"]: item["count"] for item in response.data["category"]},
+            {self.category.slug: 1, medicine.slug: 1},
+        )
+        self.assertEqual(response.data["region"], [{"value": "Львівська область", "label": "Львівська область", "count": 1}])
+
+        kyiv.status = CampaignStatusEnum.COMPLETED
+        kyiv.region = "Одеська область"
+        kyiv.save()
+        response = self.client.get(url)
+        self.assertEqual(
+            {item["value"]: item["count"] for item in response.data["status"]},
+            {CampaignStatusEnum.PUBLISHED: 1, CampaignStatusEnum.COMPLETED: 1},
+        )
+        self.assertNotIn("Київська область", [item["value"] for item in response.data["region"]])
+
+        searched = self.client.get(url, {"search": "дрони"})
+        self.assertEqual(searched.data["total"], 1)
+        self.assertEqual(searched.data["region"][0]["value"], "Одеська область")
+
+        # Екземпляр без завантажених полів фасету: читається лише старий рядок, агрегат не перебудовується.
+        existing_rows = set(CampaignFacetCount.objects.values_list("pk", flat=True))
+        deferred = Campaign.objects.only("id", "title").get(pk=kyiv.pk)
+        deferred.status = CampaignStatusEnum.PUBLISHED
+        deferred.save(update_fields=["status"])
+        self.assertLessEqual(existing_rows, set(CampaignFacetCount.objects.values_list("pk", flat=True)))
+        self.assertEqual(
+            {item["value"]: item["count"] for item in self.client.get(url).data["status"]},
+            {CampaignStatusEnum.PUBLISHED: 2},
+        )
+        kyiv = deferred
+
+        kyiv.delete()
+        call_command("reconcile_campaign_counters", stdout=StringIO())
+        self.assertEqual(self.client.get(url).data["total"], 1)
+
+    def test_regions_are_canonicalized_and_filtered_by_equality(self):
+        url = reverse("campaigns:campaigns-list")
+        payload = {
+            "title": "Генератори для громади",
+            "short_description": "Опис.",
+            "description": "Повний опис.",
+            "status": CampaignStatusEnum.PUBLISHED,
+            "category": self.category.id,
+            "location_name": "Бровари",
+            "region": "Kyiv oblast",
+        }
+        self.client.force_authenticate(self.coordinator)
+        response = self.client.post(url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        campaign = Campaign.objects.get(title=payload["title"])
+        self.assertEqual(campaign.region, "Київська область")
+
+        # Нерозпізнаний регіон не відхиляється — зберігається як введено (без зайвих пробілів).
+        unknown = self.client.post(url, {**payload, "title": "Інша", "region": " Атлантида "}, format="json")
+        self.assertEqual(unknown.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Campaign.objects.get(title="Інша").region, "Атлантида")
+
+        Campaign.objects.create(
+            title="Столиця",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            coordinator=self.coordinator,
+            location_name="Київ",
+            region="м. Київ",
+        )
+        self.client.force_authenticate(None)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"region": "Київська обл."})
+        self.assertEqual([item["id"] for item in response.data["results"]], [campaign.id])
+        page_sql = queries.captured_queries[-1]["sql"]
+        self.assertIn('"campaigns_campaign"."region" = ', page_sql)
+        self.assertNotIn("LIKE", page_sql)
+        self.assertEqual(len(self.client.get(url, {"region": "Київ"}).data["results"]), 1)
+
+    def test_shift_seats_follow_joins_leaves_and_status_changes(self):
+        campaign = Campaign.objects.create(
+            title="Сортування гуманітарки",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            coordinator=self.coordinator,
+            location_name="Львів",
+        )
+        shift = campaign.shifts.create(
+            title="Вечірня зміна",
+            start_at="2099-01-01T17:00:00Z",
+            end_at="2099-01-01T21:00:00Z",
+            capacity=2,
+        )
+        others = [
+            User.objects.create_user(email=f"seat{i}@example.com", password="StrongPass!123", role=UserRole.ADMIN)
+            for i in range(3)
+        ]
+        join_url = reverse("campaigns:campaign-shifts-join", args=[shift.id])
+        stale = CampaignShift.objects.get(pk=shift.pk)
+
+        for user in others[:2]:
+            self.client.force_authenticate(user)
+            self.assertEqual(self.client.post(join_url, {}, format="json").status_code, status.HTTP_201_CREATED)
+        shift.refresh_from_db()
+        self.assertEqual((shift.seats_taken, shift.status), (2, ShiftStatus.FULL))
+
+        # Редагування застарілого екземпляра не відкочує лічильник і статус.
+        stale.title = "Вечірня зміна (оновлено)"
+        stale.save()
+        shift.refresh_from_db()
+        self.assertEqual((shift.seats_taken, shift.status), (2, ShiftStatus.FULL))
+
+        self.client.force_authenticate(others[2])
+        response = self.client.post(join_url, {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["waitlist_position"], 1)
+        self.assertFalse(ShiftAssignment.objects.filter(shift=shift, volunteer=others[2]).exists())
+
+        self.client.force_authenticate(others[0])
+        leave_url = reverse("campaigns:campaign-shifts-leave", args=[shift.id])
+        self.assertEqual(self.client.delete(leave_url).status_code, status.HTTP_204_NO_CONTENT)
+        # Звільнене місце одразу дісталося першому в черзі.
+        shift.refresh_from_db()
+        self.assertEqual((shift.seats_taken, shift.status), (2, ShiftStatus.FULL))
+        self.assertTrue(ShiftAssignment.objects.filter(shift=shift, volunteer=others[2]).exists())
+        self.assertFalse(shift.waitlist.exists())
+        ShiftAssignment.objects.filter(shift=shift, volunteer=others[2]).delete()
+        shift.refresh_from_db()
+        self.assertEqual((shift.seats_taken, shift.status), (1, ShiftStatus.OPEN))
+
+        assignment = ShiftAssignment.objects.get(shift=shift, volunteer=others[1])
+        assignment.status = ApplicationStatus.DECLINED
+        assignment.save()
+        shift.refresh_from_db()
+        self.assertEqual(shift.seats_taken, 0)
+
+        self.client.force_authenticate(self.coordinator)
+        response = self.client.post(
+            reverse("campaigns:shift-assignments-list"),
+            {"shift_id": shift.id, "volunteer_id": others[2].id},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        shift.refresh_from_db()
+        self.assertEqual(shift.seats_taken, 1)
+
+    def test_full_shift_queues_volunteers_and_promotes_in_order(self):
+        campaign = Campaign.objects.create(
+            title="Донорський марафон",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            coordinator=self.coordinator,
+            location_name="Одеса",
+        )
+        shift = campaign.shifts.create(
+            title="Реєстрація донорів",
+            start_at="2099-02-01T08:00:00Z",
+            end_at="2099-02-01T12:00:00Z",
+            capacity=1,
+        )
+        users = [
+            User.objects.create_user(email=f"queue{i}@example.com", password="StrongPass!123", role=UserRole.ADMIN)
+            for i in range(5)
+        ]
+        join_url = reverse("campaigns:campaign-shifts-join", args=[shift.id])
+        leave_url = reverse("campaigns:campaign-shifts-leave", args=[shift.id])
+        waitlist_url = reverse("campaigns:campaign-shifts-waitlist", args=[shift.id])
+
+        codes = []
+        for user in users:
+            self.client.force_authenticate(user)
+            codes.append(self.client.post(join_url, {}, format="json").status_code)
+        self.assertEqual(codes, [status.HTTP_201_CREATED] + [status.HTTP_202_ACCEPTED] * 4)
+
+        self.client.force_authenticate(users[3])
+        response = self.client.post(join_url, {}, format="json")
+        self.assertEqual((response.status_code, response.data["waitlist_position"]), (status.HTTP_200_OK, 3))
+        response = self.client.get(waitlist_url)
+        self.assertEqual(response.data, {"waitlist_position": 3, "waitlist_size": 4})
+
+        # Вихід із черги зсуває позиції тих, хто позаду.
+        self.client.force_authenticate(users[2])
+        self.assertEqual(self.client.delete(leave_url).status_code, status.HTTP_204_NO_CONTENT)
+        self.client.force_authenticate(users[3])
+        self.assertEqual(self.client.get(waitlist_url).data["waitlist_position"], 2)
+
+        # Звільнене місце займає перший у черзі — в тій самій транзакції.
+        self.client.force_authenticate(users[0])
+        self.assertEqual(self.client.delete(leave_url).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(
+            list(shift.assignments.values_list("volunteer", flat=True)),
+            [users[1].id],
+        )
+
+        # Збільшення місткості просуває стільки людей, скільки з'явилося місць.
+        self.client.force_authenticate(users[0])
+        response = self.client.patch(
+            reverse("campaigns:campaign-shifts-detail", args=[shift.id]), {"capacity": 5}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        shift.refresh_from_db()
+        self.assertEqual((shift.seats_taken, shift.status), (3, ShiftStatus.OPEN))
+        self.assertFalse(shift.waitlist.exists())
+        self.assertCountEqual(
+            shift.assignments.values_list("volunteer", flat=True),
+            [users[1].id, users[3].id, users[4].id],
+        )
+
+    def test_recurring_shifts_are_generated_in_one_bulk_insert(self):
+        campaign = Campaign.objects.create(
+            title="Склад гуманітарної допомоги",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            coordinator=self.coordinator,
+            location_name="Дніпро",
+        )
+        url = reverse("campaigns:campaign-shifts-bulk-generate")
+        payload = {
+            "campaign_id": campaign.id,
+            "title": "Нічне чергування",
+            "capacity": 4,
+            "weekdays": ["MO", "WE", "FR"],
+            "start_date": "2099-03-02",
+            "end_date": "2099-03-29",
+            "start_time": "22:00",
+            "end_time": "06:00",
+        }
+
+        self.client.force_authenticate(self.volunteer)
+        self.assertEqual(self.client.post(url, payload, format="json").status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(self.coordinator)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual((response.data["created"], response.data["skipped_existing"]), (12, 0))
+        self.assertEqual(sum("INSERT INTO" in query["sql"] for query in queries.captured_queries), 1)
+
+        shifts = list(campaign.shifts.order_by("start_at"))
+        self.assertEqual(len(shifts), 12)
+        self.assertEqual({shift.start_at.astimezone().weekday() for shift in shifts}, {0, 2, 4})
+        self.assertTrue(all(shift.end_at - shift.start_at == timedelta(hours=8) for shift in shifts))
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.shifts_count, 12)
+
+        # Повтор того ж правила з ширшим діапазоном додає лише нові дати.
+        response = self.client.post(url, {**payload, "end_date": "2099-04-05"}, format="json")
+        self.assertEqual((response.data["created"], response.data["skipped_existing"]), (3, 12))
+
+        response = self.client.post(url, {**payload, "start_date": "2099-03-10", "end_date": "2099-03-01"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("end_date", response.data)
+        response = self.client.post(url, {**payload, "weekdays": ["XX"]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_overlapping_shifts_are_rejected_with_one_indexed_probe(self):
+        campaign = Campaign.objects.create(
+            title="Евакуаційний штаб",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            coordinator=self.coordinator,
+            location_name="Харків",
+        )
+        VolunteerApplication.objects.create(
+            campaign=campaign, volunteer=self.volunteer, status=ApplicationStatus.APPROVED
+        )
+
+        def shift(start, end):
+            return campaign.shifts.create(
+                title="Зміна", start_at=f"2099-05-01T{start}:00Z", end_at=f"2099-05-01T{end}:00Z", capacity=5
+            )
+
+        morning = shift("08:00", "12:00")
+        overlapping = shift("11:00", "15:00")
+        adjacent = shift("12:00", "16:00")
+        later = shift("14:00", "18:00")
+        # Історія волонтера не впливає на вартість перевірки.
+        for day in range(1, 25):
+            past = campaign.shifts.create(
+                title="Архів", start_at=f"2098-01-{day:02d}T08:00:00Z", end_at=f"2098-01-{day:02d}T12:00:00Z"
+            )
+            ShiftAssignment.objects.create(shift=past, volunteer=self.volunteer)
+
+        self.client.force_authenticate(self.volunteer)
+
+        def join(target):
+            return self.client.post(reverse("campaigns:campaign-shifts-join", args=[target.id]), {}, format="json")
+
+        self.assertEqual(join(morning).status_code, status.HTTP_201_CREATED)
+        with CaptureQueriesContext(connection) as queries:
+            response = join(overlapping)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["conflicting_shift_id"], morning.id)
+        probes = [query["sql"] for query in queries.captured_queries if '"shift_start_at" <' in query["sql"]]
+        self.assertEqual(len(probes), 1)
+        # Без JOIN зі змінами: порядок береться з індексу за кінцем зміни, а не з Meta.ordering.
+        self.assertNotIn("JOIN", probes[0])
+        self.assertIn('ORDER BY "campaigns_shiftassignment"."shift_end_at"', probes[0])
+        self.assertEqual(join(adjacent).status_code, status.HTTP_201_CREATED)
+        self.assertEqual(join(later).status_code, status.HTTP_400_BAD_REQUEST)
+
+        # Перенесення зміни оновлює копію часу в записах.
+        adjacent.start_at = "2099-05-01T19:00:00Z"
+        adjacent.end_at = "2099-05-01T21:00:00Z"
+        adjacent.save()
+        self.assertEqual(join(later).status_code, status.HTTP_201_CREATED)
+
+        self.client.force_authenticate(self.coordinator)
+        response = self.client.post(
+            reverse("campaigns:shift-assignments-list"),
+            {"shift_id": overlapping.id, "volunteer_id": self.volunteer.id},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("volunteer_id", response.data)
+
+    def test_occupancy_is_read_from_shift_counter_without_extra_queries(self):
+        campaign = Campaign.objects.create(
+            title="Табір для переселенців",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            coordinator=self.coordinator,
+            location_name="Ужгород",
+        )
+        helpers = [
+            User.objects.create_user(email=f"helper{i}@example.com", password="StrongPass!123") for i in range(2)
+        ]
+        url = reverse("campaigns:my-shift-assignments-list")
+        self.client.force_authenticate(self.volunteer)
+
+        def add_shift(day):
+            shift = campaign.shifts.create(
+                title="Зміна", start_at=f"2099-06-{day:02d}T09:00:00Z", end_at=f"2099-06-{day:02d}T12:00:00Z", capacity=5
+            )
+            ShiftAssignment.objects.create(shift=shift, volunteer=self.volunteer)
+            for helper in helpers:
+                ShiftAssignment.objects.create(shift=shift, volunteer=helper)
+            return shift
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(queries), response
+
+        first = add_shift(1)
+        small, _ = count_queries()
+        for day in range(2, 8):
+            add_shift(day)
+        large, response = count_queries()
+        self.assertEqual(large, small)
+        self.assertEqual(response.data["count"], 7)
+        self.assertTrue(all(item["shift"]["occupied_spots"] == 3 for item in response.data["results"]))
+
+        # Зміна статусу запису одразу відбивається на лічильнику.
+        assignment = ShiftAssignment.objects.get(shift=first, volunteer=helpers[0])
+        assignment.status = ApplicationStatus.WITHDRAWN
+        assignment.save()
+        first.refresh_from_db()
+        self.assertEqual(first.seats_taken, 2)
+        assignment.status = ApplicationStatus.APPROVED
+        assignment.save()
+        first.refresh_from_db()
+        self.assertEqual(first.seats_taken, 3)
+
+    def test_bulk_status_updates_applications_in_one_statement(self):
+        own = Campaign.objects.create(
+            title="Масовий набір",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            coordinator=self.coordinator,
+            location_name="Київ",
+        )
+        other_coordinator = User.objects.create_user(
+            email="other-coord@example.com", password="StrongPass!123", role=UserRole.COORDINATOR
+        )
+        foreign = Campaign.objects.create(
+            title="Чужа кампанія",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            coordinator=other_coordinator,
+            location_name="Львів",
+        )
+        applicants = [
+            User.objects.create_user(email=f"applicant{i}@example.com", password="StrongPass!123") for i in range(30)
+        ]
+        own_ids = [
+            VolunteerApplication.objects.create(campaign=own, volunteer=applicant).pk for applicant in applicants
+        ]
+        foreign_id = VolunteerApplication.objects.create(campaign=foreign, volunteer=applicants[0]).pk
+        url = reverse("campaigns:volunteer-applications-bulk-status")
+
+        self.client.force_authenticate(self.volunteer)
+        self.assertEqual(
+            self.client.post(url, {"ids": own_ids, "status": "approved"}, format="json").status_code,
+            status.HTTP_403_FORBIDDEN,
+        )
+
+        self.client.force_authenticate(self.coordinator)
+        payload = {"ids": [*own_ids[:20], foreign_id, 999999], "status": ApplicationStatus.APPROVED}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.data["updated"], 20)
+        outcomes = {item["id"]: item["result"] for item in response.data["results"]}
+        self.assertEqual(outcomes[foreign_id], "forbidden")
+        self.assertEqual(outcomes[999999], "not_found")
+        self.assertEqual(
+            sum('UPDATE "campaigns_volunteerapplication"' in query["sql"] for query in queries.captured_queries), 1
+        )
+        own.refresh_from_db()
+        foreign.refresh_from_db()
+        self.assertEqual((own.applications_pending, foreign.applications_pending), (10, 1))
+
+        # Фільтр за кампанією та поточним статусом; вже відхилені/підтверджені не чіпаються.
+        response = self.client.post(
+            url,
+            {"campaign": own.slug, "current_status": ApplicationStatus.PENDING, "status": ApplicationStatus.DECLINED},
+            format="json",
+        )
+        self.assertEqual(response.data["updated"], 10)
+        response = self.client.post(url, {"ids": own_ids[:2], "status": ApplicationStatus.APPROVED}, format="json")
+        self.assertEqual([item["result"] for item in response.data["results"]], ["unchanged", "unchanged"])
+        own.refresh_from_db()
+        self.assertEqual(own.applications_pending, 0)
+        self.assertEqual(
+            VolunteerApplication.objects.filter(campaign=own, status=ApplicationStatus.DECLINED).count(), 10
+        )
+
+        response = self.client.post(url, {"status": ApplicationStatus.APPROVED}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_campaign_applications_are_paginated_or_streamed(self):
+        campaign = Campaign.objects.create(
+            title="Велика кампанія",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            coordinator=self.coordinator,
+            location_name="Київ",
+        )
+        applicants = User.objects.bulk_create(User(email=f"stream{i}@example.com") for i in range(45))
+        for i, applicant in enumerate(applicants):
+            VolunteerApplication.objects.create(campaign=campaign, volunteer=applicant, motivation=f"#{i}")
+        url = reverse("campaigns:campaigns-list-applications", kwargs={"slug": campaign.slug})
+        self.client.force_authenticate(self.coordinator)
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 45)
+        self.assertEqual(len(response.data["results"]), 20)
+
+        page = self.client.get(url, {"pagination": "cursor"})
+        seen = [item["id"] for item in page.data["results"]]
+        while page.data["next"]:
+            page = self.client.get(page.data["next"])
+            seen.extend(item["id"] for item in page.data["results"])
+        self.assertEqual(len(seen), 45)
+        self.assertEqual(len(set(seen)), 45)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"stream": "ndjson"})
+            body = b"".join(response.streaming_content).decode()
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([item["id"] for item in lines], seen)
+        self.assertEqual(lines[0]["campaign"]["slug"], campaign.slug)
+        self.assertLessEqual(len(queries), 4)
+
+        response = self.client.get(url, {"stream": "json"})
+        self.assertEqual(len(json.loads(b"".join(response.streaming_content))), 45)
+        self.assertEqual(self.client.get(url, {"stream": "xml"}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_enrollment_fields_cost_constant_queries_per_shift_page(self):
+        campaign = Campaign.objects.create(
+            title="Багато змін",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=self.category,
+            coordinator=self.coordinator,
+            location_name="Київ",
+        )
+
+        def add_shifts(count):
+            for _ in range(count):
+                campaign.shifts.create(
+                    title="Зміна",
+                    start_at="2099-01-01T09:00:00Z",
+                    end_at="2099-01-01T12:00:00Z",
+                    capacity=3,
+                )
+
+        detail_url = reverse("campaigns:campaigns-detail", kwargs={"slug": campaign.slug})
+        shifts_url = reverse("campaigns:campaign-shifts-list")
+        self.client.force_authenticate(self.volunteer)
+
+        def count_queries(url, params=None):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(queries), response
+
+        add_shifts(2)
+        ShiftAssignment.objects.create(shift=campaign.shifts.first(), volunteer=self.volunteer)
+        detail_small, _ = count_queries(detail_url)
+        list_small, _ = count_queries(shifts_url, {"campaign": campaign.slug})
+
+        add_shifts(8)
+        detail_large, response = count_queries(detail_url)
+        list_large, _ = count_queries(shifts_url, {"campaign": campaign.slug})
+        self.assertEqual(detail_large, detail_small)
+        self.assertEqual(list_large, list_small)
+
+        enrolled = [shift for shift in response.data["shifts"] if shift["is_user_enrolled"]]
+        self.assertEqual(len(enrolled), 1)
+        self.assertIsNotNone(enrolled[0]["user_assignment_id"])
+        self.assertEqual(sum(shift["user_assignment_id"] is not None for shift in response.data["shifts"]), 1)
+
+
+class ShiftJoinConcurrencyTests(TransactionTestCase):
+    """Сотні одночасних записів на зміну не перевищують місткість."""
+
+    JOINS = 200
+    CAPACITY = 25
+
+    def setUp(self):
+        cache.clear()
+        coordinator = User.objects.create_user(
+            email="coord@example.com", password="StrongPass!123", role=UserRole.COORDINATOR
+        )
+        campaign = Campaign.objects.create(
+            title="Пункт незламності",
+            short_description="Опис.",
+            description="Повний опис.",
+            status=CampaignStatusEnum.PUBLISHED,
+            category=CampaignCategory.objects.create(name="Логістика"),
+            coordinator=coordinator,
+            location_name="Суми",
+        )
+        self.shift = campaign.shifts.create(
+            title="Нічна зміна",
+            start_at="2099-01-01T21:00:00Z",
+            end_at="2099-01-02T06:00:00Z",
+            capacity=self.CAPACITY,
+        )
+        # Адміністратори записуються без підтвердженої заявки — тестуємо лише місткість.
+        self.users = User.objects.bulk_create(
+            User(email=f"rush{i}@example.com", role=UserRole.ADMIN) for i in range(self.JOINS)
+        )
+
+    def _join(self, user, shift=None) -> int:
+        client = APIClient()
+        client.force_authenticate(user)
+        url = reverse("campaigns:campaign-shifts-join", args=[(shift or self.shift).id])
+        deadline = time.monotonic() + 60
+        try:
+            while True:
+                try:
+                    return client.post(url, {}, format="json").status_code
+                except OperationalError as exc:
+                    # SQLite серіалізує записувачів; на PostgreSQL блокування рядкові й повторів немає.
+                    if "locked" not in str(exc) or time.monotonic() > deadline:
+                        raise
+                    connections.close_all()
+                    time.sleep(random.uniform(0.001, 0.02))
+        finally:
+            connections.close_all()
+
+    def test_concurrent_joins_never_overbook_shift(self):
+        # Спільна in-memory база SQLite блокує цілі таблиці, тож там паралелізм помірний.
+        workers = 16 if connection.vendor == "postgresql" else 2
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            codes = list(pool.map(self._join, self.users))
+
+        # 200 — повтор після блокування SQLite, коли запис уже був зафіксований.
+        self.assertEqual(codes.count(status.HTTP_400_BAD_REQUEST), 0)
+        self.shift.refresh_from_db()
+        self.assertEqual(self.shift.seats_taken, self.CAPACITY)
+        self.assertEqual(self.shift.status, ShiftStatus.FULL)
+        self.assertEqual(ShiftAssignment.objects.filter(shift=self.shift).count(), self.CAPACITY)
+        # Хто не вмістився — у черзі, кожен рівно один раз.
+        self.assertEqual(self.shift.waitlist.count(), self.JOINS - self.CAPACITY)
+
+    def test_concurrent_joins_to_overlapping_shifts_keep_one(self):
+        volunteer = self.users[0]
+        overlapping = self.shift.campaign.shifts.create(
+            title="Пізня зміна",
+            start_at="2099-01-02T00:00:00Z",
+            end_at="2099-01-02T08:00:00Z",
+            capacity=self.CAPACITY,
+        )
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            codes = sorted(pool.map(lambda shift: self._join(volunteer, shift), [self.shift, overlapping]))
 
+        # Перевірка перетину й INSERT серіалізовані блокуванням волонтера: друга транзакція бачить першу.
+        # 200 — повтор після блокування SQLite, коли запис уже був зафіксований.
+        self.assertIn(codes[0], {status.HTTP_200_OK, status.HTTP_201_CREATED})
+        self.assertEqual(codes[1], status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(ShiftAssignment.objects.filter(volunteer=volunteer).count(), 1)
@@ -7,12 +7,16 @@
  */
 """
 
-from django.db.models import Count, Prefetch, Q, Sum
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max
 from django.utils import timezone
 from rest_framework import decorators, mixins, permissions, response, status, viewsets
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
 
 from accounts.models import UserRole
+from core.conditional import conditional_response, make_etag
+from core.streaming import STREAM_CONTENT_TYPES, STREAM_QUERY_PARAM, streaming_serialized_response
 
 from .models import (
     ApplicationStatus,
@@ -21,19 +25,52 @@ from .models import (
     CampaignShift,
     CampaignStage,
     ShiftAssignment,
+    ShiftWaitlistEntry,
     VolunteerApplication,
     CampaignStatus as CampaignStatusEnum,
     ShiftStatus,
 )
+from .autocomplete import AUTOCOMPLETE_LIMIT, autocomplete_campaigns
+from .cache import (
+    CATEGORIES_NAMESPACE,
+    LIST_NAMESPACE,
+    STATS_CACHE_TTL,
+    cached_public_response,
+    collection_cache_key,
+    detail_cache_key,
+    invalidate_campaign_details,
+    normalized_params,
+    stats_cache_key,
+)
+from .facets import build_facets, cached_queryset_rows, table_rows
+from .geo import nearby_campaigns, parse_near
 from .permissions import IsCoordinatorOfCampaign, IsCoordinatorOrReadOnly
+from .regions import canonical_region
+from .search import search_campaigns
+from .services import (
+    ACTIVE_ASSIGNMENT_STATUSES,
+    ShiftFullError,
+    ShiftOverlapError,
+    adjust_campaign_counters,
+    applications_version,
+    bulk_set_application_status,
+    campaign_stats,
+    check_shift_overlap,
+    children_last_modified,
+    funding_last_modified,
+    unfolded_funding,
+    waitlist_position,
+)
 from .serializers import (
     CampaignCategorySerializer,
     CampaignCreateUpdateSerializer,
     CampaignDetailSerializer,
     CampaignListSerializer,
+    CampaignShiftRecurrenceSerializer,
     CampaignShiftSerializer,
     CampaignStageSerializer,
     ShiftAssignmentSerializer,
+    VolunteerApplicationBulkStatusSerializer,
     VolunteerApplicationSerializer,
     VolunteerApplicationUpdateSerializer,
     VolunteerApplySerializer,
@@ -41,34 +78,46 @@ from .serializers import (
 )
 
 
-def _shifts_queryset_with_spots():
-    return CampaignShift.objects.annotate(
-        occupied_spots=Count("assignments", filter=Q(assignments__status=ApplicationStatus.APPROVED), distinct=True),
-    ).prefetch_related("assignments")
+PUBLIC_STATUSES = tuple(value for value in CampaignStatusEnum.values if value != CampaignStatusEnum.DRAFT)
+# Фільтри списку, яких немає в таблиці фасетів (статус, категорія, регіон).
+NON_FACET_FILTERS = ("coordinator", "has_funding", "search", "near")
+# Порядок заявок (і для keyset-сторінок) — по індексах application_keyset_idx / application_campaign_idx.
+APPLICATIONS_CURSOR_ORDERING = ("-created_at", "-id")
+
+
+def _collection_validators(request, kind: str, queryset, *extra, modified=()):
+    """
+    ETag списку з кількості та найсвіжішого `updated_at` відфільтрованих рядків — один агрегат без серіалізації.
+    `modified` — додаткові вирази часу зміни (напр. внески в шарди, категорія), що теж зсувають валідатор.
+    """
+    aggregates = {"total": Count("id"), "last_modified": Max("updated_at")}
+    for index, expression in enumerate(modified):
+        aggregates[f"also_modified_{index}"] = Max(expression)
+    summary = queryset.order_by().aggregate(**aggregates)
+    total = summary.pop("total")
+    last_modified = max(filter(None, summary.values()), default=None)
+    etag = make_etag(
+        kind,
+        request.get_host(),
+        normalized_params(request),
+        total,
+        last_modified and last_modified.isoformat(),
+        *extra,
+    )
+    return etag, last_modified
 
 
 class CampaignViewSet(viewsets.ModelViewSet):
-    queryset = Campaign.objects.select_related("category", "coordinator").prefetch_related(
-        "stages",
-        Prefetch("shifts", queryset=_shifts_queryset_with_spots()),
-    )
+    queryset = Campaign.objects.all()
     permission_classes = (IsCoordinatorOrReadOnly,)
     lookup_field = "slug"
+    cursor_ordering = ("-published_at", "-created_at", "-id")
 
     def get_queryset(self):
-        qs = (
-            super()
-            .get_queryset()
-            .annotate(
-                stages_count=Count("stages", distinct=True),
-                shifts_count=Count("shifts", distinct=True),
-                applications_pending=Count(
-                    "applications",
-                    filter=Q(applications__status=ApplicationStatus.PENDING),
-                    distinct=True,
-                ),
-            )
-        )
+        return self._filter_campaigns(self._plan_queryset(super().get_queryset()))
+
+    def _filter_campaigns(self, qs, *, facet_filters: bool = True):
+        """Фільтри з query params; без `facet_filters` — лише ті, яких немає в таблиці фасетів."""
         params = self.request.query_params
         status_param = params.get("status")
         category = params.get("category")
@@ -76,27 +125,103 @@ class CampaignViewSet(viewsets.ModelViewSet):
         coordinator = params.get("coordinator")
         search = params.get("search")
 
-        if status_param:
-            qs = qs.filter(status=status_param)
-        else:
-            qs = qs.exclude(status=CampaignStatusEnum.DRAFT)
-
-        if category:
-            qs = qs.filter(category__slug=category)
-        if region:
-            qs = qs.filter(region__icontains=region)
+        if facet_filters:
+            # Рівності та IN по (status, category, region) — складений індекс працює, на відміну від NOT/LIKE.
+            if status_param:
+                qs = qs.filter(status=status_param)
+            else:
+                qs = qs.filter(status__in=PUBLIC_STATUSES)
+            if category:
+                qs = qs.filter(category__slug=category)
+            if region:
+                qs = qs.filter(region=canonical_region(region) or region.strip())
         if coordinator:
             qs = qs.filter(coordinator__id=coordinator)
-        if search:
-            qs = qs.filter(
-                Q(title__icontains=search)
-                | Q(short_description__icontains=search)
-                | Q(description__icontains=search)
-            )
         if params.get("has_funding") == "true":
             qs = qs.filter(target_amount__gt=0)
+        if search:
+            qs = search_campaigns(qs, search).order_by("-search_rank", "-published_at", "-created_at")
+        near = params.get("near")
+        if near:
+            # Режим «поблизу»: пошуковий запит лишається фільтром, порядок — за відстанню.
+            lat, lng, radius_km = parse_near(near, params.get("radius_km"))
+            qs = nearby_campaigns(qs, lat, lng, radius_km).order_by("distance_km", "id")
         return qs
 
+    def _plan_queryset(self, qs):
+        """
+        Join-и та prefetch-і лише під серіалізатор поточної дії:
+        список рендерить категорію й координатора, деталі — ще етапи та зміни,
+        а apply/stats/applications/запис працюють із самою кампанією.
+        """
+        if self.action == "list":
+            return qs.select_related("category", "coordinator").annotate(unfolded_funding=unfolded_funding())
+        if self.action == "retrieve":
+            return (
+                qs.select_related("category", "coordinator")
+                .prefetch_related("stages", "shifts")
+                .annotate(unfolded_funding=unfolded_funding())
+            )
+        if self.action == "stats":
+            return qs.only(
+                "pk", "slug", "title", "coordinator_id", "target_amount", "current_amount", "updated_at"
+            ).annotate(
+                unfolded_funding=unfolded_funding(),
+                shifts_modified=children_last_modified()["shifts_modified"],
+                **applications_version(),
+            )
+        return qs
+
+    def list(self, request, *args, **kwargs):
+        return cached_public_response(
+            request,
+            collection_cache_key(LIST_NAMESPACE, request),
+            lambda: conditional_response(
+                request,
+                lambda: _collection_validators(
+                    request,
+                    "campaigns",
+                    self.filter_queryset(self.get_queryset()),
+                    # Категорія вкладена в кожен рядок: її `updated_at` зсуває валідатор без запису в кампанії.
+                    modified=(funding_last_modified(), F("category__updated_at")),
+                ),
+                lambda: super(CampaignViewSet, self).list(request, *args, **kwargs),
+            ),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        def build():
+            return conditional_response(
+                request,
+                self._detail_validators,
+                lambda: super(CampaignViewSet, self).retrieve(request, *args, **kwargs),
+            )
+
+        # Параметри фільтрів (напр. ?status=) змінюють видимість кампанії — такі запити не кешуємо.
+        if normalized_params(request):
+            return build()
+        return cached_public_response(request, detail_cache_key(kwargs[self.lookup_field]), build)
+
+    def _detail_validators(self):
+        # Найсвіжіша з міток: сама кампанія (і її лічильники), категорія, етапи, зміни (зсуваються й записами
+        # волонтерів) та шарди внесків — один запит з підзапитами, без запису в рядок кампанії.
+        row = (
+            self.get_queryset()
+            .prefetch_related(None)
+            .filter(**{self.lookup_field: self.kwargs[self.lookup_field]})
+            .annotate(**children_last_modified(), funding_modified=funding_last_modified())
+            .values_list(
+                "id", "updated_at", "category__updated_at", "stages_modified", "shifts_modified", "funding_modified"
+            )
+            .first()
+        )
+        if row is None:
+            return None
+        campaign_id, *stamps = row
+        updated_at = max(stamp for stamp in stamps if stamp is not None)
+        # У деталях є поля поточного користувача (запис на зміну), тож він входить у валідатор.
+        return make_etag("campaign", campaign_id, updated_at.isoformat(), self.request.user.pk), updated_at
+
     def get_serializer_class(self):
         if self.action in {"list"}:
             return CampaignListSerializer
@@ -127,6 +252,39 @@ class CampaignViewSet(viewsets.ModelViewSet):
             instance.published_at = timezone.now()
             instance.save(update_fields=["published_at"])
 
+    @decorators.action(
+        detail=False,
+        methods=["get"],
+        permission_classes=(permissions.AllowAny,),
+        url_path="autocomplete",
+    )
+    def autocomplete(self, request):
+        query = request.query_params.get("q", "")
+        try:
+            limit = min(int(request.query_params.get("limit", AUTOCOMPLETE_LIMIT)), AUTOCOMPLETE_LIMIT)
+        except ValueError:
+            limit = AUTOCOMPLETE_LIMIT
+        return response.Response(autocomplete_campaigns(query, max(limit, 1)))
+
+    @decorators.action(
+        detail=False,
+        methods=["get"],
+        permission_classes=(permissions.AllowAny,),
+        url_path="facets",
+    )
+    def facets(self, request):
+        params = request.query_params
+        if any(params.get(name) for name in NON_FACET_FILTERS):
+            # Фільтри поза агрегатом: групований запит по відфільтрованих кампаніях, кешований
+            # у поколінні списків — будь-яка зміна кампаній його інвалідує.
+            rows = cached_queryset_rows(
+                collection_cache_key(LIST_NAMESPACE, request),
+                self._filter_campaigns(Campaign.objects.all(), facet_filters=False),
+            )
+        else:
+            rows = table_rows()
+        return response.Response(build_facets(rows, params))
+
     @decorators.action(
         detail=True,
         methods=["post"],
@@ -185,29 +343,32 @@ class CampaignViewSet(viewsets.ModelViewSet):
         ):
             raise PermissionDenied("Недостатньо прав для перегляду статистики.")
 
-        applications = campaign.applications.all()
-        volunteers_total = applications.filter(status=ApplicationStatus.APPROVED).count()
-        pending_total = applications.filter(status=ApplicationStatus.PENDING).count()
-        declined_total = applications.filter(status=ApplicationStatus.DECLINED).count()
-        withdrawn_total = applications.filter(status=ApplicationStatus.WITHDRAWN).count()
-
-        shift_capacity = campaign.shifts.aggregate(
-            total_capacity=Sum("capacity"),
-        )["total_capacity"] or 0
+        # Опитування з дашборда: попадання в кеш коштує лише вибірки самої кампанії.
+        key = stats_cache_key(
+            campaign.pk,
+            campaign.updated_at,
+            campaign.shifts_modified,
+            campaign.applications_modified,
+            campaign.applications_total,
+        )
+        counts = cache.get(key)
+        if counts is None:
+            counts = campaign_stats(campaign.pk)
+            cache.set(key, counts, STATS_CACHE_TTL)
 
         data = {
             "volunteers": {
-                "approved": volunteers_total,
-                "pending": pending_total,
-                "declined": declined_total,
-                "withdrawn": withdrawn_total,
+                "approved": counts[ApplicationStatus.APPROVED],
+                "pending": counts[ApplicationStatus.PENDING],
+                "declined": counts[ApplicationStatus.DECLINED],
+                "withdrawn": counts[ApplicationStatus.WITHDRAWN],
             },
-            "shift_capacity": shift_capacity,
+            "shift_capacity": counts["shift_capacity"],
             "campaign": {
                 "id": campaign.id,
                 "title": campaign.title,
                 "target_amount": campaign.target_amount or 0,
-                "current_amount": campaign.current_amount or 0,
+                "current_amount": campaign.funded_amount,
             },
         }
         return response.Response(data)
@@ -224,9 +385,18 @@ class CampaignViewSet(viewsets.ModelViewSet):
         if campaign.coordinator_id != user.id and user.role not in {UserRole.ADMIN} and not user.is_staff:
             raise PermissionDenied("Тільки координатор кампанії має доступ до заявок.")
 
-        qs = campaign.applications.select_related("volunteer").order_by("-created_at")
-        serializer = VolunteerApplicationSerializer(qs, many=True, context={"request": request})
-        return response.Response(serializer.data)
+        qs = campaign.applications.select_related("volunteer").order_by(*APPLICATIONS_CURSOR_ORDERING)
+        stream = request.query_params.get(STREAM_QUERY_PARAM)
+        if stream:
+            if stream not in STREAM_CONTENT_TYPES:
+                raise ValidationError({STREAM_QUERY_PARAM: f"Підтримувані формати: {', '.join(STREAM_CONTENT_TYPES)}."})
+            serializer = VolunteerApplicationSerializer(context={"request": request})
+            return streaming_serialized_response(qs, serializer, stream)
+
+        self.paginator.cursor_ordering = APPLICATIONS_CURSOR_ORDERING
+        page = self.paginate_queryset(qs)
+        serializer = VolunteerApplicationSerializer(page, many=True, context={"request": request})
+        return self.get_paginated_response(serializer.data)
 
 
 class CampaignCategoryViewSet(viewsets.ModelViewSet):
@@ -235,6 +405,24 @@ class CampaignCategoryViewSet(viewsets.ModelViewSet):
     permission_classes = (IsCoordinatorOrReadOnly,)
     lookup_field = "slug"
 
+    def list(self, request, *args, **kwargs):
+        return cached_public_response(
+            request,
+            collection_cache_key(CATEGORIES_NAMESPACE, request),
+            lambda: conditional_response(
+                request,
+                lambda: _collection_validators(request, "categories", self.filter_queryset(self.get_queryset())),
+                lambda: super(CampaignCategoryViewSet, self).list(request, *args, **kwargs),
+            ),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return cached_public_response(
+            request,
+            collection_cache_key(CATEGORIES_NAMESPACE, request),
+            lambda: super(CampaignCategoryViewSet, self).retrieve(request, *args, **kwargs),
+        )
+
 
 class CampaignStageViewSet(viewsets.ModelViewSet):
     queryset = CampaignStage.objects.select_related("campaign")
@@ -262,18 +450,9 @@ class CampaignShiftViewSet(viewsets.ModelViewSet):
     permission_classes = (IsCoordinatorOrReadOnly,)
 
     def get_queryset(self):
-        qs = (
-            super()
-            .get_queryset()
-            .annotate(
-                occupied_spots=Count(
-                    "assignments",
-                    filter=Q(assignments__status=ApplicationStatus.APPROVED),
-                    distinct=True,
-                ),
-            )
-            .prefetch_related("assignments")
-        )
+        return self._filter(super().get_queryset())
+
+    def _filter(self, qs):
         campaign = self.request.query_params.get("campaign")
         if campaign:
             qs = qs.filter(campaign__slug=campaign)
@@ -282,6 +461,16 @@ class CampaignShiftViewSet(viewsets.ModelViewSet):
             qs = qs.filter(start_at__gte=start_after)
         return qs
 
+    def list(self, request, *args, **kwargs):
+        # `updated_at` зміни зсувається і при записі/виході волонтерів, тож валідатор бачить зайнятість.
+        return conditional_response(
+            request,
+            lambda: _collection_validators(
+                request, "shifts", self._filter(CampaignShift.objects.all()), request.user.pk
+            ),
+            lambda: super(CampaignShiftViewSet, self).list(request, *args, **kwargs),
+        )
+
     def perform_create(self, serializer):
         campaign = serializer.validated_data["campaign"]
         user = self.request.user
@@ -289,6 +478,52 @@ class CampaignShiftViewSet(viewsets.ModelViewSet):
             raise PermissionDenied("Тільки координатор кампанії може створювати зміни.")
         serializer.save()
 
+    @decorators.action(detail=False, methods=["post"], url_path="bulk-generate")
+    def bulk_generate(self, request):
+        serializer = CampaignShiftRecurrenceSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        campaign = data["campaign"]
+        user = request.user
+        if campaign.coordinator_id != user.id and user.role not in {UserRole.ADMIN} and not user.is_staff:
+            raise PermissionDenied("Тільки координатор кампанії може створювати зміни.")
+
+        occurrences = data["occurrences"]
+        # Зміни, що вже починаються в той самий момент, не дублюємо — один запит на весь набір.
+        existing = set(
+            CampaignShift.objects.filter(
+                campaign=campaign, start_at__in=[start_at for start_at, _ in occurrences]
+            ).values_list("start_at", flat=True)
+        )
+        shifts = [
+            CampaignShift(
+                campaign=campaign,
+                title=data["title"],
+                description=data["description"],
+                location_details=data["location_details"],
+                instructions=data["instructions"],
+                capacity=data["capacity"],
+                start_at=start_at,
+                end_at=end_at,
+            )
+            for start_at, end_at in occurrences
+            if start_at not in existing
+        ]
+        with transaction.atomic():
+            CampaignShift.objects.bulk_create(shifts, batch_size=500)
+            # bulk_create минає сигнали: лічильник, `updated_at` і кеш кампанії оновлюємо вручну.
+            adjust_campaign_counters(campaign.pk, shifts_count=len(shifts))
+            invalidate_campaign_details(campaign.slug)
+        return response.Response(
+            {
+                "created": len(shifts),
+                "skipped_existing": len(occurrences) - len(shifts),
+                "first_start_at": shifts[0].start_at if shifts else None,
+                "last_start_at": shifts[-1].start_at if shifts else None,
+            },
+            status=status.HTTP_201_CREATED if shifts else status.HTTP_200_OK,
+        )
+
     @decorators.action(
         detail=True,
         methods=["post"],
@@ -320,18 +555,39 @@ class CampaignShiftViewSet(viewsets.ModelViewSet):
             serializer = ShiftAssignmentSerializer(existing, context={"request": request})
             return response.Response(serializer.data, status=status.HTTP_200_OK)
 
-        approved_count = shift.assignments.filter(status=ApplicationStatus.APPROVED).count()
-        if shift.capacity and approved_count >= shift.capacity:
+        # Перевірка перетину, захищений UPDATE лічильника місць та INSERT — одна коротка транзакція
+        # під блокуванням рядка волонтера, тож два паралельні записи на різні зміни не проскочать.
+        try:
+            with transaction.atomic():
+                check_shift_overlap(user.id, shift)
+                assignment = ShiftAssignment.objects.create(
+                    shift=shift,
+                    volunteer=user,
+                    status=ApplicationStatus.APPROVED,
+                )
+        except ShiftOverlapError as exc:
             return response.Response(
-                {"detail": "Усі місця на цю зміну заповнені."},
+                {
+                    "detail": "Ви вже записані на зміну, що перетинається з цією в часі.",
+                    "conflicting_shift_id": exc.assignment.shift_id,
+                },
                 status=status.HTTP_400_BAD_REQUEST,
             )
-
-        assignment = ShiftAssignment.objects.create(
-            shift=shift,
-            volunteer=user,
-            status=ApplicationStatus.APPROVED,
-        )
+        except ShiftFullError:
+            # Замість відмови (і повторних спроб) — місце в черзі; звільнене місце дістанеться першому.
+            entry, created = ShiftWaitlistEntry.objects.get_or_create(shift=shift, volunteer=user)
+            return response.Response(
+                {
+                    "detail": "Усі місця на цю зміну заповнені — вас додано до черги очікування.",
+                    "waitlist_position": waitlist_position(entry),
+                },
+                status=status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK,
+            )
+        except IntegrityError:
+            # Паралельний повторний запит того ж волонтера вже створив запис.
+            existing = shift.assignments.get(volunteer=user)
+            serializer = ShiftAssignmentSerializer(existing, context={"request": request})
+            return response.Response(serializer.data, status=status.HTTP_200_OK)
         serializer = ShiftAssignmentSerializer(assignment, context={"request": request})
         return response.Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -346,6 +602,10 @@ class CampaignShiftViewSet(viewsets.ModelViewSet):
         user = request.user
         assignment = shift.assignments.filter(volunteer=user).first()
         if not assignment:
+            # Вихід із черги очікування.
+            deleted, _ = shift.waitlist.filter(volunteer=user).delete()
+            if deleted:
+                return response.Response(status=status.HTTP_204_NO_CONTENT)
             return response.Response(
                 {"detail": "Ви не записані на цю зміну."},
                 status=status.HTTP_404_NOT_FOUND,
@@ -353,6 +613,22 @@ class CampaignShiftViewSet(viewsets.ModelViewSet):
         assignment.delete()
         return response.Response(status=status.HTTP_204_NO_CONTENT)
 
+    @decorators.action(
+        detail=True,
+        methods=["get"],
+        permission_classes=(permissions.IsAuthenticated,),
+        url_path="waitlist",
+    )
+    def waitlist(self, request, pk=None):
+        shift = self.get_object()
+        entry = shift.waitlist.filter(volunteer=request.user).first()
+        return response.Response(
+            {
+                "waitlist_position": waitlist_position(entry) if entry else None,
+                "waitlist_size": shift.waitlist.count(),
+            }
+        )
+
 
 class VolunteerApplicationViewSet(
     mixins.UpdateModelMixin,
@@ -361,6 +637,7 @@ class VolunteerApplicationViewSet(
 ):
     queryset = VolunteerApplication.objects.select_related("campaign", "volunteer", "campaign__coordinator")
     permission_classes = (permissions.IsAuthenticated,)
+    cursor_ordering = APPLICATIONS_CURSOR_ORDERING
 
     def get_serializer_class(self):
         if self.action == "update" or self.action == "partial_update":
@@ -401,6 +678,58 @@ class VolunteerApplicationViewSet(
 
         serializer.save()
 
+    @decorators.action(detail=False, methods=["post"], url_path="bulk-status")
+    def bulk_status(self, request):
+        """Масове підтвердження/відхилення: права перевіряються раз на кампанію, зміна — одним UPDATE."""
+        user = request.user
+        if user.role not in {UserRole.COORDINATOR, UserRole.ADMIN} and not user.is_staff:
+            raise PermissionDenied("Масово змінювати заявки може лише координатор.")
+        serializer = VolunteerApplicationBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        target = data["status"]
+
+        if "ids" in data:
+            requested = list(dict.fromkeys(data["ids"]))
+            candidates = VolunteerApplication.objects.filter(pk__in=requested)
+        else:
+            candidates = VolunteerApplication.objects.filter(campaign__slug=data["campaign"])
+            if "current_status" in data:
+                candidates = candidates.filter(status=data["current_status"])
+            candidates = candidates.order_by("pk")
+        rows = list(candidates.values_list("pk", "campaign_id", "status")[: serializer.LIMIT + 1])
+        if len(rows) > serializer.LIMIT:
+            raise ValidationError(f"Фільтр охоплює понад {serializer.LIMIT} заявок — звузьте його.")
+        if "ids" not in data:
+            requested = [pk for pk, _, _ in rows]
+
+        campaign_ids = {campaign_id for _, campaign_id, _ in rows}
+        if user.role == UserRole.ADMIN or user.is_staff:
+            allowed = campaign_ids
+        else:
+            allowed = set(
+                Campaign.objects.filter(pk__in=campaign_ids, coordinator=user).values_list("pk", flat=True)
+            )
+
+        found = {pk: (campaign_id, current) for pk, campaign_id, current in rows}
+        to_change = [
+            pk for pk, (campaign_id, current) in found.items() if campaign_id in allowed and current != target
+        ]
+        changed = set(bulk_set_application_status(to_change, target))
+
+        results = []
+        for pk in requested:
+            if pk not in found:
+                outcome = "not_found"
+            elif found[pk][0] not in allowed:
+                outcome = "forbidden"
+            elif pk in changed:
+                outcome = "updated"
+            else:
+                outcome = "unchanged"
+            results.append({"id": pk, "result": outcome})
+        return response.Response({"status": target, "updated": len(changed), "results": results})
+
 
 class ShiftAssignmentViewSet(
     mixins.CreateModelMixin,
@@ -427,7 +756,17 @@ class ShiftAssignmentViewSet(
         user = self.request.user
         if shift.campaign.coordinator_id != user.id and user.role not in {UserRole.ADMIN} and not user.is_staff:
             raise PermissionDenied("Тільки координатор кампанії може призначати волонтерів на зміну.")
-        serializer.save()
+        try:
+            with transaction.atomic():
+                if serializer.validated_data.get("status", ApplicationStatus.APPROVED) in ACTIVE_ASSIGNMENT_STATUSES:
+                    check_shift_overlap(serializer.validated_data["volunteer"].pk, shift)
+                serializer.save()
+        except ShiftOverlapError as exc:
+            raise ValidationError(
+                {"volunteer_id": f"Волонтер уже записаний на зміну #{exc.assignment.shift_id}, що перетинається в часі."}
+            )
+        except ShiftFullError:
+            raise ValidationError({"shift": "Усі місця на цю зміну заповнені."})
 
 
 class MyShiftAssignmentViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
@@ -0,0 +1,66 @@
+"""
+/**
+ * @file: conditional.py
+ * @description: Умовні GET для DRF: сильні ETag і Last-Modified з дешевих валідаторів та відповіді 304 без серіалізації.
+ * @dependencies: django.utils.cache, django.utils.http
+ * @created: 2026-10-17
+ */
+"""
+
+import hashlib
+from datetime import datetime
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+CONDITIONAL_HEADERS = ("HTTP_IF_NONE_MATCH", "HTTP_IF_MODIFIED_SINCE")
+
+
+def make_etag(*parts) -> str:
+    """Сильний ETag (у лапках) з довільних значень, що однозначно визначають представлення."""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return f'"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+
+
+def validator_headers(etag: str, last_modified: datetime | None) -> dict[str, str]:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified.timestamp())
+    return headers
+
+
+def not_modified(request, headers: dict[str, str]):
+    """Повертає 304 з тими ж валідаторами, якщо заголовки запиту з ними збігаються, інакше None."""
+    last_modified = headers.get("Last-Modified")
+    response = get_conditional_response(
+        getattr(request, "_request", request),
+        etag=headers.get("ETag"),
+        last_modified=parse_http_date_safe(last_modified) if last_modified else None,
+    )
+    if response is not None:
+        for name, value in headers.items():
+            response[name] = value
+    return response
+
+
+def conditional_response(request, validators, build):
+    """
+    `validators()` повертає (etag, last_modified) одним дешевим запитом або None, якщо об'єкта немає.
+    Валідатори рахуються лише для умовного запиту або свіжої відповіді 200; решта — без змін.
+    """
+    headers = None
+    if any(name in request.META for name in CONDITIONAL_HEADERS):
+        computed = validators()
+        if computed is not None:
+            headers = validator_headers(*computed)
+            response = not_modified(request, headers)
+            if response is not None:
+                return response
+    response = build()
+    if response.status_code == 200 and "ETag" not in response:
+        if headers is None:
+            computed = validators()
+            headers = validator_headers(*computed) if computed is not None else {}
+        for name, value in headers.items():
+            response[name] = value
+    return response
@@ -0,0 +1,157 @@
+"""
+/**
+ * @file: pagination.py
+ * @description: Пагінація API: сторінки за номером за замовчуванням та опційний keyset-курсор без COUNT і OFFSET.
+ * @dependencies: rest_framework.pagination, django.db.connections
+ * @created: 2026-10-17
+ */
+"""
+
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset-пагінація за набором полів упорядкування (останнє поле — унікальний `id`).
+    Курсор зберігає значення полів останнього запису, тож кожна сторінка —
+    це пошук по індексу від позиції курсора: однакова ціна для першої і тисячної сторінки.
+    NULL-и сортуються так, як їх природно сортує БД (і як лежать в індексі).
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Некоректний курсор пагінації."
+
+    def __init__(self, ordering, page_size=None):
+        self.ordering = tuple(ordering)
+        self.page_size = page_size or api_settings.PAGE_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.model = queryset.model
+        self.nulls_largest = connections[queryset.db].features.nulls_order_largest
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self._after(position))
+
+        page = list(queryset[: self.page_size + 1])
+        self.has_next = len(page) > self.page_size
+        self.page = page[: self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "previous": None, "results": data})
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        values = [self._encode_value(self.page[-1], name) for name, _ in self._fields()]
+        encoded = base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii")
+        url = self.request.build_absolute_uri()
+        return replace_query_param(remove_query_param(url, "page"), self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        raw = request.query_params.get(self.cursor_query_param)
+        if not raw:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(raw.encode("ascii")).decode("utf-8"))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                None if value is None else self._field(name).to_python(value)
+                for (name, _), value in zip(self._fields(), values)
+            ]
+        except (ValueError, TypeError, UnicodeError, binascii.Error, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _encode_value(self, obj, name):
+        field = self._field(name)
+        if getattr(obj, field.attname) is None:
+            return None
+        return field.value_to_string(obj)
+
+    def _fields(self):
+        return [(item.lstrip("-"), item.startswith("-")) for item in self.ordering]
+
+    def _field(self, name):
+        return self.model._meta.get_field(name)
+
+    def _nulls_first(self, descending: bool) -> bool:
+        return descending == self.nulls_largest
+
+    def _equal(self, name, value):
+        return Q(**{f"{name}__isnull": True}) if value is None else Q(**{name: value})
+
+    def _strictly_after(self, name, descending, value):
+        nulls_first = self._nulls_first(descending)
+        if value is None:
+            # Після NULL-ів ідуть лише непорожні значення, якщо NULL-и стоять на початку.
+            return Q(**{f"{name}__isnull": False}) if nulls_first else Q(pk__in=[])
+        condition = Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+        if not nulls_first and self._field(name).null:
+            condition |= Q(**{f"{name}__isnull": True})
+        return condition
+
+    def _after(self, position):
+        fields = self._fields()
+        condition = Q(pk__in=[])
+        prefix = Q()
+        for (name, descending), value in zip(fields, position):
+            condition |= prefix & self._strictly_after(name, descending, value)
+            prefix &= self._equal(name, value)
+        # Додаткова нестрога межа по першому полю дає планувальнику точку входу в індекс.
+        first_name, first_descending = fields[0]
+        first_value = position[0]
+        if first_value is not None:
+            bound = Q(**{f"{first_name}__{'lte' if first_descending else 'gte'}": first_value})
+            if not self._nulls_first(first_descending) and self._field(first_name).null:
+                bound |= Q(**{f"{first_name}__isnull": True})
+            condition &= bound
+        return condition
+
+
+class StandardPagination(PageNumberPagination):
+    """
+    Пагінація за замовчуванням. Клієнти, що передають `?pagination=cursor` (або `?cursor=`),
+    отримують keyset-сторінки без COUNT(*) — якщо ViewSet оголошує `cursor_ordering`.
+    """
+
+    mode_query_param = "pagination"
+    unsupported_ordering_message = "Курсор недоступний для пошуку за релевантністю чи відстанню — використовуйте ?page=."
+    # Дії з власним набором рядків (напр. заявки кампанії) задають порядок на екземплярі пагінатора.
+    cursor_ordering = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        ordering = self.cursor_ordering or getattr(view, "cursor_ordering", None)
+        wants_cursor = (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or KeysetPagination.cursor_query_param in request.query_params
+        )
+        if ordering and wants_cursor:
+            # Курсор ключується полями `ordering`; інший явний порядок (релевантність пошуку,
+            # відстань) він мовчки замінив би на хронологічний — такі запити відхиляємо.
+            active = tuple(queryset.query.order_by)
+            if active and active != tuple(ordering)[: len(active)]:
+                raise ValidationError({self.mode_query_param: [self.unsupported_ordering_message]})
+            self.keyset = KeysetPagination(ordering, page_size=self.get_page_size(request))
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
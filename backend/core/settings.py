@@ -111,6 +111,38 @@ else:
     }
 
 
+# Redis з docker-compose, якщо заданий REDIS_URL; інакше (локально, тести) — пам'ять процесу.
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'volunteer',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'volunteer',
+        }
+    }
+
+# Вебхуки платіжних провайдерів спершу потрапляють у таблицю-«вхідні» (payments.WebhookInboxEntry).
+# У docker-compose їх розбирає окремий воркер (`process_webhook_inbox --loop`); без нього —
+# локально й у тестах — запис обробляється одразу після вставки, тим самим кодом.
+WEBHOOK_INBOX_EAGER = os.getenv("WEBHOOK_INBOX_EAGER", "true").lower() in {"true", "1", "yes"}
+WEBHOOK_INBOX_BATCH_SIZE = int(os.getenv("WEBHOOK_INBOX_BATCH_SIZE", "100"))
+WEBHOOK_INBOX_MAX_ATTEMPTS = int(os.getenv("WEBHOOK_INBOX_MAX_ATTEMPTS", "5"))
+# Скільки секунд забраний воркером пакет недоступний іншим; після збою воркера записи повертаються в чергу.
+WEBHOOK_INBOX_LEASE_SECONDS = int(os.getenv("WEBHOOK_INBOX_LEASE_SECONDS", "300"))
+
+# Кількість слотів шардованого лічильника внесків на кампанію (campaigns.CampaignFundingShard).
+CAMPAIGN_FUNDING_SHARDS = int(os.getenv("CAMPAIGN_FUNDING_SHARDS", "8"))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -165,7 +197,7 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.StandardPagination',
     'PAGE_SIZE': 20,
 }
 
@@ -2,14 +2,14 @@
 /**
  * @file: admin.py
  * @description: Реєстрація моделей пожертв у Django admin.
- * @dependencies: payments.models.Donation
+ * @dependencies: payments.models.Donation, payments.models.WebhookInboxEntry
  * @created: 2025-11-08
  */
 """
 
 from django.contrib import admin
 
-from .models import Donation
+from .models import Donation, WebhookInboxEntry
 
 
 @admin.register(Donation)
@@ -27,3 +27,11 @@ class DonationAdmin(admin.ModelAdmin):
     list_filter = ("status", "provider", "currency", "campaign")
     search_fields = ("reference", "external_id", "donor__email", "campaign__title")
     readonly_fields = ("created_at", "updated_at", "confirmed_at", "payload")
+
+
+@admin.register(WebhookInboxEntry)
+class WebhookInboxEntryAdmin(admin.ModelAdmin):
+    list_display = ("id", "provider", "invoice_id", "event_status", "status", "attempts", "received_at", "processed_at")
+    list_filter = ("status", "provider")
+    search_fields = ("invoice_id",)
+    readonly_fields = ("received_at", "processed_at", "leased_until", "payload", "last_error")
@@ -0,0 +1,87 @@
+"""
+/**
+ * @file: funding.py
+ * @description: Звірка зібраних сум кампаній з успішними пожертвами: групований агрегат пачками і точкове виправлення.
+ * @dependencies: payments.models.Donation, campaigns.services.unfolded_funding
+ * @created: 2026-10-17
+ */
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.db.models import DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from campaigns.cache import invalidate_campaign_details_by_id, invalidate_campaign_lists
+from campaigns.models import Campaign
+from campaigns.services import unfolded_funding
+
+from .models import Donation, DonationStatus
+
+AMOUNT_FIELD = DecimalField(max_digits=14, decimal_places=2)
+
+
+@dataclass
+class FundingDrift:
+    campaign_id: int
+    recorded: Decimal
+    actual: Decimal
+
+
+def _succeeded_total():
+    donations = (
+        Donation.objects.filter(campaign=OuterRef("pk"), status=DonationStatus.SUCCEEDED)
+        .order_by()
+        .values("campaign")
+        .annotate(total=Sum("amount"))
+        .values("total")
+    )
+    return Coalesce(Subquery(donations), Value(Decimal("0")), output_field=AMOUNT_FIELD)
+
+
+def reconcile_campaign_funding(campaign_ids=None, batch_size: int = 1000, dry_run: bool = False) -> list[FundingDrift]:
+    """
+    Порівнює видиму суму кампаній (`current_amount` + шарди) із сумою успішних пожертв:
+    на пачку з `batch_size` кампаній — один групований агрегат по індексу Donation(campaign, status).
+    Розбіжні кампанії виправляє одним UPDATE з підзапитами, що перераховує обидві суми в тому ж
+    операторі, тож внесок, підтверджений під час звірки, не губиться. Повертає знайдені розбіжності.
+    """
+    campaigns = Campaign.objects.order_by("pk")
+    if campaign_ids is not None:
+        campaigns = campaigns.filter(pk__in=campaign_ids)
+
+    drifts = []
+    last_pk = 0
+    while True:
+        batch = list(
+            campaigns.filter(pk__gt=last_pk)
+            .annotate(unfolded=unfolded_funding())
+            .values_list("pk", "current_amount", "unfolded")[:batch_size]
+        )
+        if not batch:
+            return drifts
+        last_pk = batch[-1][0]
+        ids = [pk for pk, _, _ in batch]
+        actual = dict(
+            Donation.objects.filter(campaign_id__in=ids, status=DonationStatus.SUCCEEDED)
+            .order_by()
+            .values("campaign_id")
+            .annotate(total=Sum("amount"))
+            .values_list("campaign_id", "total")
+        )
+        drifted = []
+        for pk, current_amount, unfolded in batch:
+            recorded = current_amount + unfolded
+            total = actual.get(pk, Decimal("0"))
+            if recorded != total:
+                drifted.append(pk)
+                drifts.append(FundingDrift(pk, recorded, total))
+        if drifted and not dry_run:
+            Campaign.objects.filter(pk__in=drifted).update(
+                current_amount=_succeeded_total() - unfolded_funding(),
+                updated_at=timezone.now(),
+            )
+            invalidate_campaign_lists()
+            invalidate_campaign_details_by_id(*drifted)
@@ -0,0 +1,129 @@
+"""
+/**
+ * @file: inbox.py
+ * @description: Durable inbox вебхуків: ідемпотентна вставка, оренда пакета воркером, обробка по одному запису, метрики.
+ * @dependencies: payments.models.WebhookInboxEntry, payments.services.apply_monobank_status
+ * @created: 2026-10-17
+ */
+"""
+
+from dataclasses import asdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max, Min, Q
+from django.utils import timezone
+
+from .models import Donation, InboxStatus, WebhookInboxEntry
+from .services import MonobankWebhookData, apply_monobank_status
+
+
+def enqueue_webhook(provider: str, data: MonobankWebhookData) -> WebhookInboxEntry | None:
+    """
+    Одна вставка — все, що вебхук робить до відповіді провайдеру. Повтор події
+    (провайдер, рахунок, статус, час у провайдера) впирається в унікальний індекс
+    і повертає None, не торкаючись пожертви.
+    """
+    try:
+        with transaction.atomic():
+            entry = WebhookInboxEntry.objects.create(
+                provider=provider,
+                invoice_id=data.invoice_id,
+                event_status=data.status.lower(),
+                provider_timestamp=data.modified_date or "",
+                payload=asdict(data),
+            )
+    except IntegrityError:
+        return None
+    if settings.WEBHOOK_INBOX_EAGER:
+        # Без окремого воркера (локально, тести) — той самий шлях обробки одразу.
+        process_inbox_entries([entry])
+    return entry
+
+
+def claim_inbox_batch(batch_size: int | None = None) -> list[WebhookInboxEntry]:
+    """
+    Коротка транзакція: бере до `batch_size` найстаріших вільних записів з SKIP LOCKED і позначає
+    їх орендою `leased_until`. Після COMMIT блокувань немає — інші воркери беруть наступні записи,
+    а записи воркера, що впав, повертаються в чергу після закінчення оренди.
+    """
+    batch_size = batch_size or settings.WEBHOOK_INBOX_BATCH_SIZE
+    now = timezone.now()
+    with transaction.atomic():
+        entries = list(
+            WebhookInboxEntry.objects.select_for_update(skip_locked=True)
+            .filter(status=InboxStatus.PENDING)
+            .filter(Q(leased_until__isnull=True) | Q(leased_until__lte=now))
+            .order_by("id")[:batch_size]
+        )
+        if entries:
+            leased_until = now + timedelta(seconds=settings.WEBHOOK_INBOX_LEASE_SECONDS)
+            WebhookInboxEntry.objects.filter(pk__in=[entry.pk for entry in entries]).update(leased_until=leased_until)
+    return entries
+
+
+def process_inbox_batch(batch_size: int | None = None) -> int:
+    """Забирає пакет в оренду і обробляє його записи кожен у власній транзакції. Повертає розмір пакета."""
+    entries = claim_inbox_batch(batch_size)
+    if entries:
+        process_inbox_entries(entries)
+    return len(entries)
+
+
+def process_inbox_entries(entries: list[WebhookInboxEntry]) -> None:
+    invoice_ids = {entry.invoice_id for entry in entries if entry.invoice_id}
+    by_reference, by_external_id = {}, {}
+    # Пожертви для всього пакета — одним запитом (за референсом або зовнішнім ID).
+    for donation in Donation.objects.filter(Q(reference__in=invoice_ids) | Q(external_id__in=invoice_ids)):
+        by_reference[donation.reference] = donation
+        if donation.external_id:
+            by_external_id.setdefault(donation.external_id, donation)
+
+    for entry in entries:
+        donation = by_reference.get(entry.invoice_id) or by_external_id.get(entry.invoice_id)
+        _process_entry(entry, donation)
+
+
+def _process_entry(entry: WebhookInboxEntry, donation: Donation | None) -> None:
+    """
+    Пожертва і статус запису фіксуються однією короткою транзакцією на запис: блокування пожертви
+    та шардів внесків не тримаються до кінця пакета, а помилка одного запису не відкочує інші.
+    """
+    entry.attempts += 1
+    entry.leased_until = None
+    processed_at = timezone.now()
+    try:
+        if donation is None:
+            raise LookupError("Не знайдено пожертву для вхідного вебхука.")
+        with transaction.atomic():
+            apply_monobank_status(donation, MonobankWebhookData(**entry.payload))
+            WebhookInboxEntry.objects.filter(pk=entry.pk).update(
+                status=InboxStatus.PROCESSED,
+                attempts=entry.attempts,
+                processed_at=processed_at,
+                last_error="",
+                leased_until=None,
+            )
+    except Exception as exc:  # noqa: BLE001 — помилка одного запису не зупиняє пакет
+        entry.last_error = str(exc)
+        if entry.attempts >= settings.WEBHOOK_INBOX_MAX_ATTEMPTS:
+            entry.status = InboxStatus.FAILED
+        entry.save(update_fields=("status", "attempts", "last_error", "leased_until"))
+    else:
+        entry.status = InboxStatus.PROCESSED
+        entry.processed_at = processed_at
+        entry.last_error = ""
+
+
+def inbox_metrics() -> dict:
+    """Відставання черги для адмінів і моніторингу: розмір, вік найстарішого запису, відмови."""
+    summary = WebhookInboxEntry.objects.aggregate(
+        pending=Count("id", filter=Q(status=InboxStatus.PENDING)),
+        failed=Count("id", filter=Q(status=InboxStatus.FAILED)),
+        oldest_pending=Min("received_at", filter=Q(status=InboxStatus.PENDING)),
+        last_processed=Max("processed_at"),
+    )
+    oldest = summary["oldest_pending"]
+    summary["lag_seconds"] = round((timezone.now() - oldest).total_seconds(), 3) if oldest else 0.0
+    return summary
@@ -0,0 +1,29 @@
+"""
+/**
+ * @file: backfill_donation_rollups.py
+ * @description: Django management-команда для повного відновлення погодинних і денних підсумків пожертв.
+ * @dependencies: payments.rollups.backfill_donation_rollups
+ * @created: 2026-10-17
+ */
+"""
+
+from django.core.management.base import BaseCommand
+
+from payments.rollups import GRANULARITIES, backfill_donation_rollups
+
+
+class Command(BaseCommand):
+    help = "Перебудовує погодинні та денні підсумки пожертв із сирих записів (після розгортання або розбіжностей)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--granularity", choices=GRANULARITIES, action="append", dest="granularities")
+        parser.add_argument("--campaign", type=int, action="append", dest="campaign_ids")
+
+    def handle(self, *args, **options):
+        written = backfill_donation_rollups(
+            granularities=options["granularities"] or GRANULARITIES,
+            campaign_ids=options["campaign_ids"],
+        )
+        self.stdout.write(self.style.SUCCESS("✅ Підсумки пожертв перебудовано"))
+        for granularity, rows in written.items():
+            self.stdout.write(f"  • {granularity}: {rows} рядків")
@@ -0,0 +1,43 @@
+"""
+/**
+ * @file: process_webhook_inbox.py
+ * @description: Воркер вхідних вебхуків: розбирає чергу пакетами (SKIP LOCKED), у режиму --loop опитує її з інтервалом.
+ * @dependencies: payments.inbox.process_inbox_batch
+ * @created: 2026-10-17
+ */
+"""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from payments.inbox import inbox_metrics, process_inbox_batch
+
+
+class Command(BaseCommand):
+    help = "Обробляє вхідні вебхуки платіжних провайдерів пакетами; з --loop працює як постійний воркер"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=settings.WEBHOOK_INBOX_BATCH_SIZE)
+        parser.add_argument("--loop", action="store_true", help="Не завершуватись, опитувати чергу")
+        parser.add_argument("--interval", type=float, default=1.0, help="Пауза між опитуваннями порожньої черги, с")
+        parser.add_argument("--max-batches", type=int, default=None)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        batches = processed = 0
+        while options["max_batches"] is None or batches < options["max_batches"]:
+            taken = process_inbox_batch(batch_size)
+            batches += 1
+            processed += taken
+            if taken < batch_size:
+                # Черга вичерпана: без --loop завершуємо, інакше чекаємо нових записів.
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
+        metrics = inbox_metrics()
+        self.stdout.write(self.style.SUCCESS(f"✅ Оброблено записів: {processed}"))
+        self.stdout.write(f"  • у черзі: {metrics['pending']}, відставання: {metrics['lag_seconds']} с")
+        if metrics["failed"]:
+            self.stdout.write(self.style.WARNING(f"⚠ Не вдалося обробити: {metrics['failed']}"))
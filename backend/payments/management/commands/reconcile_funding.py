@@ -0,0 +1,43 @@
+"""
+/**
+ * @file: reconcile_funding.py
+ * @description: Django management-команда для звірки й виправлення зібраних сум кампаній з успішними пожертвами.
+ * @dependencies: payments.funding.reconcile_campaign_funding
+ * @created: 2026-10-17
+ */
+"""
+
+from django.core.management.base import BaseCommand
+
+from payments.funding import reconcile_campaign_funding
+
+REPORT_LIMIT = 20
+
+
+class Command(BaseCommand):
+    help = (
+        "Перераховує зібрані суми кампаній з успішних пожертв пачками й виправляє розбіжності "
+        "(повернення, ручні зміни статусу). Розрахований на запуск за розкладом (cron)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--campaign", type=int, action="append", dest="campaign_ids")
+        parser.add_argument("--dry-run", action="store_true", help="Лише показати розбіжності")
+
+    def handle(self, *args, **options):
+        drifts = reconcile_campaign_funding(
+            campaign_ids=options["campaign_ids"],
+            batch_size=options["batch_size"],
+            dry_run=options["dry_run"],
+        )
+        if not drifts:
+            self.stdout.write(self.style.SUCCESS("✅ Розбіжностей не знайдено"))
+            return
+        total = sum(drift.actual - drift.recorded for drift in drifts)
+        verb = "Знайдено" if options["dry_run"] else "Виправлено"
+        self.stdout.write(
+            self.style.WARNING(f"⚠ {verb} суми у {len(drifts)} кампаніях, сумарний зсув: {total}")
+        )
+        for drift in drifts[:REPORT_LIMIT]:
+            self.stdout.write(f"  • кампанія #{drift.campaign_id}: {drift.recorded} → {drift.actual}")
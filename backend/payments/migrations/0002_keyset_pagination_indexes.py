@@ -0,0 +1,22 @@
+# Generated by Django 5.1.2 on 2026-10-17 21:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0004_keyset_pagination_indexes"),
+        ("payments", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="donation",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="donation_keyset_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0002_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WebhookInboxEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "provider",
+                    models.CharField(
+                        choices=[
+                            ("monobank", "Monobank"),
+                            ("privatbank", "PrivatBank"),
+                            ("manual", "Ручний внесок"),
+                        ],
+                        max_length=20,
+                        verbose_name="Провайдер",
+                    ),
+                ),
+                (
+                    "invoice_id",
+                    models.CharField(
+                        blank=True, max_length=120, verbose_name="Ідентифікатор рахунку"
+                    ),
+                ),
+                (
+                    "payload",
+                    models.JSONField(default=dict, verbose_name="Дані вебхука"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Очікує обробки"),
+                            ("processed", "Оброблено"),
+                            ("failed", "Не вдалося обробити"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                        verbose_name="Статус",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="Спроби"),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, verbose_name="Остання помилка"),
+                ),
+                (
+                    "received_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Отримано"),
+                ),
+                (
+                    "processed_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Оброблено"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Вхідний вебхук",
+                "verbose_name_plural": "Вхідні вебхуки",
+                "ordering": ("id",),
+                "indexes": [
+                    models.Index(
+                        fields=["status", "id"], name="webhook_inbox_queue_idx"
+                    )
+                ],
+            },
+        ),
+    ]
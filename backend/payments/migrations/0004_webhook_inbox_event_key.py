@@ -0,0 +1,52 @@
+# Generated by Django 5.1.2 on 2026-10-17 23:10
+
+from django.db import migrations, models
+
+
+def backfill_event_key(apps, schema_editor):
+    WebhookInboxEntry = apps.get_model("payments", "WebhookInboxEntry")
+    seen = set()
+    duplicates = []
+    for entry in WebhookInboxEntry.objects.order_by("id").iterator():
+        entry.event_status = str(entry.payload.get("status", "")).lower()
+        entry.provider_timestamp = entry.payload.get("modified_date") or ""
+        key = (entry.provider, entry.invoice_id, entry.event_status, entry.provider_timestamp)
+        if key in seen:
+            duplicates.append(entry.pk)
+            continue
+        seen.add(key)
+        entry.save(update_fields=["event_status", "provider_timestamp"])
+    WebhookInboxEntry.objects.filter(pk__in=duplicates).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0003_webhook_inbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhookinboxentry",
+            name="event_status",
+            field=models.CharField(blank=True, max_length=40, verbose_name="Статус у провайдера"),
+        ),
+        migrations.AddField(
+            model_name="webhookinboxentry",
+            name="provider_timestamp",
+            field=models.CharField(
+                blank=True,
+                help_text="Значення як надіслав провайдер (modifiedDate); частина ключа ідемпотентності.",
+                max_length=40,
+                verbose_name="Час події у провайдера",
+            ),
+        ),
+        migrations.RunPython(backfill_event_key, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="webhookinboxentry",
+            constraint=models.UniqueConstraint(
+                fields=("provider", "invoice_id", "event_status", "provider_timestamp"),
+                name="webhook_inbox_event_uniq",
+            ),
+        ),
+    ]
@@ -0,0 +1,143 @@
+# Generated by Django 5.1.2 on 2026-10-17 23:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaigns", "0014_campaign_funding_shards"),
+        ("payments", "0004_webhook_inbox_event_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DonationDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "provider",
+                    models.CharField(
+                        choices=[
+                            ("monobank", "Monobank"),
+                            ("privatbank", "PrivatBank"),
+                            ("manual", "Ручний внесок"),
+                        ],
+                        max_length=20,
+                        verbose_name="Провайдер",
+                    ),
+                ),
+                ("bucket", models.DateTimeField(verbose_name="Початок періоду")),
+                (
+                    "donations_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Кількість пожертв"
+                    ),
+                ),
+                (
+                    "amount_total",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=14, verbose_name="Сума"
+                    ),
+                ),
+                (
+                    "unique_donors",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Унікальні донори"
+                    ),
+                ),
+                (
+                    "campaign",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="campaigns.campaign",
+                        verbose_name="Кампанія",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Денний підсумок пожертв",
+                "verbose_name_plural": "Денні підсумки пожертв",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("campaign", "bucket", "provider"),
+                        name="donation_daily_rollup_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="DonationHourlyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "provider",
+                    models.CharField(
+                        choices=[
+                            ("monobank", "Monobank"),
+                            ("privatbank", "PrivatBank"),
+                            ("manual", "Ручний внесок"),
+                        ],
+                        max_length=20,
+                        verbose_name="Провайдер",
+                    ),
+                ),
+                ("bucket", models.DateTimeField(verbose_name="Початок періоду")),
+                (
+                    "donations_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Кількість пожертв"
+                    ),
+                ),
+                (
+                    "amount_total",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=14, verbose_name="Сума"
+                    ),
+                ),
+                (
+                    "unique_donors",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Унікальні донори"
+                    ),
+                ),
+                (
+                    "campaign",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="campaigns.campaign",
+                        verbose_name="Кампанія",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Погодинний підсумок пожертв",
+                "verbose_name_plural": "Погодинні підсумки пожертв",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("campaign", "bucket", "provider"),
+                        name="donation_hourly_rollup_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
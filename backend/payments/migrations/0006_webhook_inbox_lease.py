@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0005_donation_rollups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhookinboxentry",
+            name="leased_until",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Воркер забрав запис в обробку; після цього часу (збій воркера) запис знову доступний.",
+                null=True,
+                verbose_name="Зайнято воркером до",
+            ),
+        ),
+    ]
@@ -2,7 +2,7 @@
 /**
  * @file: models.py
  * @description: Моделі для пожертв та інтеграції з платіжними провайдерами.
- * @dependencies: campaigns.models.Campaign, django.conf.settings.AUTH_USER_MODEL
+ * @dependencies: campaigns.models.Campaign, campaigns.services, django.conf.settings.AUTH_USER_MODEL
  * @created: 2025-11-08
  */
 """
@@ -13,11 +13,11 @@ from decimal import Decimal
 
 from django.conf import settings
 from django.db import models, transaction
-from django.db.models import F
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from campaigns.models import Campaign
+from campaigns.services import add_campaign_funding
 
 User = settings.AUTH_USER_MODEL
 
@@ -87,6 +87,7 @@ class Donation(models.Model):
         indexes = [
             models.Index(fields=("campaign", "status")),
             models.Index(fields=("provider", "external_id")),
+            models.Index(fields=("-created_at", "-id"), name="donation_keyset_idx"),
         ]
 
     def __str__(self) -> str:
@@ -107,17 +108,129 @@ class Donation(models.Model):
             self.payload = payload
         self.save(update_fields=["status", "confirmed_at", "payload", "updated_at"])
 
-        Campaign.objects.filter(id=self.campaign_id).update(
-            current_amount=F("current_amount") + self.amount
-        )
+        # Шардований лічильник: рядок кампанії не блокується на кожен внесок.
+        add_campaign_funding(self.campaign_id, self.amount)
+        from .rollups import record_donation_rollups  # rollups імпортує моделі цього модуля
+
+        record_donation_rollups(self)
         self.refresh_from_db(fields=["status", "confirmed_at", "payload", "updated_at"])
 
     def mark_failed(self, payload: dict | None = None):
         if payload is not None:
             self.payload = payload
-        self.status = DonationStatus.FAILED
-        self.save(update_fields=["status", "payload", "updated_at"])
+        self.set_status(DonationStatus.FAILED, extra_fields=("payload",))
+
+    @transaction.atomic
+    def set_status(self, status: str, extra_fields=()):
+        """Статус без підтвердження (збій, повернення, ручна зміна); вихід із SUCCEEDED знімає пожертву з підсумків."""
+        was_succeeded = self.status == DonationStatus.SUCCEEDED
+        self.status = status
+        self.save(update_fields=["status", *extra_fields, "updated_at"])
+        if was_succeeded and status != DonationStatus.SUCCEEDED:
+            from .rollups import record_donation_rollups
+
+            record_donation_rollups(self, sign=-1)
 
     @property
     def amount_uah(self) -> Decimal:
         return self.amount if self.currency == "UAH" else self.amount
+
+
+class DonationRollup(models.Model):
+    """
+    Попередньо агреговані успішні пожертви кампанії за провайдером і часовим кошиком.
+    Оновлюються інкрементно при підтвердженні/поверненні; відновлюються командою backfill_donation_rollups.
+    """
+
+    campaign = models.ForeignKey(
+        Campaign,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("Кампанія"),
+    )
+    provider = models.CharField(_("Провайдер"), max_length=20, choices=DonationProvider.choices)
+    bucket = models.DateTimeField(_("Початок періоду"))
+    donations_count = models.PositiveIntegerField(_("Кількість пожертв"), default=0)
+    amount_total = models.DecimalField(_("Сума"), max_digits=14, decimal_places=2, default=0)
+    unique_donors = models.PositiveIntegerField(_("Унікальні донори"), default=0)
+
+    class Meta:
+        abstract = True
+
+    def __str__(self) -> str:
+        return f"{self.campaign_id} · {self.provider} · {self.bucket:%Y-%m-%d %H:%M}"
+
+
+class DonationHourlyRollup(DonationRollup):
+    class Meta:
+        verbose_name = _("Погодинний підсумок пожертв")
+        verbose_name_plural = _("Погодинні підсумки пожертв")
+        constraints = [
+            # (campaign, bucket, …): той самий індекс обслуговує і запит графіка за діапазоном часу.
+            models.UniqueConstraint(fields=("campaign", "bucket", "provider"), name="donation_hourly_rollup_uniq"),
+        ]
+
+
+class DonationDailyRollup(DonationRollup):
+    class Meta:
+        verbose_name = _("Денний підсумок пожертв")
+        verbose_name_plural = _("Денні підсумки пожертв")
+        constraints = [
+            models.UniqueConstraint(fields=("campaign", "bucket", "provider"), name="donation_daily_rollup_uniq"),
+        ]
+
+
+class InboxStatus(models.TextChoices):
+    PENDING = "pending", _("Очікує обробки")
+    PROCESSED = "processed", _("Оброблено")
+    FAILED = "failed", _("Не вдалося обробити")
+
+
+class WebhookInboxEntry(models.Model):
+    """Перевірений вебхук провайдера, збережений до обробки воркером (durable inbox)."""
+
+    provider = models.CharField(_("Провайдер"), max_length=20, choices=DonationProvider.choices)
+    invoice_id = models.CharField(_("Ідентифікатор рахунку"), max_length=120, blank=True)
+    event_status = models.CharField(_("Статус у провайдера"), max_length=40, blank=True)
+    provider_timestamp = models.CharField(
+        _("Час події у провайдера"),
+        max_length=40,
+        blank=True,
+        help_text=_("Значення як надіслав провайдер (modifiedDate); частина ключа ідемпотентності."),
+    )
+    payload = models.JSONField(_("Дані вебхука"), default=dict)
+    status = models.CharField(
+        _("Статус"),
+        max_length=20,
+        choices=InboxStatus.choices,
+        default=InboxStatus.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(_("Спроби"), default=0)
+    last_error = models.TextField(_("Остання помилка"), blank=True)
+    received_at = models.DateTimeField(_("Отримано"), auto_now_add=True)
+    processed_at = models.DateTimeField(_("Оброблено"), null=True, blank=True)
+    leased_until = models.DateTimeField(
+        _("Зайнято воркером до"),
+        null=True,
+        blank=True,
+        help_text=_("Воркер забрав запис в обробку; після цього часу (збій воркера) запис знову доступний."),
+    )
+
+    class Meta:
+        verbose_name = _("Вхідний вебхук")
+        verbose_name_plural = _("Вхідні вебхуки")
+        ordering = ("id",)
+        indexes = [
+            # Воркер бере найстаріші необроблені записи: status = pending ORDER BY id.
+            models.Index(fields=("status", "id"), name="webhook_inbox_queue_idx"),
+        ]
+        constraints = [
+            # Повтор того самого переходу від провайдера відсікається на вставці.
+            models.UniqueConstraint(
+                fields=("provider", "invoice_id", "event_status", "provider_timestamp"),
+                name="webhook_inbox_event_uniq",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.provider} · {self.invoice_id} · {self.status}"
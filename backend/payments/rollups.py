@@ -0,0 +1,168 @@
+"""
+/**
+ * @file: rollups.py
+ * @description: Погодинні й денні підсумки успішних пожертв: інкрементне оновлення, повне відновлення й вибірка ряду.
+ * @dependencies: payments.models.DonationHourlyRollup, payments.models.DonationDailyRollup
+ * @created: 2026-10-17
+ */
+"""
+
+from datetime import timedelta, timezone as dt_timezone
+
+from django.db import IntegrityError, transaction
+from django.db.models import CharField, Count, F, Q, Sum, Value
+from django.db.models.functions import Cast, Coalesce, Concat, Lower, NullIf, TruncDay, TruncHour
+from django.utils import timezone
+
+from .models import Donation, DonationDailyRollup, DonationHourlyRollup, DonationStatus
+
+GRANULARITIES = ("hour", "day")
+ROLLUP_MODELS = {"hour": DonationHourlyRollup, "day": DonationDailyRollup}
+_TRUNCATE = {"hour": TruncHour, "day": TruncDay}
+BACKFILL_BATCH_SIZE = 1000
+
+
+def bucket_bounds(moment, granularity: str):
+    """Межі кошика в часовому поясі проєкту — так само, як їх рахує TruncHour/TruncDay у backfill."""
+    local = timezone.localtime(moment)
+    if granularity == "hour":
+        start = local.replace(minute=0, second=0, microsecond=0)
+        # Година — в UTC, щоб перехід на літній час не подвоював і не губив кошик.
+        return start, start.astimezone(dt_timezone.utc) + timedelta(hours=1)
+    start = local.replace(hour=0, minute=0, second=0, microsecond=0)
+    return start, timezone.make_aware((start + timedelta(days=1)).replace(tzinfo=None))
+
+
+def _same_donor(donation: Donation) -> Q | None:
+    # Той самий ключ донора, що й `_donor_key()` у backfill: акаунт, інакше email; анонім — щоразу новий.
+    if donation.donor_id:
+        return Q(donor_id=donation.donor_id)
+    if donation.payer_email:
+        return Q(donor__isnull=True, payer_email__iexact=donation.payer_email)
+    return None
+
+
+def _donor_key():
+    return Coalesce(
+        Concat(Value("u:"), Cast("donor_id", CharField())),
+        Concat(Value("e:"), NullIf(Lower("payer_email"), Value(""))),
+        Concat(Value("r:"), "reference"),
+        output_field=CharField(),
+    )
+
+
+def _bump(model, donation: Donation, bucket, sign: int, new_donor: bool) -> None:
+    deltas = {
+        "donations_count": F("donations_count") + sign,
+        "amount_total": F("amount_total") + sign * donation.amount,
+        "unique_donors": F("unique_donors") + (sign if new_donor else 0),
+    }
+    rows = model.objects.filter(campaign_id=donation.campaign_id, provider=donation.provider, bucket=bucket)
+    if rows.update(**deltas) or sign < 0:
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(
+                campaign_id=donation.campaign_id,
+                provider=donation.provider,
+                bucket=bucket,
+                donations_count=1,
+                amount_total=donation.amount,
+                unique_donors=1,
+            )
+    except IntegrityError:
+        # Кошик щойно створила паралельна пожертва.
+        rows.update(**deltas)
+
+
+def record_donation_rollups(donation: Donation, sign: int = 1) -> None:
+    """
+    Додає (`sign=1`, підтвердження) або віднімає (`sign=-1`, повернення) пожертву в погодинному
+    й денному кошиках за `confirmed_at`. Унікальний донор рахується, лише якщо в кошику немає
+    інших його успішних пожертв — один EXISTS по індексу (campaign, status).
+    """
+    if donation.confirmed_at is None:
+        return
+    same_donor = _same_donor(donation)
+    for granularity, model in ROLLUP_MODELS.items():
+        start, end = bucket_bounds(donation.confirmed_at, granularity)
+        new_donor = same_donor is None or not (
+            Donation.objects.filter(
+                same_donor,
+                campaign_id=donation.campaign_id,
+                provider=donation.provider,
+                status=DonationStatus.SUCCEEDED,
+                confirmed_at__gte=start,
+                confirmed_at__lt=end,
+            )
+            .exclude(pk=donation.pk)
+            .exists()
+        )
+        _bump(model, donation, start, sign, new_donor)
+
+
+def backfill_donation_rollups(granularities=GRANULARITIES, campaign_ids=None) -> dict[str, int]:
+    """
+    Перебудовує підсумки з сирих пожертв: групований агрегат на кошик, вставка пачками.
+    Для кожної гранулярності — одна транзакція, тож графік не бачить напівпорожньої таблиці.
+    """
+    donations = Donation.objects.filter(status=DonationStatus.SUCCEEDED, confirmed_at__isnull=False)
+    if campaign_ids is not None:
+        donations = donations.filter(campaign_id__in=campaign_ids)
+    written = {}
+    for granularity in granularities:
+        model = ROLLUP_MODELS[granularity]
+        grouped = (
+            donations.annotate(period=_TRUNCATE[granularity]("confirmed_at"))
+            .order_by()
+            .values("campaign_id", "provider", "period")
+            .annotate(
+                count=Count("id"),
+                total=Sum("amount"),
+                donors=Count(_donor_key(), distinct=True),
+            )
+        )
+        stale = model.objects.all()
+        if campaign_ids is not None:
+            stale = stale.filter(campaign_id__in=campaign_ids)
+        written[granularity] = 0
+        with transaction.atomic():
+            stale.delete()
+            batch = []
+            for row in grouped.iterator(chunk_size=BACKFILL_BATCH_SIZE):
+                batch.append(
+                    model(
+                        campaign_id=row["campaign_id"],
+                        provider=row["provider"],
+                        bucket=row["period"],
+                        donations_count=row["count"],
+                        amount_total=row["total"],
+                        unique_donors=row["donors"],
+                    )
+                )
+                if len(batch) >= BACKFILL_BATCH_SIZE:
+                    model.objects.bulk_create(batch)
+                    written[granularity] += len(batch)
+                    batch = []
+            model.objects.bulk_create(batch)
+            written[granularity] += len(batch)
+    return written
+
+
+def donation_series(campaign_id: int, granularity: str, start, end, provider: str | None = None):
+    """
+    Ряд для графіка: по рядку на кошик у [start, end), провайдери підсумовуються.
+    `unique_donors` — сума по провайдерах (донор, що платив двома способами, рахується двічі).
+    """
+    rows = ROLLUP_MODELS[granularity].objects.filter(campaign_id=campaign_id, bucket__gte=start, bucket__lt=end)
+    if provider:
+        rows = rows.filter(provider=provider)
+    return (
+        rows.values("bucket")
+        .annotate(
+            donations=Sum("donations_count"),
+            amount=Sum("amount_total"),
+            unique_donors=Sum("unique_donors"),
+        )
+        .order_by("bucket")
+    )
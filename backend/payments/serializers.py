@@ -7,7 +7,10 @@
  */
 """
 
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 from rest_framework import serializers
 
 from campaigns.models import Campaign
@@ -79,3 +82,43 @@ class DonationStatusUpdateSerializer(serializers.Serializer):
     status = serializers.ChoiceField(choices=DonationStatus.choices)
 
 
+class DonationExportFilterSerializer(serializers.Serializer):
+    """Параметри вивантаження пожертв (query string)."""
+
+    OUTPUTS = ("csv", "xlsx")
+
+    campaign = serializers.IntegerField(required=False, min_value=1)
+    status = serializers.ChoiceField(choices=DonationStatus.choices, required=False)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    output = serializers.ChoiceField(choices=OUTPUTS, default="csv")
+
+    def validate(self, attrs):
+        if "date_from" in attrs and "date_to" in attrs and attrs["date_from"] > attrs["date_to"]:
+            raise serializers.ValidationError({"date_to": "Кінець періоду раніше за початок."})
+        return attrs
+
+
+class DonationSeriesFilterSerializer(serializers.Serializer):
+    """Параметри часового ряду пожертв кампанії; період типово — останні 7 днів погодинно або 90 днів подобово."""
+
+    DEFAULT_SPAN = {"hour": 7, "day": 90}
+    MAX_SPAN = {"hour": 31, "day": 731}
+
+    campaign = serializers.IntegerField(min_value=1)
+    granularity = serializers.ChoiceField(choices=("hour", "day"), default="day")
+    provider = serializers.ChoiceField(choices=DonationProvider.choices, required=False)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        granularity = attrs["granularity"]
+        date_to = attrs.setdefault("date_to", timezone.localdate())
+        date_from = attrs.setdefault("date_from", date_to - timedelta(days=self.DEFAULT_SPAN[granularity] - 1))
+        if date_from > date_to:
+            raise serializers.ValidationError({"date_to": "Кінець періоду раніше за початок."})
+        if (date_to - date_from).days >= self.MAX_SPAN[granularity]:
+            raise serializers.ValidationError(
+                {"date_from": f"Період для гранулярності {granularity} — не більше {self.MAX_SPAN[granularity]} днів."}
+            )
+        return attrs
@@ -29,6 +29,7 @@ class MonobankWebhookData:
     currency: str
     customer_email: str | None = None
     customer_name: str | None = None
+    modified_date: str | None = None
 
     @classmethod
     def from_payload(cls, payload: dict):
@@ -40,6 +41,7 @@ class MonobankWebhookData:
             currency=data.get("ccy", "UAH"),
             customer_email=data.get("customerEmail"),
             customer_name=data.get("customerName"),
+            modified_date=data.get("modifiedDate"),
         )
 
 
@@ -79,6 +81,9 @@ def apply_monobank_status(donation: Donation, webhook_data: MonobankWebhookData)
         donation.mark_failed(payload={"monobank": webhook_data.__dict__})
         return DonationStatus.FAILED
     # іншi статуси ігноруємо (pending)
+    if donation.status != DonationStatus.PENDING:
+        # Проміжний статус не відкочує завершену пожертву і не переписує вже збережений.
+        return donation.status
     donation.payload = {"monobank": webhook_data.__dict__}
     donation.status = DonationStatus.PROCESSING
     donation.save(update_fields=["payload", "status", "updated_at"])
@@ -8,18 +8,36 @@
 """
 
 import base64
+import csv
 import hashlib
 import hmac
+from datetime import timedelta
+from io import BytesIO, StringIO
+from unittest import mock
+
+import openpyxl
 
 from django.conf import settings
+from django.core.management import call_command
 from django.test import override_settings
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase
 
 from accounts.models import User, UserRole
-from campaigns.models import Campaign, CampaignCategory, CampaignStatus
-from payments.models import Donation, DonationProvider, DonationStatus
+from campaigns.models import Campaign, CampaignCategory, CampaignFundingShard, CampaignStatus
+from payments.inbox import claim_inbox_batch, process_inbox_batch
+from payments.models import (
+    Donation,
+    DonationDailyRollup,
+    DonationHourlyRollup,
+    DonationProvider,
+    DonationStatus,
+    InboxStatus,
+    WebhookInboxEntry,
+)
 
 
 class DonationApiTests(APITestCase):
@@ -89,8 +107,6 @@ class DonationApiTests(APITestCase):
                 }
             },
         }
-        from rest_framework.renderers import JSONRenderer
-
         raw_body = JSONRenderer().render(payload)
         signature = base64.b64encode(hmac.new(b"secret123", raw_body, hashlib.sha256).digest()).decode("utf-8")
 
@@ -100,9 +116,302 @@ class DonationApiTests(APITestCase):
             format="json",
             HTTP_X_SIGNATURE=signature,
         )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["status"], InboxStatus.PROCESSED)
+        donation.refresh_from_db()
+        self.campaign.refresh_from_db()
+        self.assertEqual(donation.status, DonationStatus.SUCCEEDED)
+        self.assertEqual(self.campaign.funded_amount, donation.amount)
+
+    def _post_webhook(self, invoice_id, secret=b"secret123", event_status="success", modified_date=None):
+        data = {"invoiceId": invoice_id, "status": event_status, "amount": 100000, "ccy": "UAH"}
+        if modified_date:
+            data["modifiedDate"] = modified_date
+        payload = {"provider": DonationProvider.MONOBANK, "payload": {"data": data}}
+        raw_body = JSONRenderer().render(payload)
+        signature = base64.b64encode(hmac.new(secret, raw_body, hashlib.sha256).digest()).decode("utf-8")
+        return self.client.post(
+            reverse("payments:monobank-webhook"), payload, format="json", HTTP_X_SIGNATURE=signature
+        )
+
+    @override_settings(MONOBANK_WEBHOOK_SECRET="secret123")
+    def test_monobank_webhook_rejects_bad_signature(self):
+        response = self._post_webhook("invoice-1", secret=b"wrong")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(WebhookInboxEntry.objects.exists())
+
+    @override_settings(MONOBANK_WEBHOOK_SECRET="secret123", WEBHOOK_INBOX_EAGER=False, WEBHOOK_INBOX_MAX_ATTEMPTS=2)
+    def test_webhook_is_queued_and_processed_by_worker(self):
+        donation = Donation.objects.create(
+            campaign=self.campaign,
+            amount="1000.00",
+            currency="UAH",
+            provider=DonationProvider.MONOBANK,
+            reference="invoice-queued",
+            payer_email="donor@help.ua",
+        )
+        self.assertEqual(self._post_webhook(donation.reference).status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(self._post_webhook("invoice-unknown").status_code, status.HTTP_202_ACCEPTED)
+        donation.refresh_from_db()
+        self.assertEqual(donation.status, DonationStatus.PENDING)
+
+        admin = User.objects.create_superuser(email="root@help.ua", password="StrongPass123!")
+        self.client.force_authenticate(admin)
+        metrics = self.client.get(reverse("payments:webhook-inbox-metrics")).data
+        self.assertEqual(metrics["pending"], 2)
+        self.assertGreaterEqual(metrics["lag_seconds"], 0)
+
+        call_command("process_webhook_inbox", stdout=StringIO())
         donation.refresh_from_db()
         self.campaign.refresh_from_db()
         self.assertEqual(donation.status, DonationStatus.SUCCEEDED)
-        self.assertEqual(self.campaign.current_amount, donation.amount)
+        self.assertEqual(self.campaign.funded_amount, donation.amount)
+        unknown = WebhookInboxEntry.objects.get(invoice_id="invoice-unknown")
+        self.assertEqual((unknown.status, unknown.attempts), (InboxStatus.PENDING, 1))
+
+        # Запис без пожертви повторюється, доки не вичерпає спроби.
+        call_command("process_webhook_inbox", stdout=StringIO())
+        unknown.refresh_from_db()
+        self.assertEqual(unknown.status, InboxStatus.FAILED)
+        self.assertTrue(unknown.last_error)
+        metrics = self.client.get(reverse("payments:webhook-inbox-metrics")).data
+        self.assertEqual((metrics["pending"], metrics["failed"]), (0, 1))
+
+    @override_settings(MONOBANK_WEBHOOK_SECRET="secret123", WEBHOOK_INBOX_EAGER=False)
+    def test_worker_leases_batch_and_commits_each_entry(self):
+        donations = Donation.objects.bulk_create(
+            Donation(campaign=self.campaign, amount="100.00", reference=f"lease-{index}") for index in range(2)
+        )
+        for donation in donations:
+            self._post_webhook(donation.reference)
+
+        # Оренда фіксується окремою короткою транзакцією — записи не чекають на обробку пакета.
+        claimed = claim_inbox_batch()
+        self.assertEqual(len(claimed), 2)
+        self.assertEqual(claim_inbox_batch(), [])
+        self.assertEqual(process_inbox_batch(), 0)
+
+        # Воркер «упав»: після закінчення оренди записи знову доступні.
+        WebhookInboxEntry.objects.update(leased_until=timezone.now() - timedelta(seconds=1))
+        with mock.patch("payments.inbox.apply_monobank_status", side_effect=[RuntimeError("збій"), None]):
+            self.assertEqual(process_inbox_batch(), 2)
+        first, second = WebhookInboxEntry.objects.order_by("id")
+        # Помилка першого запису не відкотила другий.
+        self.assertEqual((first.status, first.last_error, first.leased_until), (InboxStatus.PENDING, "збій", None))
+        self.assertEqual((second.status, second.leased_until), (InboxStatus.PROCESSED, None))
+        self.assertIsNotNone(second.processed_at)
+
+    @override_settings(MONOBANK_WEBHOOK_SECRET="secret123")
+    def test_repeated_webhook_event_is_ignored(self):
+        donation = Donation.objects.create(
+            campaign=self.campaign,
+            amount="1000.00",
+            currency="UAH",
+            provider=DonationProvider.MONOBANK,
+            reference="invoice-retry",
+            payer_email="donor@help.ua",
+        )
+        first = self._post_webhook(
+            donation.reference, event_status="processing", modified_date="2026-10-17T10:00:00Z"
+        )
+        self.assertEqual(first.status_code, status.HTTP_202_ACCEPTED)
+        donation.refresh_from_db()
+        self.assertEqual(donation.status, DonationStatus.PROCESSING)
+        updated_at = donation.updated_at
+
+        # Лише відхилена унікальним індексом вставка (у savepoint) — жодного запиту до пожертви.
+        with self.assertNumQueries(4):
+            retry = self._post_webhook(
+                donation.reference, event_status="processing", modified_date="2026-10-17T10:00:00Z"
+            )
+        self.assertEqual(retry.status_code, status.HTTP_200_OK)
+        self.assertEqual(retry.data["status"], "duplicate")
+        donation.refresh_from_db()
+        self.assertEqual(donation.updated_at, updated_at)
+
+        # Новий перехід того самого рахунку — окрема подія.
+        self._post_webhook(donation.reference, event_status="success", modified_date="2026-10-17T10:01:00Z")
+        donation.refresh_from_db()
+        self.assertEqual(donation.status, DonationStatus.SUCCEEDED)
+        self.assertEqual(WebhookInboxEntry.objects.filter(invoice_id=donation.reference).count(), 2)
+
+    def test_successful_donations_accumulate_in_funding_shards(self):
+        donations = Donation.objects.bulk_create(
+            Donation(campaign=self.campaign, amount="100.00", reference=f"shard-{index}") for index in range(5)
+        )
+        for donation in donations:
+            donation.mark_succeeded()
+        self.campaign.refresh_from_db()
+        # Рядок кампанії не оновлюється на кожен внесок — сума лежить у шардах.
+        self.assertEqual(self.campaign.current_amount, 0)
+        self.assertEqual(self.campaign.funded_amount, 500)
+        self.assertLessEqual(
+            CampaignFundingShard.objects.filter(campaign=self.campaign).count(), settings.CAMPAIGN_FUNDING_SHARDS
+        )
+
+        call_command("fold_campaign_funding", stdout=StringIO())
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.current_amount, 500)
+        self.assertEqual(self.campaign.funded_amount, 500)
+        self.assertFalse(CampaignFundingShard.objects.filter(campaign=self.campaign).exclude(amount=0).exists())
+
+    def test_reconcile_funding_repairs_drift_after_refund(self):
+        kept, refunded = Donation.objects.bulk_create(
+            Donation(campaign=self.campaign, amount=amount, reference=f"refund-{amount}") for amount in (100, 40)
+        )
+        kept.mark_succeeded()
+        refunded.mark_succeeded()
+        call_command("fold_campaign_funding", stdout=StringIO())
+        refunded.status = DonationStatus.REFUNDED
+        refunded.save(update_fields=["status", "updated_at"])
+        Donation.objects.create(campaign=self.campaign, amount=5, reference="late").mark_succeeded()
+
+        dry = StringIO()
+        call_command("reconcile_funding", "--dry-run", stdout=dry)
+        self.assertIn("145.00 → 105", dry.getvalue())
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.funded_amount, 145)
+
+        out = StringIO()
+        call_command("reconcile_funding", "--batch-size", "1", stdout=out)
+        self.assertIn("Виправлено суми у 1 кампаніях", out.getvalue())
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.funded_amount, 105)
+        call_command("reconcile_funding", stdout=out)
+        self.assertIn("Розбіжностей не знайдено", out.getvalue())
+
+    def test_coordinator_exports_donations_as_streamed_csv(self):
+        other = Campaign.objects.create(
+            title="Чужа кампанія",
+            short_description="Опис.",
+            description="Опис.",
+            status=CampaignStatus.PUBLISHED,
+            category=self.category,
+            coordinator=User.objects.create_user(email="other@help.ua", password="StrongPass123!"),
+            location_name="Львів",
+        )
+        Donation.objects.bulk_create(
+            [
+                Donation(campaign=self.campaign, amount=100, reference="exp-1", status=DonationStatus.SUCCEEDED),
+                Donation(campaign=self.campaign, amount=50, reference="exp-2", payer_name="Олена Коваль"),
+                Donation(campaign=other, amount=10, reference="exp-3", status=DonationStatus.SUCCEEDED),
+            ]
+        )
+        url = reverse("payments:donations-export")
+
+        self.client.force_authenticate(self.volunteer)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(self.coordinator)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment;", response["Content-Disposition"])
+        rows = list(csv.reader(b"".join(response.streaming_content).decode("utf-8-sig").splitlines()))
+        self.assertEqual(rows[0][0], "Референс")
+        self.assertEqual([row[0] for row in rows[1:]], ["exp-1", "exp-2"])
+        self.assertIn("Олена Коваль", rows[2])
+
+        filtered = self.client.get(url, {"status": DonationStatus.SUCCEEDED, "date_from": "2000-01-01"})
+        self.assertEqual(len(b"".join(filtered.streaming_content).decode("utf-8-sig").splitlines()), 2)
+        empty = self.client.get(url, {"date_to": "2000-01-01"})
+        self.assertEqual(len(b"".join(empty.streaming_content).decode("utf-8-sig").splitlines()), 1)
+        invalid = self.client.get(url, {"date_from": "2026-02-01", "date_to": "2026-01-01"})
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_escapes_spreadsheet_formulas(self):
+        Donation.objects.bulk_create(
+            [
+                Donation(
+                    campaign=self.campaign,
+                    amount=10,
+                    reference="formula",
+                    payer_name='=HYPERLINK("http://evil.example","x")',
+                    payer_email="+cmd@help.ua",
+                    note="@SUM(A1)",
+                ),
+                Donation(campaign=self.campaign, amount=20, reference="plain", payer_name="Олена"),
+            ]
+        )
+        url = reverse("payments:donations-export")
+        self.client.force_authenticate(self.coordinator)
+
+        csv_response = self.client.get(url)
+        rows = list(csv.reader(b"".join(csv_response.streaming_content).decode("utf-8-sig").splitlines()))
+        formula = next(row for row in rows if row[0] == "formula")
+        self.assertIn('\'=HYPERLINK("http://evil.example","x")', formula)
+        self.assertIn("'+cmd@help.ua", formula)
+        self.assertIn("'@SUM(A1)", formula)
+        self.assertIn("Олена", next(row for row in rows if row[0] == "plain"))
+
+        xlsx_response = self.client.get(url, {"output": "xlsx"})
+        self.assertEqual(xlsx_response.status_code, status.HTTP_200_OK)
+        sheet = openpyxl.load_workbook(BytesIO(b"".join(xlsx_response.streaming_content))).active
+        cells = {cell.value for row in sheet.iter_rows() for cell in row}
+        self.assertIn('\'=HYPERLINK("http://evil.example","x")', cells)
+        self.assertIn("'@SUM(A1)", cells)
+        self.assertNotIn("@SUM(A1)", cells)
+
+    def test_xlsx_export_rejects_selections_over_row_limit(self):
+        Donation.objects.bulk_create(
+            [Donation(campaign=self.campaign, amount=10, reference=f"limit-{index}") for index in range(3)]
+        )
+        url = reverse("payments:donations-export")
+        self.client.force_authenticate(self.coordinator)
 
+        with mock.patch("payments.views.XLSX_MAX_ROWS", 2):
+            response = self.client.get(url, {"output": "xlsx"})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("csv", str(response.data["output"]))
+            # CSV потоковий і не обмежений.
+            self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+            narrowed = self.client.get(url, {"output": "xlsx", "date_to": "2000-01-01"})
+            self.assertEqual(narrowed.status_code, status.HTTP_200_OK)
+
+    def test_donation_series_reads_incremental_rollups(self):
+        donations = Donation.objects.bulk_create(
+            [
+                Donation(campaign=self.campaign, donor=self.volunteer, amount=100, reference="roll-1"),
+                Donation(campaign=self.campaign, donor=self.volunteer, amount=50, reference="roll-2"),
+                Donation(campaign=self.campaign, payer_email="Guest@help.ua", amount=30, reference="roll-3"),
+                Donation(campaign=self.campaign, payer_email="guest@help.ua", amount=20, reference="roll-4"),
+            ]
+        )
+        for donation in donations:
+            donation.mark_succeeded()
+        url = reverse("payments:donations-series")
+
+        hourly = self.client.get(url, {"campaign": self.campaign.pk, "granularity": "hour"})
+        self.assertEqual(hourly.status_code, status.HTTP_200_OK)
+        (bucket,) = hourly.data["results"]
+        self.assertEqual((bucket["donations"], float(bucket["amount"]), bucket["unique_donors"]), (4, 200, 2))
+
+        admin = User.objects.create_superuser(email="root@help.ua", password="StrongPass123!")
+        self.client.force_authenticate(admin)
+        refund_url = reverse("payments:donations-status", kwargs={"reference": "roll-3"})
+        self.client.patch(refund_url, {"status": DonationStatus.REFUNDED}, format="json")
+        self.client.patch(
+            reverse("payments:donations-status", kwargs={"reference": "roll-4"}),
+            {"status": DonationStatus.REFUNDED},
+            format="json",
+        )
+        (day,) = self.client.get(url, {"campaign": self.campaign.pk}).data["results"]
+        self.assertEqual((day["donations"], float(day["amount"]), day["unique_donors"]), (2, 150, 1))
+
+        incremental = {
+            model: sorted(model.objects.values_list("bucket", "donations_count", "amount_total", "unique_donors"))
+            for model in (DonationHourlyRollup, DonationDailyRollup)
+        }
+        call_command("backfill_donation_rollups", stdout=StringIO())
+        for model, rows in incremental.items():
+            rebuilt = sorted(model.objects.values_list("bucket", "donations_count", "amount_total", "unique_donors"))
+            self.assertEqual(rebuilt, rows)
+
+        self.client.force_authenticate(None)
+        self.campaign.status = CampaignStatus.DRAFT
+        self.campaign.save(update_fields=["status"])
+        self.assertEqual(self.client.get(url, {"campaign": self.campaign.pk}).status_code, status.HTTP_404_NOT_FOUND)
+        too_long = self.client.get(
+            url, {"campaign": self.campaign.pk, "granularity": "hour", "date_from": "2020-01-01"}
+        )
+        self.assertEqual(too_long.status_code, status.HTTP_400_BAD_REQUEST)
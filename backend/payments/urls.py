@@ -10,7 +10,7 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from .views import DonationViewSet, MonobankWebhookView
+from .views import DonationViewSet, MonobankWebhookView, WebhookInboxMetricsView
 
 app_name = "payments"
 
@@ -19,6 +19,7 @@ router.register(r"donations", DonationViewSet, basename="donations")
 
 urlpatterns = [
     path("webhooks/monobank/", MonobankWebhookView.as_view(), name="monobank-webhook"),
+    path("webhooks/inbox/metrics/", WebhookInboxMetricsView.as_view(), name="webhook-inbox-metrics"),
 ]
 
 urlpatterns += router.urls
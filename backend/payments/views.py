@@ -8,22 +8,54 @@
 """
 
 import json
+from datetime import datetime, time, timedelta
 
 from django.conf import settings
+from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework import mixins, permissions, response, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from rest_framework.views import APIView
 
+from accounts.models import UserRole
+from campaigns.models import Campaign, CampaignStatus
+from core.streaming import STREAM_CHUNK_SIZE, XLSX_MAX_ROWS, streaming_csv_response, xlsx_response
+
+from .inbox import enqueue_webhook, inbox_metrics
+from .rollups import donation_series
 from .models import Donation, DonationProvider, DonationStatus
 from .serializers import (
+    DonationExportFilterSerializer,
     DonationSerializer,
+    DonationSeriesFilterSerializer,
     DonationStatusUpdateSerializer,
     DonationWebhookSerializer,
 )
-from .services import MonobankWebhookValidator, apply_monobank_status
+from .services import MonobankWebhookValidator, SignatureValidationError
+
+
+# Колонки вивантаження: поле для values_list і заголовок.
+DONATION_EXPORT_COLUMNS = (
+    ("reference", "Референс"),
+    ("created_at", "Створено"),
+    ("confirmed_at", "Підтверджено"),
+    ("campaign_id", "ID кампанії"),
+    ("campaign__title", "Кампанія"),
+    ("amount", "Сума"),
+    ("currency", "Валюта"),
+    ("status", "Статус"),
+    ("provider", "Провайдер"),
+    ("external_id", "Зовнішній ID"),
+    ("payer_name", "Платник"),
+    ("payer_email", "Email платника"),
+    ("note", "Коментар"),
+)
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
 
 
 class DonationViewSet(
@@ -36,6 +68,7 @@ class DonationViewSet(
     serializer_class = DonationSerializer
     permission_classes = (permissions.AllowAny,)
     lookup_field = "reference"
+    cursor_ordering = ("-created_at", "-id")
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -53,6 +86,82 @@ class DonationViewSet(
             raise PermissionDenied("Неавторизований донор має вказати email.")
         serializer.save()
 
+    @action(detail=False, methods=["get"], permission_classes=(permissions.IsAuthenticated,))
+    def export(self, request):
+        """
+        Повне вивантаження пожертв у CSV (або XLSX) для звітності. Рядки читаються кортежами через
+        `iterator()` (серверний курсор на PostgreSQL) і пишуться у відповідь по одному, без COUNT і сторінок.
+        XLSX будується до першого байта відповіді, тож обмежений `XLSX_MAX_ROWS` рядками: більша вибірка
+        отримує 400 з порадою взяти CSV, а не обрив за тайм-аутом.
+        """
+        user = request.user
+        if not (user.is_staff or user.role in {UserRole.ADMIN, UserRole.COORDINATOR}):
+            raise PermissionDenied("Вивантаження доступне координаторам і адміністраторам.")
+        params = DonationExportFilterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
+
+        qs = self.get_queryset()
+        if "campaign" in filters:
+            qs = qs.filter(campaign_id=filters["campaign"])
+        if "status" in filters:
+            qs = qs.filter(status=filters["status"])
+        # Межі періоду — діапазон по created_at, а не created_at__date: так працює індекс.
+        if "date_from" in filters:
+            qs = qs.filter(created_at__gte=_day_start(filters["date_from"]))
+        if "date_to" in filters:
+            qs = qs.filter(created_at__lt=_day_start(filters["date_to"] + timedelta(days=1)))
+
+        # Обмежений COUNT (LIMIT n + 1): не рахує весь архів, лише перевіряє, чи вибірка вміщується в XLSX.
+        if filters["output"] == "xlsx" and qs.order_by()[: XLSX_MAX_ROWS + 1].count() > XLSX_MAX_ROWS:
+            raise ValidationError(
+                {
+                    "output": f"XLSX обмежений {XLSX_MAX_ROWS} рядками — оберіть output=csv "
+                    "або звузьте період чи фільтри."
+                }
+            )
+
+        fields, header = zip(*DONATION_EXPORT_COLUMNS)
+        rows = qs.order_by("created_at", "id").values_list(*fields).iterator(chunk_size=STREAM_CHUNK_SIZE)
+        filename = f"donations-{timezone.localdate():%Y%m%d}.{filters['output']}"
+        if filters["output"] == "xlsx":
+            return xlsx_response(header, rows, filename)
+        return streaming_csv_response(header, rows, filename)
+
+    @action(detail=False, methods=["get"], permission_classes=(permissions.AllowAny,))
+    def series(self, request):
+        """
+        Часовий ряд внесків кампанії для графіка: читає попередньо агреговані погодинні/денні
+        кошики (сотні рядків), а не сирі пожертви.
+        """
+        params = DonationSeriesFilterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
+        campaign = Campaign.objects.filter(pk=filters["campaign"]).values("status", "coordinator_id").first()
+        user = request.user
+        privileged = user.is_authenticated and (
+            user.is_staff or user.role == UserRole.ADMIN or user.pk == (campaign or {}).get("coordinator_id")
+        )
+        if campaign is None or (campaign["status"] == CampaignStatus.DRAFT and not privileged):
+            raise NotFound("Кампанію не знайдено.")
+
+        rows = donation_series(
+            filters["campaign"],
+            filters["granularity"],
+            _day_start(filters["date_from"]),
+            _day_start(filters["date_to"] + timedelta(days=1)),
+            provider=filters.get("provider"),
+        )
+        return response.Response(
+            {
+                "campaign": filters["campaign"],
+                "granularity": filters["granularity"],
+                "date_from": filters["date_from"],
+                "date_to": filters["date_to"],
+                "results": list(rows),
+            }
+        )
+
     @action(
         detail=True,
         methods=["patch"],
@@ -62,11 +171,11 @@ class DonationViewSet(
         donation = self.get_object()
         serializer = DonationStatusUpdateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        donation.status = serializer.validated_data["status"]
-        if donation.status == DonationStatus.SUCCEEDED:
+        new_status = serializer.validated_data["status"]
+        if new_status == DonationStatus.SUCCEEDED:
             donation.mark_succeeded(payload=donation.payload)
         else:
-            donation.save(update_fields=["status", "updated_at"])
+            donation.set_status(new_status)
         return response.Response(DonationSerializer(donation).data)
 
 
@@ -95,14 +204,25 @@ class MonobankWebhookView(APIView):
             return response.Response({"detail": "Провайдер не підтримується цим вебхуком."}, status=status.HTTP_400_BAD_REQUEST)
 
         validator = MonobankWebhookValidator(getattr(settings, "MONOBANK_WEBHOOK_SECRET", None))
-        data = validator.process_payload(payload, raw_body, signature)
-
         try:
-            donation = Donation.objects.get(reference=data.invoice_id)
-        except Donation.DoesNotExist:
-            donation = Donation.objects.filter(external_id=data.invoice_id).first()
-            if not donation:
-                raise NotFound("Не знайдено пожертву для вхідного вебхука.")
-
-        new_status = apply_monobank_status(donation, data)
-        return response.Response({"status": new_status, "reference": donation.reference})
+            data = validator.process_payload(payload, raw_body, signature)
+        except SignatureValidationError as exc:
+            return response.Response({"detail": str(exc)}, status=status.HTTP_403_FORBIDDEN)
+
+        # Підтверджуємо отримання одразу після вставки у вхідні; статус пожертви оновить воркер.
+        entry = enqueue_webhook(provider, data)
+        if entry is None:
+            return response.Response({"status": "duplicate", "reference": data.invoice_id})
+        return response.Response(
+            {"id": entry.pk, "status": entry.status, "reference": data.invoice_id},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class WebhookInboxMetricsView(APIView):
+    """Розмір і відставання черги вхідних вебхуків."""
+
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request, *args, **kwargs):
+        return response.Response(inbox_metrics())